@@ -0,0 +1,216 @@
+"""
+Persistent on-disk cache for HTTP responses
+
+The cache is opt-in, assign a ResponseCache to TickerBase.response_cache
+(or to a single ticker) to serve repeated requests from disk. Freshness is
+decided per data source with the CACHE_TTL values in stockdex.config.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from stockdex.json_decoder import decode_response
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "stockdex", "responses.sqlite"
+)
+
+# Query parameters that change between sessions without changing the content
+_VOLATILE_PARAMS = {"crumb"}
+
+
+def normalize_url(url: str, params: Union[dict, None] = None) -> str:
+    """
+    Build a cache key from a URL and its query parameters
+
+    The scheme and host are lowercased, the fragment is dropped and the query
+    parameters (including the ones in params) are sorted, so that equivalent
+    requests share one key.
+
+    Args:
+    ----------
+    url: str
+        The URL of the request
+    params: dict
+        Extra query parameters sent with the request
+
+    Returns:
+    ----------
+    str: The normalized URL
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += list((params or {}).items())
+    query = sorted((k, str(v)) for k, v in query if k not in _VOLATILE_PARAMS)
+
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path or "/",
+            urlencode(query),
+            "",
+        )
+    )
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for a curl_cffi response, served from the cache
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: Union[dict, None] = None,
+        created_at: Union[float, None] = None,
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.created_at = time.time() if created_at is None else created_at
+        self.from_cache = True
+
+    @property
+    def encoding(self) -> str:
+        content_type = self.headers.get("content-type", "")
+        if "charset=" in content_type:
+            return content_type.split("charset=")[-1].split(";")[0].strip()
+        return "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return decode_response(self)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Return True if the entry is younger than ttl seconds
+        """
+        return time.time() - self.created_at < ttl
+
+
+class ResponseCache:
+    """
+    SQLite backed response cache that is safe to share between threads
+
+    Args:
+    ----------
+    path: str
+        The path of the SQLite database, created if it does not exist.
+        Use ":memory:" for a cache that lives only as long as the process
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH) -> None:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, key: str) -> Union[CachedResponse, None]:
+        """
+        Return the cached response stored under key, fresh or not,
+        or None if there is none
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, created_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        url, status_code, headers, content, created_at = row
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            content=bytes(content),
+            headers=json.loads(headers),
+            created_at=created_at,
+        )
+
+    def set(self, key: str, response) -> CachedResponse:
+        """
+        Store a response under key and return it as a CachedResponse
+        """
+        headers = {k.lower(): v for k, v in dict(response.headers).items()}
+        cached = CachedResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=response.content,
+            headers=headers,
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, content, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    cached.url,
+                    cached.status_code,
+                    json.dumps(headers),
+                    cached.content,
+                    cached.created_at,
+                ),
+            )
+
+        return cached
+
+    def touch(self, key: str, cached: CachedResponse) -> None:
+        """
+        Mark the response stored under key as fresh again, e.g. after the
+        server confirmed with 304 Not Modified that it did not change
+        """
+        cached.created_at = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET created_at = ? WHERE key = ?",
+                (cached.created_at, key),
+            )
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the response stored under key
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """
+        Remove every stored response
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
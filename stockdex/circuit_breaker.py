@@ -0,0 +1,189 @@
+"""
+Per-host circuit breakers that make requests to a failing host fail fast
+
+Every data source gets its own breaker on every host, so that errors of one
+source do not open the circuit of other sources served from the same host.
+After failure_threshold consecutive failed attempts against a host its
+breaker opens and requests raise CircuitOpenError without being sent. Once
+open_interval seconds passed, a single probe request is let through
+("half-open"): if it succeeds the breaker closes, otherwise it opens again.
+Thresholds per data source are set by DEFAULT_CIRCUIT_BREAKER and
+CIRCUIT_BREAKERS in stockdex.config.
+"""
+
+import threading
+import time
+from typing import Tuple, Union
+from urllib.parse import urlsplit
+
+from stockdex.config import CIRCUIT_BREAKERS, DEFAULT_CIRCUIT_BREAKER
+from stockdex.lib import get_data_source
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending a request to a host whose circuit is open
+
+    Attributes:
+    ----------
+    host: str
+        The failing host
+    retry_after: float
+        Seconds until the next probe request is let through
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit open for {host} after repeated failures, "
+            f"next attempt in {retry_after:.1f}s"
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single host
+
+    Args:
+    ----------
+    host: str
+        The host the breaker guards, used in error messages
+    failure_threshold: int
+        The number of consecutive failed attempts that opens the circuit
+    open_interval: float
+        Seconds the circuit stays open before a probe request is let through
+    failure_statuses: Tuple[int, ...]
+        The HTTP statuses counted as failures, other statuses show that the
+        host is answering and count as successes
+    """
+
+    def __init__(
+        self,
+        host: str = "",
+        failure_threshold: int = 5,
+        open_interval: float = 60.0,
+        failure_statuses: Tuple[int, ...] = (403, 429, 500, 502, 503, 504),
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.open_interval = open_interval
+        self.failure_statuses = tuple(failure_statuses)
+
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> None:
+        """
+        Check that a new request may be sent, turning an open circuit whose
+        interval elapsed into a half-open one with this request as the probe
+
+        Raises:
+        ----------
+        CircuitOpenError: If the circuit is open or another probe is running
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                remaining = self._opened_at + self.open_interval - now
+                if remaining > 0:
+                    raise CircuitOpenError(self.host, remaining)
+                self.state = HALF_OPEN
+                self._probe_started_at = now
+            elif self.state == HALF_OPEN:
+                # A probe that never reported back does not block the host forever
+                remaining = self._probe_started_at + self.open_interval - now
+                if remaining > 0:
+                    raise CircuitOpenError(self.host, remaining)
+                self._probe_started_at = now
+
+    def check(self) -> None:
+        """
+        Raise CircuitOpenError if the circuit is open, used between the
+        retries of a request that was already allowed
+        """
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.open_interval - time.monotonic()
+                raise CircuitOpenError(self.host, max(0.0, remaining))
+
+    def record(
+        self,
+        status_code: Union[int, None] = None,
+        exception: Union[Exception, None] = None,
+    ) -> None:
+        """
+        Record the outcome of an attempt, either its status or its exception
+        """
+        if exception is not None or status_code in self.failure_statuses:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """
+    Registry of one CircuitBreaker per data source and host
+
+    Args:
+    ----------
+    settings: dict
+        CircuitBreaker arguments per data source, or None to not guard the
+        source. Defaults to CIRCUIT_BREAKERS from stockdex.config
+    default: dict
+        CircuitBreaker arguments that the per source settings override,
+        defaults to DEFAULT_CIRCUIT_BREAKER from stockdex.config
+    """
+
+    def __init__(
+        self,
+        settings: Union[dict, None] = None,
+        default: Union[dict, None] = None,
+    ) -> None:
+        self.settings = CIRCUIT_BREAKERS if settings is None else settings
+        self.default = DEFAULT_CIRCUIT_BREAKER if default is None else default
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get_breaker(
+        self, url: str, source: Union[str, None] = None
+    ) -> Union[CircuitBreaker, None]:
+        """
+        Return the breaker of the data source and host of url,
+        or None if they are not guarded. The data source is found from
+        ENDPOINTS unless given.
+        """
+        source = source or get_data_source(url)
+        host = urlsplit(url).netloc.lower()
+        key = (source, host)
+
+        with self._lock:
+            if key not in self._breakers:
+                settings = self.settings.get(source, {})
+                self._breakers[key] = (
+                    CircuitBreaker(host, **{**self.default, **settings})
+                    if settings is not None
+                    else None
+                )
+            return self._breakers[key]
@@ -1,9 +1,27 @@
 # File for configuration of the stockdex package
 
+import os
 from typing import Literal
 
 RESPONSE_TIMEOUT = 10
 RETRY_AFTER_TIMEOUT = 2
+# Maximum number of concurrent connections of each asyncio session
+ASYNC_MAX_CLIENTS = 50
+# Maximum number of curl_cffi sessions, i.e. of concurrent blocking requests
+SESSION_POOL_SIZE = 10
+# Total size in bytes of the page bodies whose parsed trees each ticker keeps
+# by body hash, so unchanged pages are not parsed again
+PARSED_PAGE_CACHE_BYTES = 4 * 1024 * 1024
+# Upper bounds in seconds of the request duration histogram, see stockdex.metrics
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# BeautifulSoup tree builder of all scrapers, e.g. "html.parser" or "lxml"
+HTML_PARSER = os.environ.get("STOCKDEX_HTML_PARSER", "html.parser")
+# Offline mode, serving only cached pages (see TickerBase.offline)
+OFFLINE = os.environ.get("STOCKDEX_OFFLINE", "").lower() in ("1", "true", "yes")
+# JSON decoder, "auto" uses orjson when installed (see stockdex.json_decoder)
+JSON_DECODER = os.environ.get("STOCKDEX_JSON_DECODER", "auto")
+# Seconds after which the shared Yahoo crumb and its cookies are fetched again
+YAHOO_CRUMB_MAX_AGE = 6 * 60 * 60
 
 VALID_SECURITY_TYPES = Literal["stock", "etf", "cryptocurrency", "index", "commodity"]
 VALID_DATA_SOURCES = Literal["yahoo_web", "yahoo_api", "justetf", "digrin", "finviz"]
@@ -20,6 +38,76 @@ DIGRIN_BASE_URL = "https://www.digrin.com/stocks/detail"
 MACROTRENDS_BASE_URL = "https://www.macrotrends.net/stocks/charts"
 FINVIZ_BASE_URL = "https://finviz.com/quote.ashx?t="
 
+# Base URL of every data source. Assign to an entry of ENDPOINTS to point all
+# tickers at another host (e.g. stockdex.fake_server), or pass endpoints to a Ticker
+DEFAULT_ENDPOINTS = {
+    "yahoo_api": BASE_URL,
+    "yahoo_fundamentals": FUNDAMENTALS_BASE_URL,
+    "yahoo_web": YAHOO_WEB_BASE_URL,
+    "justetf": JUSTETF_BASE_URL,
+    "nasdaq": NASDAQ_BASE_URL,
+    "digrin": DIGRIN_BASE_URL,
+    "macrotrends": MACROTRENDS_BASE_URL,
+    "finviz": FINVIZ_BASE_URL,
+}
+ENDPOINTS = dict(DEFAULT_ENDPOINTS)
+
+# Seconds a response stays fresh in the persistent response cache, per data
+# source (see stockdex.cache). Sources missing here or set to 0 are not cached.
+CACHE_TTL = {
+    "yahoo_api": 60,
+    "yahoo_fundamentals": 24 * 60 * 60,
+    "yahoo_web": 60 * 60,
+    "justetf": 24 * 60 * 60,
+    "nasdaq": 24 * 60 * 60,
+    "digrin": 24 * 60 * 60,
+    "macrotrends": 7 * 24 * 60 * 60,
+    "finviz": 24 * 60 * 60,
+}
+
+# (requests per second, burst) allowed per host of each data source, None
+# disables rate limiting for the source (see stockdex.rate_limiter)
+RATE_LIMITS = {
+    "yahoo_api": None,
+    "yahoo_fundamentals": None,
+    "yahoo_web": None,
+    "justetf": (0.2, 1),
+    "nasdaq": (0.2, 1),
+    "digrin": (0.2, 1),
+    "macrotrends": (0.2, 1),
+    "finviz": (0.2, 1),
+}
+# (requests per second, burst) for hosts that do not belong to a data source
+DEFAULT_RATE_LIMIT = (0.2, 1)
+
+# Retry settings used for every data source, see stockdex.retry.RetryPolicy
+DEFAULT_RETRY_POLICY = {
+    "max_attempts": 4,
+    "base_delay": 0.25,
+    "max_delay": 10.0,
+    "jitter": True,
+    "respect_retry_after": True,
+    "retry_statuses": (403, 429, 500, 502, 503, 504),
+}
+# Per data source overrides of DEFAULT_RETRY_POLICY
+RETRY_POLICIES = {
+    "macrotrends": {"base_delay": 1.0},
+    "digrin": {"base_delay": 1.0},
+}
+
+# Circuit breaker settings used for every data source,
+# see stockdex.circuit_breaker.CircuitBreaker
+DEFAULT_CIRCUIT_BREAKER = {
+    "failure_threshold": 5,
+    "open_interval": 60.0,
+    "failure_statuses": (403, 429, 500, 502, 503, 504),
+}
+# Per data source overrides of DEFAULT_CIRCUIT_BREAKER, None disables the breaker
+CIRCUIT_BREAKERS = {
+    "macrotrends": {"open_interval": 300.0},
+    "digrin": {"open_interval": 300.0},
+}
+
 INCOME_STATEMENT_COLUMNS = [
     "TaxEffectOfUnusualItems",
     "TaxRateForCalcs",
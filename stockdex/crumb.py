@@ -0,0 +1,134 @@
+"""
+Process-wide manager of the Yahoo crumb and the cookies it is bound to
+
+Yahoo API requests need a crumb that is only valid together with the cookies
+received while fetching it. The manager fetches both once per process, shares
+them between all tickers, threads and event loops, and optionally persists
+them to disk so that restarts do not pay for the two extra round trips.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Tuple, Union
+
+from curl_cffi import requests
+
+from stockdex.config import YAHOO_CRUMB_MAX_AGE
+
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+
+
+class YahooCrumbManager:
+    """
+    Lock protected holder of the Yahoo crumb and its cookies
+
+    Args:
+    ----------
+    path: str
+        Optional JSON file the crumb and cookies are persisted to,
+        e.g. "~/.cache/stockdex/yahoo_crumb.json"
+    max_age: float
+        Seconds after which the crumb is fetched again
+    """
+
+    def __init__(
+        self, path: Union[str, None] = None, max_age: float = YAHOO_CRUMB_MAX_AGE
+    ) -> None:
+        self.path = os.path.expanduser(path) if path else None
+        self.max_age = max_age
+
+        self._crumb: Union[str, None] = None
+        self._cookies: dict = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def _is_fresh(self) -> bool:
+        return self._crumb is not None and (
+            time.time() - self._fetched_at < self.max_age
+        )
+
+    def get(self) -> Tuple[str, dict]:
+        """
+        Return the crumb and the cookies to send with it, fetching them
+        if there are none or they expired
+        """
+        with self._lock:
+            if not self._is_fresh():
+                self._crumb, self._cookies = self._fetch()
+                self._fetched_at = time.time()
+                self._save()
+            return self._crumb, self._cookies
+
+    async def get_async(self) -> Tuple[str, dict]:
+        """
+        Async counterpart of get. The rare fetch runs in the default executor,
+        so that threads and coroutines share one lock and one fetch.
+        """
+        with self._lock:
+            if self._is_fresh():
+                return self._crumb, self._cookies
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.get)
+
+    def invalidate(self, crumb: Union[str, None] = None) -> None:
+        """
+        Drop the crumb, e.g. after Yahoo rejected it. If crumb is given, only
+        drop it if it is still the current one, so that concurrent callers
+        rejected with the same crumb trigger a single refresh.
+        """
+        with self._lock:
+            if crumb is None or crumb == self._crumb:
+                self._crumb = None
+                self._cookies = {}
+                self._fetched_at = 0.0
+                self._save()
+
+    def _fetch(self) -> Tuple[str, dict]:
+        session = requests.Session(impersonate="chrome110")
+        try:
+            session.get(YAHOO_COOKIE_URL, timeout=10, allow_redirects=True)
+            response = session.get(YAHOO_CRUMB_URL, timeout=10, allow_redirects=True)
+            crumb = response.text.strip()
+            if response.status_code == 429 or "Too Many Requests" in crumb:
+                raise RuntimeError("Rate limited while getting crumb")
+            if crumb == "" or "<html>" in crumb:
+                raise RuntimeError("Invalid crumb received")
+            return crumb, session.cookies.get_dict()
+        except Exception as e:
+            raise RuntimeError(f"Error fetching Yahoo crumb: {e}")
+        finally:
+            session.close()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                state = json.load(file)
+            self._crumb = state["crumb"]
+            self._cookies = state["cookies"]
+            self._fetched_at = state["fetched_at"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "crumb": self._crumb,
+                    "cookies": self._cookies,
+                    "fetched_at": self._fetched_at,
+                },
+                file,
+            )
+        os.replace(tmp_path, self.path)
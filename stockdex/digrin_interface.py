@@ -5,14 +5,18 @@ Module to extract data from Digrin website
 from typing import Union
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from plotly import express as px
 
-from stockdex.config import DIGRIN_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.exceptions import NoDataError
 from stockdex.lib import plot_dataframe
+from stockdex.tables import read_table
 from stockdex.ticker_base import TickerBase
 
+# Every getter reads a single table, the rest of the page is not parsed
+_TABLES = SoupStrainer("table")
+
 
 class DigrinInterface(TickerBase):
     def __init__(
@@ -39,31 +43,22 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}"
-        response = self.get_response(url)
+        url = f"{self.digrin_base_url}/{self.ticker}"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _TABLES)
 
         try:
             table = self.find_parent_by_text(soup, "table", "Ex-dividend date")
         except IndexError:
             raise Exception(f"There is no dividend data for the ticker {self.ticker}")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        try:
-            headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        except IndexError:
+        if table.find("thead") is None:
             raise ValueError(
                 f"There are no dividends data for ticker: {self.ticker}. For details, check out {url}"  # noqa
             )
 
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers).replace("\n", "", regex=True)
+        data_df = read_table(table).replace("\n", "", regex=True)
         return data_df
 
     @property
@@ -77,11 +72,10 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/payout_ratio"
-        response = self.get_response(url)
+        url = f"{self.digrin_base_url}/{self.ticker}/payout_ratio"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _TABLES)
 
         try:
             table = self.find_parent_by_text(soup, "table", "Payout ratio")
@@ -90,14 +84,7 @@ class DigrinInterface(TickerBase):
                 f"There is no payout ratio data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers).replace("\n", "", regex=True)
+        data_df = read_table(table).replace("\n", "", regex=True)
         return data_df
 
     @property
@@ -111,25 +98,17 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/price"
-        response = self.get_response(url)
+        url = f"{self.digrin_base_url}/{self.ticker}/price"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _TABLES)
 
         try:
             table = self.find_parent_by_text(soup, "table", "Adjusted price")
         except IndexError:
             raise Exception(f"There is no price data for the ticker {self.ticker}")
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers).replace("\n", "", regex=True)
+        data_df = read_table(table).replace("\n", "", regex=True)
         return data_df
 
     @property
@@ -143,11 +122,10 @@ class DigrinInterface(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{DIGRIN_BASE_URL}/{self.ticker}/stock_split"
-        response = self.get_response(url)
+        url = f"{self.digrin_base_url}/{self.ticker}/stock_split"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _TABLES)
 
         try:
             table = self.find_parent_by_text(soup, "table", "Split Ratio")
@@ -156,14 +134,7 @@ class DigrinInterface(TickerBase):
                 f"There is no stock split data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers).replace("\n", "", regex=True)
+        data_df = read_table(table).replace("\n", "", regex=True)
         return data_df
 
     def _get_table_from_url(self, keyword: str, url: str) -> pd.DataFrame:
@@ -180,10 +151,9 @@ class DigrinInterface(TickerBase):
 
         # URL of the website to scrape
         url = url
-        response = self.get_response(url)
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _TABLES)
 
         try:
             table = self.find_parent_by_text(soup, "table", keyword)
@@ -197,14 +167,7 @@ class DigrinInterface(TickerBase):
                 f"There is no {keyword} data for the ticker {self.ticker}"
             )
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in table.find_all("thead")[0].find_all("th")]
-        for tr in table.find_all("tbody")[0].find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers).replace("\n", "", regex=True)
+        data_df = read_table(table).replace("\n", "", regex=True)
         return data_df
 
     @property
@@ -218,7 +181,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Assets", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Assets", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -232,7 +195,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Free Cash Flow", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Free Cash Flow", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -246,7 +209,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Net Income", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Net Income", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -260,7 +223,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Capital Lease", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Capital Lease", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -274,7 +237,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Shares Outstanding", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Shares Outstanding", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -288,7 +251,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Capex", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Capex", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -302,7 +265,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Cost of Revenue", f"{DIGRIN_BASE_URL}/{self.ticker}/financials"
+            "Cost of Revenue", f"{self.digrin_base_url}/{self.ticker}/financials"
         )
 
     @property
@@ -316,7 +279,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr3"
+            "Estimated Yield on Cost", f"{self.digrin_base_url}/{self.ticker}/dgr3"
         )
 
     @property
@@ -330,7 +293,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr5"
+            "Estimated Yield on Cost", f"{self.digrin_base_url}/{self.ticker}/dgr5"
         )
 
     @property
@@ -344,7 +307,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Estimated Yield on Cost", f"{DIGRIN_BASE_URL}/{self.ticker}/dgr10"
+            "Estimated Yield on Cost", f"{self.digrin_base_url}/{self.ticker}/dgr10"
         )
 
     @property
@@ -358,7 +321,7 @@ class DigrinInterface(TickerBase):
         """
 
         return self._get_table_from_url(
-            "Actual / Estimated EPS", f"{DIGRIN_BASE_URL}/{self.ticker}/earnings"
+            "Actual / Estimated EPS", f"{self.digrin_base_url}/{self.ticker}/earnings"
         )
 
     def plot_digrin_shares_outstanding(
@@ -85,3 +85,17 @@ class FieldNotExists(Exception):
             {self.message}. The field {self.given_field} does not exist in the dataframe.
             Make sure to choose a field from the following: {self.available_fields}
             """
+
+
+class CacheMissError(Exception):
+    """
+    The exception to be shown in offline mode when a page is not in the cache
+    """
+
+    def __init__(self, url: str, message: str = "Not in the cache") -> None:
+        self.url = url
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return f"{self.message}, offline mode does not fetch {self.url}"
@@ -0,0 +1,107 @@
+"""
+Extractors reading data embedded in raw page bytes, without building a DOM
+
+Many pages ship the data behind their tables as JSON inside a script tag.
+Finding that script in the raw bytes and decoding it directly is much
+faster than parsing the whole page. The extractors return None when the
+markup does not look as expected, so callers can fall back to the DOM.
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+_JSON_SCRIPT_PATTERN = re.compile(
+    rb"<script\b([^>]*?\stype\s*=\s*[\"']?application/json[\"']?[^>]*)>"
+    rb"(.*?)</script\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+_DATA_URL_PATTERN = re.compile(rb"\sdata-url\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+
+
+@lru_cache(maxsize=None)
+def _script_by_id_pattern(script_id: str) -> "re.Pattern":
+    # The opening tag with the id in any attribute position, then the body
+    return re.compile(
+        rb"<script\b[^>]*?\sid\s*=\s*([\"']?)"
+        + re.escape(script_id.encode())
+        + rb"\1(?=[\s/>])[^>]*>(.*?)</script\s*>",
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+def find_script_by_id(content: bytes, script_id: str) -> Union[bytes, None]:
+    """
+    Return the body of the script tag with the given id
+
+    Args:
+    ----------
+    content: bytes
+        The raw page
+    script_id: str
+        The id attribute of the script, e.g. "route-init-data"
+
+    Returns:
+    ----------
+    Union[bytes, None]: The script body, None if there is no such script
+    """
+    match = _script_by_id_pattern(script_id).search(content)
+    if match is None:
+        return None
+    return match.group(2).strip()
+
+
+@lru_cache(maxsize=None)
+def _js_assignment_pattern(name: str) -> "re.Pattern":
+    # The literal assigned to name, up to the end of its line
+    return re.compile(
+        rb"\b" + re.escape(name.encode()) + rb"\s*=\s*([\[{].*?)\s*;?\s*$",
+        re.MULTILINE,
+    )
+
+
+def find_js_assignment(content: bytes, name: str) -> Union[bytes, None]:
+    """
+    Return the JSON literal assigned to a JavaScript variable, e.g. the
+    array in `var originalData = [...];`, which must fit on one line
+
+    Args:
+    ----------
+    content: bytes
+        The raw page
+    name: str
+        The name of the variable
+
+    Returns:
+    ----------
+    Union[bytes, None]: The literal, None if the variable is not assigned one
+    """
+    match = _js_assignment_pattern(name).search(content)
+    if match is None:
+        return None
+    return match.group(1)
+
+
+def find_json_scripts(content: bytes) -> List[Tuple[Union[str, None], bytes]]:
+    """
+    Return the bodies of all application/json script tags, with the
+    data-url attribute of each, e.g. the fetch cache Yahoo pages ship
+
+    Args:
+    ----------
+    content: bytes
+        The raw page
+
+    Returns:
+    ----------
+    List[Tuple[Union[str, None], bytes]]: The data-url of each script, None
+        if it has none, and its body
+    """
+    scripts = []
+    for match in _JSON_SCRIPT_PATTERN.finditer(content):
+        url = _DATA_URL_PATTERN.search(match.group(1))
+        if url is not None:
+            url = html.unescape((url.group(1) or url.group(2)).decode())
+        scripts.append((url, match.group(2).strip()))
+    return scripts
@@ -0,0 +1,227 @@
+"""
+Local stand-in server serving recorded responses of the data sources
+
+The server replays a cassette directory written by stockdex.transport in
+"record" mode. Every data source is mounted under its own prefix, e.g.
+http://127.0.0.1:8000/digrin/stocks/detail/AAPL serves the recording of
+https://www.digrin.com/stocks/detail/AAPL. Latency and error rate can be set
+to load-test a pipeline on a machine without internet access.
+
+Example:
+----------
+>>> with FakeServer("cassettes", latency=0.05, error_rate=0.01) as server:
+...     ticker = Ticker(ticker="AAPL", endpoints=server.endpoints)
+...     ticker.digrin_dividend
+
+From the command line:
+----------
+python -m stockdex.fake_server cassettes --port 8000 --latency 0.05
+"""
+
+import argparse
+import http.server
+import json
+import random
+import threading
+import time
+from typing import Union
+from urllib.parse import urlsplit
+
+from stockdex.cache import normalize_url
+from stockdex.config import DEFAULT_ENDPOINTS
+from stockdex.transport import Transport
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self):
+        fake = self.server.fake
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        if fake.should_fail():
+            self._send(fake.error_status, b"", {"Retry-After": "0"})
+            return
+
+        source, _, rest = self.path.lstrip("/").partition("/")
+        url = fake.to_upstream(source, f"/{rest}")
+        recording = fake.find(url)
+        if recording is None:
+            self._send(404, b"Not recorded", {})
+            return
+
+        # Replay redirects, so that e.g. Macrotrends slugs resolve as they did
+        final_url = recording.get("final_url", recording["url"])
+        if normalize_url(url) != normalize_url(final_url):
+            self._send(302, b"", {"Location": fake.to_local(source, final_url)})
+            return
+
+        with open(recording["body_path"], "rb") as file:
+            body = file.read()
+        headers = {
+            k: v
+            for k, v in recording["headers"].items()
+            if k in ("content-type", "etag", "last-modified")
+        }
+        self._send(recording["status_code"], body, headers)
+
+    def _send(self, status: int, body: bytes, headers: dict) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeServer"
+
+
+class FakeServer:
+    """
+    Threaded HTTP server replaying a cassette directory
+
+    Args:
+    ----------
+    directory: str
+        The cassette directory, see stockdex.transport.Transport
+    host: str
+        The interface to listen on
+    port: int
+        The port to listen on, 0 picks a free one
+    latency: float
+        Seconds to wait before answering each request
+    error_rate: float
+        Fraction of requests answered with error_status instead
+    error_status: int
+        The status of the injected errors
+    seed: int
+        Seed of the random generator deciding which requests fail
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Union[int, None] = None,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        # Recordings by normalized URL, both as requested and after redirects
+        self._recordings = {}
+        for recording in Transport(directory).recordings():
+            if recording.get("variant"):
+                continue
+            for url in (recording.get("final_url"), recording["url"]):
+                if url:
+                    self._recordings.setdefault(normalize_url(url), recording)
+
+        self._server = _Server((host, port), _Handler)
+        self._server.fake = self
+        self._thread: Union[threading.Thread, None] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def endpoints(self) -> dict:
+        """
+        Base URL of every data source on this server, to pass to a Ticker
+        or to assign to ENDPOINTS in stockdex.config
+        """
+        return {
+            source: self.to_local(source, base_url)
+            for source, base_url in DEFAULT_ENDPOINTS.items()
+        }
+
+    def to_local(self, source: str, url: str) -> str:
+        """
+        Translate an upstream URL of source into the URL serving it locally
+        """
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.url}/{source}{parts.path}{query}"
+
+    def to_upstream(self, source: str, path: str) -> Union[str, None]:
+        """
+        Translate a local path of source into the upstream URL it stands for
+        """
+        if source not in DEFAULT_ENDPOINTS:
+            return None
+
+        upstream = urlsplit(DEFAULT_ENDPOINTS[source])
+        return f"{upstream.scheme}://{upstream.netloc}{path}"
+
+    def find(self, url: Union[str, None]) -> Union[dict, None]:
+        """
+        Return the recording of an upstream URL, requested or redirected to
+        """
+        if url is None:
+            return None
+        return self._recordings.get(normalize_url(url))
+
+    def should_fail(self) -> bool:
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def start(self) -> "FakeServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("directory", help="cassette directory to serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args()
+
+    server = FakeServer(
+        args.directory,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    print(json.dumps(server.endpoints, indent=2))
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
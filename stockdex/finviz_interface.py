@@ -1,13 +1,19 @@
-import json
 from functools import lru_cache
 
 import pandas as pd
 import plotly.express as px
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from stockdex.config import FINVIZ_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
+from stockdex.extractors import find_script_by_id
+from stockdex.json_decoder import decode
+from stockdex.tables import table_rows
 from stockdex.ticker_base import TickerBase
 
+# Regions of the pages read by the scrapers, only these are parsed
+_TABLES = SoupStrainer("table")
+_ROUTE_INIT_DATA = SoupStrainer("script", {"id": "route-init-data"})
+
 
 class FinvizInterface(TickerBase):
     def __init__(
@@ -23,10 +29,8 @@ class FinvizInterface(TickerBase):
     def finviz_get_insider_trading(self) -> pd.DataFrame:
         """Fetch insider trading data for the specified ticker."""
 
-        url = f"{FINVIZ_BASE_URL}{self.ticker}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        url = f"{self.finviz_base_url}{self.ticker}"
+        soup = self.get_soup(url, _TABLES)
 
         table = self.find_parent_by_text(
             soup,
@@ -38,20 +42,24 @@ class FinvizInterface(TickerBase):
         if table is None:
             raise RuntimeError("Insider trading data not found")
 
-        columns = table.find_all("th")
-        column_names = [col.get_text(strip=True) for col in columns]
+        column_names, rows = table_rows(table, strip=True)
+        data = [row for row in rows if len(row) == len(column_names)]
 
-        rows = table.find_all("tr")[1:]  # Skip header row
-        data = []
+        return pd.DataFrame(data, columns=column_names)
 
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) != len(column_names):
-                continue
-            row_data = [cell.get_text(strip=True) for cell in cells]
-            data.append(row_data)
+    def _finviz_route_init_data(self, url: str) -> dict:
+        """
+        Return the data Finviz embeds in the route-init-data script of a page
 
-        return pd.DataFrame(data, columns=column_names)
+        The script is looked up in the raw bytes and decoded directly, the
+        page is only parsed if the script is not found that way.
+        """
+        raw_data = find_script_by_id(self.get_raw_page(url).content, "route-init-data")
+        if raw_data is None:
+            soup = self.get_soup(url, _ROUTE_INIT_DATA)
+            raw_data = soup.find("script", {"id": "route-init-data"}).string
+
+        return decode(raw_data)
 
     @lru_cache(maxsize=None)
     def _finviz_earnings_reaction_raw_data(self) -> dict:
@@ -59,15 +67,9 @@ class FinvizInterface(TickerBase):
         Return and caches the raw earnings reaction data.
         """
 
-        url = f"{FINVIZ_BASE_URL}{self.ticker}&ty=ea&p=d"
-        response = self.get_response(url)
+        url = f"{self.finviz_base_url}{self.ticker}&ty=ea&p=d"
 
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        raw_data = soup.find("script", {"id": "route-init-data"})
-        raw_data_json = json.loads(raw_data.string)
-
-        return raw_data_json
+        return self._finviz_route_init_data(url)
 
     @lru_cache
     def _finviz_dividend_payout_history_raw_data(self) -> dict:
@@ -75,15 +77,9 @@ class FinvizInterface(TickerBase):
         Return and caches the raw dividend payout history data.
         """
 
-        url = f"{FINVIZ_BASE_URL}{self.ticker}&ty=dv&p=d"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        raw_data = soup.find("script", {"id": "route-init-data"})
-        raw_data_json = json.loads(raw_data.string)
+        url = f"{self.finviz_base_url}{self.ticker}&ty=dv&p=d"
 
-        return raw_data_json
+        return self._finviz_route_init_data(url)
 
     @lru_cache
     def _finviz_revenue_raw_data(self) -> dict:
@@ -94,16 +90,9 @@ class FinvizInterface(TickerBase):
         :return: DataFrame containing price reaction data
         """
 
-        url = f"{FINVIZ_BASE_URL}{self.ticker}&ty=rv&p=d"
-
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        raw_data = soup.find("script", {"id": "route-init-data"})
-        raw_data_json = json.loads(raw_data.string)
+        url = f"{self.finviz_base_url}{self.ticker}&ty=rv&p=d"
 
-        return raw_data_json
+        return self._finviz_route_init_data(url)
 
     def finviz_earnings_revisions_data(self) -> pd.DataFrame:
         """
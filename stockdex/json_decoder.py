@@ -0,0 +1,103 @@
+"""
+JSON decoding shared by all data sources
+
+Bodies are decoded with orjson when it is installed and with the standard
+library json module otherwise. JSON_DECODER in stockdex.config (or the
+STOCKDEX_JSON_DECODER environment variable) picks one explicitly, and
+set_decoder plugs in any other function taking bytes or str.
+
+decode_response decodes a response body once and keeps the result on the
+response, so that every reader of a large chart payload shares one decode.
+The decoded object is shared, callers must not modify it.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+from stockdex.config import JSON_DECODER
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Attribute of a response holding its decoded body
+_DECODED_ATTRIBUTE = "_decoded_json"
+_MISSING = object()
+
+
+def get_decoder(name: str = "auto") -> Callable[[Union[bytes, str]], Any]:
+    """
+    Return the decoding function called name
+
+    Args:
+    ----------
+    name: str
+        "orjson", "json", or "auto" for orjson if installed and json otherwise
+
+    Returns:
+    ----------
+    Callable: A function decoding bytes or str
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError(
+                "The orjson JSON decoder is not installed, "
+                "install it with `pip install orjson`"
+            )
+        return orjson.loads
+    if name == "json":
+        return json.loads
+
+    raise ValueError(
+        f"Unknown JSON decoder {name!r}, valid values are 'auto', 'orjson' and 'json'"
+    )
+
+
+_decoder = get_decoder(JSON_DECODER)
+
+
+def set_decoder(decoder: Union[str, Callable[[Union[bytes, str]], Any]]) -> None:
+    """
+    Replace the decoder used by decode and decode_response
+
+    Args:
+    ----------
+    decoder: Union[str, Callable]
+        A name accepted by get_decoder, or a function decoding bytes or str
+    """
+    global _decoder
+    _decoder = get_decoder(decoder) if isinstance(decoder, str) else decoder
+
+
+def decode(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document with the configured decoder
+    """
+    if isinstance(data, str) and type(data) is not str:
+        # orjson rejects str subclasses such as bs4's NavigableString
+        data = str(data)
+    return _decoder(data)
+
+
+def decode_response(response) -> Any:
+    """
+    Decode the JSON body of a response, once per response object
+
+    Args:
+    ----------
+    response: requests.Response or CachedResponse
+        The response to decode
+
+    Returns:
+    ----------
+    Any: The decoded body, shared by all callers
+    """
+    decoded = getattr(response, _DECODED_ATTRIBUTE, _MISSING)
+    if decoded is _MISSING:
+        decoded = decode(response.content)
+        setattr(response, _DECODED_ATTRIBUTE, decoded)
+    return decoded
@@ -3,12 +3,11 @@ Module for extracting ETF data from JustETF website
 """
 
 import pandas as pd
-from bs4 import BeautifulSoup
 
-from stockdex.config import JUSTETF_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.exceptions import NoISINError
 from stockdex.lib import check_security_type
-from stockdex.selenium_interface import selenium_interface
+from stockdex.tables import read_table, table_rows
 from stockdex.ticker_base import TickerBase
 
 
@@ -33,23 +32,18 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        data_df = pd.DataFrame()
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}"
+        soup = self.get_soup(url)
 
         general_info = soup.find("div", {"class": "data-overview mt-4 mb-3"})
         labels = general_info.find_all("div", {"class": "vallabel"})
 
-        for label in labels:
-            column = label.text.replace(" ", "")
-            value = label.find_next_sibling("div").text
-
-            data_df[column] = [value]
+        data = {
+            label.text.replace(" ", ""): [label.find_next_sibling("div").text]
+            for label in labels
+        }
 
-        return data_df
+        return pd.DataFrame(data)
 
     @property
     def justetf_wkn(self) -> str:
@@ -58,10 +52,8 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}"
+        soup = self.get_soup(url)
 
         # <span class="d-inline-block" id="etf_identifier_1">A0RPWH</span>
         wkn = soup.find("span", {"id": "etf_identifier_1"}).text
@@ -75,10 +67,8 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        response = self.get_response(url)
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}"
+        soup = self.get_soup(url)
 
         description = soup.find("div", {"id": "etf-description"}).text
 
@@ -105,23 +95,17 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}#basics"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface()
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}#basics"
 
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
+        renderer = self._get_selenium_interface()
+        soup = renderer.get_html_content(url)
 
         table = soup.find("table", {"class": "table etf-data-table"})
 
-        for row in table.find_all("tr"):
-            column = row.find_all("td")
-            data_df[column[0].text.strip()] = [column[1].text.strip()]
+        _, rows = table_rows(table, strip=True)
+        data = {row[0]: [row[1]] for row in rows}
 
-        return data_df
+        return pd.DataFrame(data)
 
     @property
     def justetf_holdings_companies(self) -> pd.DataFrame:
@@ -142,17 +126,10 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}#holdings"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface()
-
-        soup = self.selenium_interface.get_html_content(url)
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}#holdings"
 
-        data_df = pd.DataFrame()
-        companies = []
-        shares_percent = []
+        renderer = self._get_selenium_interface()
+        soup = renderer.get_html_content(url)
 
         table_body = (
             soup.find(lambda tag: tag.name == "h3" and "Top 10 Holdings" in tag.text)
@@ -160,16 +137,12 @@ class JustETF(TickerBase):
             .find("tbody")
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            companies.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["company name"] = companies
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("company name", inplace=True)
-
-        return data_df
+        return read_table(
+            table_body,
+            columns=["company name", "shares in percent"],
+            strip=True,
+            index="company name",
+        )
 
     @property
     def justetf_holdings_countries(self) -> pd.DataFrame:
@@ -190,17 +163,10 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}#holdings"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface()
-
-        soup = self.selenium_interface.get_html_content(url)
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}#holdings"
 
-        data_df = pd.DataFrame()
-        countries = []
-        shares_percent = []
+        renderer = self._get_selenium_interface()
+        soup = renderer.get_html_content(url)
 
         table_body = (
             soup.find(lambda tag: tag.name == "h3" and "Countries" in tag.text)
@@ -208,16 +174,12 @@ class JustETF(TickerBase):
             .find("tbody")
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            countries.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["country name"] = countries
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("country name", inplace=True)
-
-        return data_df
+        return read_table(
+            table_body,
+            columns=["country name", "shares in percent"],
+            strip=True,
+            index="country name",
+        )
 
     @property
     def justetf_holdings_sectors(self) -> pd.DataFrame:
@@ -238,17 +200,10 @@ class JustETF(TickerBase):
         """
         check_security_type(self.security_type, valid_types=["etf"])
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}#holdings"
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}#holdings"
 
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface()
-
-        soup = self.selenium_interface.get_html_content(url)
-
-        data_df = pd.DataFrame()
-        sectors = []
-        shares_percent = []
+        renderer = self._get_selenium_interface()
+        soup = renderer.get_html_content(url)
 
         table_body = (
             soup.find(lambda tag: tag.name == "h3" and "Sectors" in tag.text)
@@ -256,16 +211,12 @@ class JustETF(TickerBase):
             .find("tbody")
         )
 
-        for row in table_body.find_all("tr"):
-            columns = row.find_all("td")
-            sectors.append(columns[0].text.strip())
-            shares_percent.append(columns[1].text.strip())
-
-        data_df["sector name"] = sectors
-        data_df["shares in percent"] = shares_percent
-        data_df.set_index("sector name", inplace=True)
-
-        return data_df
+        return read_table(
+            table_body,
+            columns=["sector name", "shares in percent"],
+            strip=True,
+            index="sector name",
+        )
 
     @property
     def justetf_price(self) -> pd.DataFrame:
@@ -288,13 +239,11 @@ class JustETF(TickerBase):
         """
         df = pd.DataFrame()
 
-        url = f"{JUSTETF_BASE_URL}/etf-profile.html?isin={self.isin}"
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface()
+        url = f"{self.justetf_base_url}/etf-profile.html?isin={self.isin}"
 
         x_path = '//*[@id="profile-tabs"]/ul/li[1]/a'
-        soup = self.selenium_interface.just_etf_get_html_after_click(url, x_path)
+        renderer = self._get_selenium_interface()
+        soup = renderer.just_etf_get_html_after_click(url, x_path)
 
         # write into file
         with open("justetf.html", "w", encoding="utf-8") as file:
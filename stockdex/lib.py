@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Union
 
 import dash
@@ -5,6 +6,7 @@ import pandas as pd
 import plotly.express as px
 from dash import dcc, html
 
+from stockdex import config
 from stockdex.exceptions import WrongSecurityType
 
 
@@ -12,6 +14,32 @@ def get_user_agent():
     return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"  # noqa E501
 
 
+def get_data_source(url: str, endpoints: Union[dict, None] = None) -> Union[str, None]:
+    """
+    Return the name of the data source a URL belongs to, e.g. "digrin",
+    or None if the URL does not start with any of the configured base URLs
+
+    The base URLs in endpoints, e.g. the overrides of a ticker, are
+    tried before those in ENDPOINTS
+    """
+    for source, base_url in [*(endpoints or {}).items(), *config.ENDPOINTS.items()]:
+        if url.startswith(base_url):
+            return source
+    return None
+
+
+def day_timestamp(value: datetime, end: bool = False) -> int:
+    """
+    Return the epoch seconds of the start of the day of value, or of the
+    start of the next day with end. URLs built from the current time then
+    stay the same for the whole day and share one response cache key.
+    """
+    day = pd.Timestamp(value).normalize()
+    if end:
+        day += pd.Timedelta(days=1)
+    return int(day.timestamp())
+
+
 def check_security_type(security_type: str, valid_types: Union[str, list]) -> None:
     """
     Check if the security type is valid
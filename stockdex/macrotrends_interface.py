@@ -8,13 +8,20 @@ from typing import Literal, Union
 
 import pandas as pd
 import plotly.express as px
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from stockdex.config import MACROTRENDS_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.exceptions import FieldNotExists
+from stockdex.extractors import find_js_assignment
+from stockdex.json_decoder import decode
 from stockdex.lib import check_security_type, plot_dataframe
+from stockdex.tables import read_table
 from stockdex.ticker_base import TickerBase
 
+# Regions of the pages read by the scrapers, only these are parsed
+_TABLES = SoupStrainer("table")
+_HISTORICAL_DATA_TABLES = SoupStrainer("table", class_="historical_data_table")
+
 
 class MacrotrendsInterface(TickerBase):
     """
@@ -42,56 +49,42 @@ class MacrotrendsInterface(TickerBase):
 
         return full_name
 
-    def _find_table_in_url(
-        self, text_to_look_for: str, soup: BeautifulSoup
-    ) -> pd.DataFrame:
+    def _find_table_in_url(self, text_to_look_for: str, url: str) -> pd.DataFrame:
         """
         Retrieve the table with the given id from the given URL.
 
+        The rows are the originalData array embedded in the page, read from
+        the raw bytes and decoded as JSON without parsing the page.
+
         Args:
         ----------
-        url: str
-            The URL to retrieve the table from.
         text_to_look_for: str
             The text to look for in the table.
+        url: str
+            The URL to retrieve the table from.
 
         Returns:
         ----------
         pd.DataFrame
             The table as a pandas DataFrame.
         """
-        # Search all script tags on the page for originalData
-        original_data = None
-        for script in soup.find_all("script"):
-            if "originalData" in script.get_text():
-                original_data = script.get_text()
-                break
+        original_data = find_js_assignment(
+            self.get_raw_page(url).content, "originalData"
+        )
 
         if original_data is None:
             raise RuntimeError(
                 f"Could not find originalData for '{text_to_look_for}' on the page"
             )
 
-        # get the data from the script
-        data = None
-        for line in original_data.split("\n"):
-            if "originalData" in line and "=" in line:
-                data = line.split(" = ")[1]
-                break
-
-        if data is None:
+        try:
+            data = decode(original_data)
+        except ValueError:
             raise ValueError(
                 f"Could not extract data from originalData for '{text_to_look_for}'"
             )
 
-        # convert the data to a pandas DataFrame
-        data = data.replace(";", "")
-        data = data.replace("null", "None")
-        data = data.replace("\\/", "/")
-        data = eval(data)
-        data = pd.DataFrame(data)
-
-        return data
+        return pd.DataFrame(data)
 
     @lru_cache(maxsize=None)
     def macrotrends_income_statement(
@@ -103,18 +96,11 @@ class MacrotrendsInterface(TickerBase):
         check_security_type(self.security_type, valid_types=["stock"])
         frequency_suffix = "?freq=A" if frequency == "annual" else "?freq=Q"
 
-        url = (
-            f"{MACROTRENDS_BASE_URL}/{self.ticker}/{self.get_company_slug(self.ticker)}/income-statement{frequency_suffix}"  # NOQA: E501
-            if frequency == "quarterly"
-            else f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/income-statement{frequency_suffix}"
-        )
-
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        slug = self.get_company_slug(self.ticker) if frequency == "quarterly" else "TBD"
+        base_url = f"{self.macrotrends_base_url}/{self.ticker}/{slug}"
+        url = f"{base_url}/income-statement{frequency_suffix}"
 
-        data = self._find_table_in_url("Revenue", soup)
+        data = self._find_table_in_url("Revenue", url)
 
         data["field_name"] = data["field_name"].apply(
             lambda x: re.search(">(.*)<", x).group(1)
@@ -134,18 +120,11 @@ class MacrotrendsInterface(TickerBase):
         check_security_type(self.security_type, valid_types=["stock"])
         frequency_suffix = "?freq=A" if frequency == "annual" else "?freq=Q"
 
-        url = (
-            f"{MACROTRENDS_BASE_URL}/{self.ticker}/{self.get_company_slug(self.ticker)}/balance-sheet{frequency_suffix}"  # NOQA: E501
-            if frequency == "quarterly"
-            else f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/balance-sheet{frequency_suffix}"
-        )
+        slug = self.get_company_slug(self.ticker) if frequency == "quarterly" else "TBD"
+        base_url = f"{self.macrotrends_base_url}/{self.ticker}/{slug}"
+        url = f"{base_url}/balance-sheet{frequency_suffix}"
 
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        data = self._find_table_in_url("Cash On Hand", soup)
+        data = self._find_table_in_url("Cash On Hand", url)
 
         data["field_name"] = data["field_name"].apply(
             lambda x: re.search(">(.*)<", x).group(1)
@@ -165,18 +144,11 @@ class MacrotrendsInterface(TickerBase):
         check_security_type(self.security_type, valid_types=["stock"])
         frequency_suffix = "?freq=A" if frequency == "annual" else "?freq=Q"
 
-        url = (
-            f"{MACROTRENDS_BASE_URL}/{self.ticker}/{self.get_company_slug(self.ticker)}/cash-flow-statement{frequency_suffix}"  # NOQA: E501
-            if frequency == "quarterly"
-            else f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/cash-flow-statement{frequency_suffix}"
-        )
-
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        slug = self.get_company_slug(self.ticker) if frequency == "quarterly" else "TBD"
+        base_url = f"{self.macrotrends_base_url}/{self.ticker}/{slug}"
+        url = f"{base_url}/cash-flow-statement{frequency_suffix}"
 
-        data = self._find_table_in_url("Net Income/Loss", soup)
+        data = self._find_table_in_url("Net Income/Loss", url)
 
         data["field_name"] = data["field_name"].apply(
             lambda x: re.search(">(.*)<", x).group(1)
@@ -193,14 +165,9 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the key financial ratios for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/financial-ratios"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/financial-ratios"
 
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        data = self._find_table_in_url("Current Ratio", soup)
+        data = self._find_table_in_url("Current Ratio", url)
 
         data["field_name"] = data["field_name"].apply(
             lambda x: re.search(">(.*)<", x).group(1)
@@ -211,27 +178,13 @@ class MacrotrendsInterface(TickerBase):
         return data
 
     def _find_margins_table(self, url: str, text_to_look_for: str):
-        response = self.get_response(url)
-
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        data = []
-        headers = []
+        soup = self.get_soup(url, _TABLES)
 
         table = self.find_parent_by_text(soup=soup, tag="table", text=text_to_look_for)
 
-        headers = [
-            row.text
-            for row in table.find_all("thead")[1].find_all("tr")[0].find_all("th")
-        ]
-        data = [
-            [cell.text for cell in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-        data = pd.DataFrame(data, columns=headers)
-
-        return data
+        # the header is the row of the second thead, below a title row
+        return read_table(table)
 
     @property
     @lru_cache(maxsize=None)
@@ -240,7 +193,7 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the operating margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/operating-margin"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/operating-margin"
 
         return self._find_margins_table(url, "TTM Operating Income")
 
@@ -251,7 +204,7 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the gross margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/gross-margin"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/gross-margin"
 
         return self._find_margins_table(url, "Gross Margin")
 
@@ -262,7 +215,7 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the EBITDA margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/ebitda-margin"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/ebitda-margin"
 
         return self._find_margins_table(url, "TTM EBITDA")
 
@@ -273,7 +226,7 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the pre-tax margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/pre-tax-profit-margin"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/pre-tax-profit-margin"
 
         return self._find_margins_table(url, "TTM Pre-Tax Income")
 
@@ -284,7 +237,7 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the net profit margin for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/net-profit-margin"
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/net-profit-margin"
 
         return self._find_margins_table(url, "TTM Net Income")
 
@@ -296,12 +249,10 @@ class MacrotrendsInterface(TickerBase):
         Retrieve the revenue for the given ticker.
         """
         check_security_type(self.security_type, valid_types=["stock"])
-        url = f"{MACROTRENDS_BASE_URL}/{self.ticker}/TBD/revenue"
-
-        response = self.get_response(url)
+        url = f"{self.macrotrends_base_url}/{self.ticker}/TBD/revenue"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _HISTORICAL_DATA_TABLES)
 
         # find tables with class = historical_data_table
         tables = soup.find_all("table", class_="historical_data_table")
@@ -0,0 +1,234 @@
+"""
+Request instrumentation: hooks, aggregated statistics and a Prometheus exporter
+
+Every download made by TickerBase is described by a RequestEvent. Hooks in
+TickerBase.before_request_hooks receive the event before the first attempt,
+hooks in TickerBase.after_request_hooks receive it once the request succeeded
+or failed, and TickerBase.request_stats aggregates it per host.
+
+Example:
+----------
+>>> TickerBase.after_request_hooks.append(lambda event: print(event.as_dict()))
+>>> print(TickerBase.request_stats.to_prometheus())
+"""
+
+import bisect
+import threading
+import time
+from typing import Union
+from urllib.parse import urlsplit
+
+from stockdex.config import METRICS_LATENCY_BUCKETS
+from stockdex.lib import get_data_source
+
+
+class RequestEvent:
+    """
+    Timings and outcome of a single download, including all its retries
+
+    Attributes:
+    ----------
+    url, host, source: The requested URL, its host and its data source
+    attempts: The number of attempts made
+    status_code: The status of the last response, None if there was none
+    bytes: The size of the last response body
+    duration: Seconds from the first attempt to the outcome
+    throttle_wait: Seconds spent waiting for the rate limiter
+    crumb_wait: Seconds spent getting the Yahoo crumb
+    network_time: Seconds spent in the HTTP requests themselves
+    retry_wait: Seconds slept between attempts
+    error: The exception the request failed with, if any
+    """
+
+    def __init__(self, url: str, source: Union[str, None] = None) -> None:
+        self.url = url
+        self.host = urlsplit(url).netloc.lower()
+        self.source = source or get_data_source(url)
+        self.attempts = 0
+        self.status_code: Union[int, None] = None
+        self.bytes = 0
+        self.duration = 0.0
+        self.throttle_wait = 0.0
+        self.crumb_wait = 0.0
+        self.network_time = 0.0
+        self.retry_wait = 0.0
+        self.error: Union[BaseException, None] = None
+        self._started = time.monotonic()
+
+    def add_response(self, response) -> None:
+        self.status_code = response.status_code
+        self.bytes = len(response.content)
+
+    def finish(self, error: Union[BaseException, None] = None) -> None:
+        self.error = error
+        self.duration = time.monotonic() - self._started
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def as_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "host": self.host,
+            "source": self.source,
+            "attempts": self.attempts,
+            "status_code": self.status_code,
+            "bytes": self.bytes,
+            "duration": self.duration,
+            "throttle_wait": self.throttle_wait,
+            "crumb_wait": self.crumb_wait,
+            "network_time": self.network_time,
+            "retry_wait": self.retry_wait,
+            "error": repr(self.error) if self.error is not None else None,
+        }
+
+
+class _HostStats:
+    def __init__(self, source: Union[str, None], buckets: tuple) -> None:
+        self.source = source
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.bytes = 0
+        self.statuses = {}
+        self.throttle_wait = 0.0
+        self.crumb_wait = 0.0
+        self.network_time = 0.0
+        self.retry_wait = 0.0
+        self.latency_sum = 0.0
+        # Counts per bucket, the last one counting the requests above all bounds
+        self.latency_counts = [0] * (len(buckets) + 1)
+
+
+class RequestStats:
+    """
+    Thread-safe aggregation of RequestEvents per host
+
+    Args:
+    ----------
+    buckets: tuple
+        Upper bounds in seconds of the request duration histogram
+    """
+
+    def __init__(self, buckets: tuple = METRICS_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url: str, source: Union[str, None] = None) -> _HostStats:
+        host = urlsplit(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = _HostStats(source or get_data_source(url), self.buckets)
+        return self._hosts[host]
+
+    def record(self, event: RequestEvent) -> None:
+        """
+        Add a finished request to the statistics of its host
+        """
+        with self._lock:
+            stats = self._host(event.url, event.source)
+            stats.requests += 1
+            stats.errors += event.error is not None
+            stats.retries += event.retries
+            stats.bytes += event.bytes
+            status = str(event.status_code) if event.status_code else "error"
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.throttle_wait += event.throttle_wait
+            stats.crumb_wait += event.crumb_wait
+            stats.network_time += event.network_time
+            stats.retry_wait += event.retry_wait
+            stats.latency_sum += event.duration
+            stats.latency_counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+
+    def record_cache_hit(self, url: str, source: Union[str, None] = None) -> None:
+        """
+        Count a request served from the response cache
+        """
+        with self._lock:
+            self._host(url, source).cache_hits += 1
+
+    def snapshot(self) -> dict:
+        """
+        Return the statistics per host as plain dictionaries, with the
+        latency histogram as cumulative counts per upper bound
+        """
+        with self._lock:
+            snapshot = {}
+            for host, stats in self._hosts.items():
+                cumulative, total = {}, 0
+                for bound, count in zip(
+                    self.buckets + (float("inf"),), stats.latency_counts
+                ):
+                    total += count
+                    cumulative[bound] = total
+
+                snapshot[host] = {
+                    "source": stats.source,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "cache_hits": stats.cache_hits,
+                    "retries": stats.retries,
+                    "bytes": stats.bytes,
+                    "statuses": dict(stats.statuses),
+                    "throttle_wait": stats.throttle_wait,
+                    "crumb_wait": stats.crumb_wait,
+                    "network_time": stats.network_time,
+                    "retry_wait": stats.retry_wait,
+                    "latency_sum": stats.latency_sum,
+                    "latency_buckets": cumulative,
+                }
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts = {}
+
+    def to_prometheus(self) -> str:
+        """
+        Render the statistics in the Prometheus text exposition format
+        """
+        counters = [
+            ("requests_total", "requests", "Downloads made, including failed ones"),
+            ("request_errors_total", "errors", "Downloads that failed"),
+            ("cache_hits_total", "cache_hits", "Requests served from the cache"),
+            ("retries_total", "retries", "Retried attempts"),
+            ("response_bytes_total", "bytes", "Response body bytes received"),
+            ("throttle_wait_seconds_total", "throttle_wait", "Rate limiter waits"),
+            ("crumb_wait_seconds_total", "crumb_wait", "Time spent getting crumbs"),
+            ("network_seconds_total", "network_time", "Time spent in HTTP requests"),
+            ("retry_wait_seconds_total", "retry_wait", "Backoff between attempts"),
+        ]
+        snapshot = self.snapshot()
+        lines = []
+
+        def labels(host: str, **extra) -> str:
+            pairs = {"host": host, "source": snapshot[host]["source"] or "", **extra}
+            return ",".join(f'{k}="{v}"' for k, v in pairs.items())
+
+        for name, field, help_text in counters:
+            lines.append(f"# HELP stockdex_{name} {help_text}")
+            lines.append(f"# TYPE stockdex_{name} counter")
+            for host, stats in snapshot.items():
+                lines.append(f"stockdex_{name}{{{labels(host)}}} {stats[field]}")
+
+        lines.append("# HELP stockdex_responses_total Responses by status")
+        lines.append("# TYPE stockdex_responses_total counter")
+        for host, stats in snapshot.items():
+            for status, count in sorted(stats["statuses"].items()):
+                lines.append(
+                    f"stockdex_responses_total{{{labels(host, status=status)}}} {count}"
+                )
+
+        name = "stockdex_request_duration_seconds"
+        lines.append(f"# HELP {name} Duration of downloads including retries")
+        lines.append(f"# TYPE {name} histogram")
+        for host, stats in snapshot.items():
+            for bound, count in stats["latency_buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f"{name}_bucket{{{labels(host, le=le)}}} {count}")
+            lines.append(f"{name}_sum{{{labels(host)}}} {stats['latency_sum']}")
+            lines.append(f"{name}_count{{{labels(host)}}} {stats['requests']}")
+
+        return "\n".join(lines) + "\n"
@@ -4,9 +4,9 @@ Interface for NASDAQ stock data
 
 import pandas as pd
 
-from stockdex.config import NASDAQ_BASE_URL, VALID_SECURITY_TYPES
+from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.lib import check_security_type, get_user_agent
-from stockdex.selenium_interface import selenium_interface
+from stockdex.tables import read_table, table_rows
 from stockdex.ticker_base import TickerBase
 
 
@@ -42,31 +42,13 @@ class NASDAQInterface(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        url = f"{NASDAQ_BASE_URL}/{self.ticker.lower()}/earnings"
+        url = f"{self.nasdaq_base_url}/{self.ticker.lower()}/earnings"
 
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
-
-        soup = self.selenium_interface.get_html_content(url)
+        renderer = self._get_selenium_interface(use_custom_user_agent=True)
+        soup = renderer.get_html_content(url)
 
         earnings_table = soup.find("table", {"class": "earnings-surprise__table"})
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-surprise__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-surprise__table-body"}
-        )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
-
-        return pd.DataFrame(data, columns=columns)
+        return read_table(earnings_table, row_headers=True)
 
     @property
     def yearly_earnings_forecast(self) -> pd.DataFrame:
@@ -87,13 +69,10 @@ class NASDAQInterface(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        url = f"{NASDAQ_BASE_URL}/{self.ticker.lower()}/earnings"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
+        url = f"{self.nasdaq_base_url}/{self.ticker.lower()}/earnings"
 
-        soup = self.selenium_interface.get_html_content(url)
+        renderer = self._get_selenium_interface(use_custom_user_agent=True)
+        soup = renderer.get_html_content(url)
 
         # with open("earnings.html", "w") as f:
         #     f.write(str(soup.prettify()))
@@ -107,22 +86,7 @@ class NASDAQInterface(TickerBase):
         # earnings_table = soup.find("div", {"class": "jupiter22-earnings-forecast"})
         earnings_table = soup.find("table", {"class": "earnings-forecast__table"})
 
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-forecast__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-forecast__table-body"}
-        )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
-
-        return pd.DataFrame(data, columns=columns)
+        return read_table(earnings_table, row_headers=True)
 
     @property
     def quarterly_earnings_forecast(self) -> pd.DataFrame:
@@ -143,33 +107,15 @@ class NASDAQInterface(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        url = f"{NASDAQ_BASE_URL}/{self.ticker.lower()}/earnings"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
+        url = f"{self.nasdaq_base_url}/{self.ticker.lower()}/earnings"
 
-        soup = self.selenium_interface.get_html_content(url)
+        renderer = self._get_selenium_interface(use_custom_user_agent=True)
+        soup = renderer.get_html_content(url)
         earnings_table = soup.find_all("table", {"class": "earnings-forecast__table"})[
             1
         ]
 
-        columns = earnings_table.find(
-            "tr", {"class": "earnings-forecast__header"}
-        ).find_all("th")
-        columns = [column.text for column in columns]
-
-        data = []
-        table_body = earnings_table.find(
-            "tbody", {"class": "earnings-forecast__table-body"}
-        )
-        for row in table_body.find_all("tr"):
-            row_data_th = [cell.text for cell in row.find_all("th")]
-            row_data_td = [cell.text for cell in row.find_all("td")]
-            row_data = row_data_th + row_data_td
-            data.append(row_data)
-
-        return pd.DataFrame(data, columns=columns)
+        return read_table(earnings_table, row_headers=True)
 
     @property
     def price_to_earnings_ratio(self) -> pd.DataFrame:
@@ -182,20 +128,16 @@ class NASDAQInterface(TickerBase):
         """
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        url = f"{NASDAQ_BASE_URL}/{self.ticker.lower()}/price-earnings-peg-ratios"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
+        url = f"{self.nasdaq_base_url}/{self.ticker.lower()}/price-earnings-peg-ratios"
 
-        soup = self.selenium_interface.get_html_content(url)
+        renderer = self._get_selenium_interface(use_custom_user_agent=True)
+        soup = renderer.get_html_content(url)
 
         table = soup.find("tbody", {"class": "price-earnings-peg-ratios__table-body"})
-        index, value = [], []
-
-        for row in table.find_all("tr"):
-            index.append(row.find("th").text)
-            value.append(row.find("td").text)
+        # each row is a th label followed by its td value
+        _, rows = table_rows(table, row_headers=True)
+        index = [row[0] for row in rows]
+        value = [row[1] for row in rows]
 
         return pd.DataFrame(value, index=index, columns=["Price to Earnings Ratio"])
 
@@ -211,22 +153,18 @@ class NASDAQInterface(TickerBase):
 
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
-        url = f"{NASDAQ_BASE_URL}/{self.ticker.lower()}/price-earnings-peg-ratios"
-
-        # build selenium interface object if not already built
-        if not hasattr(self, "selenium_interface"):
-            self.selenium_interface = selenium_interface(use_custom_user_agent=True)
+        url = f"{self.nasdaq_base_url}/{self.ticker.lower()}/price-earnings-peg-ratios"
 
-        soup = self.selenium_interface.get_html_content(url)
+        renderer = self._get_selenium_interface(use_custom_user_agent=True)
+        soup = renderer.get_html_content(url)
 
         table = soup.find_all(
             "tbody", {"class": "price-earnings-peg-ratios__table-body"}
         )[1]
-        index, value = [], []
-
-        for row in table.find_all("tr"):
-            index.append(row.find("th").text)
-            value.append(row.find("td").text)
+        # each row is a th label followed by its td value
+        _, rows = table_rows(table, row_headers=True)
+        index = [row[0] for row in rows]
+        value = [row[1] for row in rows]
 
         return pd.DataFrame(
             value, index=index, columns=["Forecast Price to Earning Growth Rate"]
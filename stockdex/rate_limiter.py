@@ -0,0 +1,134 @@
+"""
+Per-host token bucket rate limiting for outgoing requests
+
+Every data source gets its own bucket on every host, so a slow data source
+does not hold back requests to the others, also when several sources are
+served from one host such as a proxy or stockdex.fake_server. The rate and
+burst of each data source are set by RATE_LIMITS in stockdex.config.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Tuple, Union
+from urllib.parse import urlsplit
+
+from stockdex.config import DEFAULT_RATE_LIMIT, RATE_LIMITS
+from stockdex.lib import get_data_source
+
+
+class TokenBucket:
+    """
+    Token bucket that refills rate tokens per second up to burst tokens
+
+    Callers reserve a token under a lock and then sleep outside of it, which
+    makes the bucket usable from threads and from asyncio coroutines alike.
+
+    Args:
+    ----------
+    rate: float
+        The number of requests allowed per second
+    burst: int
+        The number of requests that may be sent back to back
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return the number of seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available, return the time waited in seconds
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Sleep in the event loop until a token is available,
+        return the time waited in seconds
+        """
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Registry of one TokenBucket per data source and host
+
+    Args:
+    ----------
+    limits: dict
+        (rate, burst) per data source, or None to not limit the source.
+        Defaults to RATE_LIMITS from stockdex.config
+    default: Tuple[float, int]
+        (rate, burst) for hosts that do not belong to a known data source,
+        or None to not limit them
+    """
+
+    def __init__(
+        self,
+        limits: Union[dict, None] = None,
+        default: Union[Tuple[float, int], None] = DEFAULT_RATE_LIMIT,
+    ) -> None:
+        self.limits = RATE_LIMITS if limits is None else limits
+        self.default = default
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(
+        self, url: str, source: Union[str, None] = None
+    ) -> Union[TokenBucket, None]:
+        """
+        Return the bucket of the data source and host of url,
+        or None if they are not limited. The data source is found from
+        ENDPOINTS unless given.
+        """
+        source = source or get_data_source(url)
+        key = (source, urlsplit(url).netloc.lower())
+
+        with self._lock:
+            if key not in self._buckets:
+                limit = self.limits[source] if source in self.limits else self.default
+                self._buckets[key] = TokenBucket(*limit) if limit else None
+            return self._buckets[key]
+
+    def acquire(self, url: str, source: Union[str, None] = None) -> float:
+        """
+        Block until a request to url is allowed, return the time waited in seconds
+        """
+        bucket = self.get_bucket(url, source)
+        return bucket.acquire() if bucket is not None else 0.0
+
+    async def acquire_async(self, url: str, source: Union[str, None] = None) -> float:
+        """
+        Async counterpart of acquire
+        """
+        bucket = self.get_bucket(url, source)
+        return await bucket.acquire_async() if bucket is not None else 0.0
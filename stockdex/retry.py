@@ -0,0 +1,152 @@
+"""
+Retry policies with exponential backoff, jitter and Retry-After support
+
+The policy of a data source is built from DEFAULT_RETRY_POLICY and the
+overrides in RETRY_POLICIES in stockdex.config.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Tuple, Union
+
+from curl_cffi.requests.exceptions import ConnectionError, DNSError, Timeout
+
+from stockdex.config import DEFAULT_RETRY_POLICY, RETRY_POLICIES
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is retried
+
+    Args:
+    ----------
+    max_attempts: int
+        The total number of attempts, including the first one
+    base_delay: float
+        The delay in seconds before the first retry, doubled on every retry
+    max_delay: float
+        The upper bound in seconds of any delay, including Retry-After
+    jitter: bool
+        If True, draw each delay uniformly between 0 and the backoff
+        ("full jitter") so that concurrent clients do not retry in lockstep
+    respect_retry_after: bool
+        If True, wait at least as long as the Retry-After header asks for
+    retry_statuses: Tuple[int, ...]
+        The HTTP statuses that are retried
+    retry_exceptions: Tuple[type, ...]
+        The exceptions raised by the session that are retried
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.25,
+        max_delay: float = 10.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        retry_statuses: Tuple[int, ...] = (403, 429, 500, 502, 503, 504),
+        retry_exceptions: Tuple[type, ...] = (ConnectionError, Timeout),
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+
+        # Number of retries made under this policy, for reporting
+        self.total_retries = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the backoff delay in seconds after the given failed attempt (0 based)
+        """
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        response=None,
+        exception: Union[Exception, None] = None,
+    ) -> Union[float, None]:
+        """
+        Return the seconds to wait before retrying a failed attempt,
+        or None if it must not be retried
+
+        Args:
+        ----------
+        attempt: int
+            The 0 based number of the attempt that failed
+        response: requests.Response
+            The response of the attempt, if one was received
+        exception: Exception
+            The exception raised by the attempt, if any
+
+        Returns:
+        ----------
+        Union[float, None]: The delay in seconds, None to give up
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if exception is not None:
+            # DNS failures will not resolve themselves within a few seconds
+            if isinstance(exception, DNSError):
+                return None
+            if not isinstance(exception, self.retry_exceptions):
+                return None
+        elif response is None or response.status_code not in self.retry_statuses:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        with self._lock:
+            self.total_retries += 1
+
+        return min(delay, self.max_delay)
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_policies = {}
+_policies_lock = threading.Lock()
+
+
+def get_retry_policy(source: Union[str, None]) -> RetryPolicy:
+    """
+    Return the shared retry policy of a data source, built on first use
+    from DEFAULT_RETRY_POLICY and the source's entry in RETRY_POLICIES
+    """
+    with _policies_lock:
+        if source not in _policies:
+            _policies[source] = RetryPolicy(
+                **{**DEFAULT_RETRY_POLICY, **RETRY_POLICIES.get(source, {})}
+            )
+        return _policies[source]
@@ -1,4 +1,5 @@
 import os
+from typing import Union
 
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -7,11 +8,33 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from stockdex.lib import get_user_agent
+from stockdex.cache import CachedResponse, ResponseCache, normalize_url
+from stockdex.config import CACHE_TTL, HTML_PARSER
+from stockdex.exceptions import CacheMissError
+from stockdex.lib import get_data_source, get_user_agent
+from stockdex.transport import Transport
 
 
 class selenium_interface:
-    def __init__(self, use_custom_user_agent: bool = False):
+    def __init__(
+        self,
+        use_custom_user_agent: bool = False,
+        transport: Union[Transport, None] = None,
+        response_cache: Union[ResponseCache, None] = None,
+        offline: bool = False,
+        html_parser: str = HTML_PARSER,
+        endpoints: Union[dict, None] = None,
+    ):
+        # Record/replay transport, see stockdex.transport
+        self.transport = transport
+        # Rendered pages are cached like downloaded ones, see TickerBase
+        self.response_cache = response_cache
+        self.offline = offline
+        # BeautifulSoup tree builder, see TickerBase.html_parser
+        self.html_parser = html_parser
+        # Base URL overrides, see TickerBase.endpoints
+        self.endpoints = endpoints or {}
+
         # Set up Selenium to use Chrome in headless mode
         self.chrome_options = Options()
         self.chrome_options.add_argument("--headless")  # Ensure GUI is off
@@ -40,6 +63,10 @@ class selenium_interface:
         ----------------
         str: HTML content of the webpage in prettified format
         """
+        page_source = self._load(url)
+        if page_source is not None:
+            return BeautifulSoup(page_source, self.html_parser)
+
         # Initialize WebDriver
         driver = webdriver.Chrome(options=self.chrome_options)
         # Fetch the webpage
@@ -48,9 +75,10 @@ class selenium_interface:
         # Get the page source and close the driver
         page_source = driver.page_source
         driver.quit()
+        self._store(url, page_source)
 
         # Use Beautiful Soup to parse the HTML content
-        return BeautifulSoup(page_source, "html.parser")
+        return BeautifulSoup(page_source, self.html_parser)
 
     def click_on_element(
         self, xpath: str, driver: webdriver.Chrome, wait_time: int = 3
@@ -80,6 +108,10 @@ class selenium_interface:
         ----------------
         BeautifulSoup: Parsed HTML after the button click.
         """
+        page_source = self._load(url, variant=button_xpath)
+        if page_source is not None:
+            return BeautifulSoup(page_source, self.html_parser)
+
         driver = webdriver.Chrome(options=self.chrome_options)
         driver.get(url)
 
@@ -89,4 +121,52 @@ class selenium_interface:
 
         self.click_on_element(button_xpath, driver)
 
-        return BeautifulSoup(driver.page_source, "html.parser")
+        page_source = driver.page_source
+        self._store(url, page_source, variant=button_xpath)
+        return BeautifulSoup(page_source, self.html_parser)
+
+    def _cache_key(self, url: str, variant: str) -> str:
+        return f"selenium:{normalize_url(url)} {variant}"
+
+    def _load(self, url: str, variant: str = "") -> Union[str, None]:
+        """
+        Return the page source of a rendered page from the replaying transport
+        or the response cache, None if the page has to be rendered. Cached
+        pages are also saved to a recording transport.
+
+        Raises:
+        ----------
+        CacheMissError: In offline mode, if the page is not in the cache
+        """
+        if self.transport is not None and self.transport.replaying:
+            return self.transport.replay(url, variant=variant).text
+
+        if self.response_cache is not None:
+            cached = self.response_cache.get(self._cache_key(url, variant))
+            ttl = CACHE_TTL.get(get_data_source(url, self.endpoints), 0)
+            if cached is not None and (self.offline or cached.is_fresh(ttl)):
+                if self.transport is not None and self.transport.recording:
+                    self.transport.record(url, cached, variant=variant)
+                return cached.text
+
+        if self.offline:
+            raise CacheMissError(url)
+        return None
+
+    def _store(self, url: str, page_source: str, variant: str = "") -> None:
+        """
+        Save a rendered page to the response cache and, when the transport
+        is recording, to the cassette
+        """
+        response = CachedResponse(
+            url=url,
+            status_code=200,
+            content=page_source.encode("utf-8"),
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+        if self.response_cache is not None and CACHE_TTL.get(
+            get_data_source(url, self.endpoints)
+        ):
+            self.response_cache.set(self._cache_key(url, variant), response)
+        if self.transport is not None and self.transport.recording:
+            self.transport.record(url, response, variant=variant)
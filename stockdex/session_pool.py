@@ -0,0 +1,111 @@
+"""
+Thread-safe pool of impersonating curl_cffi sessions
+
+A curl_cffi Session must not be used by two threads at once. The pool hands
+every request its own session for the duration of the request and takes it
+back afterwards, so that keep-alive connections are reused without sharing a
+session between threads.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+from curl_cffi import requests
+
+from stockdex.config import SESSION_POOL_SIZE
+
+
+class SessionPool:
+    """
+    Bounded pool of curl_cffi sessions sharing one impersonation profile
+
+    Sessions are created on demand up to size. When all of them are busy,
+    callers wait for one to be returned. The most recently returned session is
+    handed out first, as it is the one most likely to hold open connections.
+
+    Args:
+    ----------
+    size: int
+        The maximum number of sessions, i.e. of concurrent requests
+    impersonate: str
+        The browser profile the sessions impersonate
+    headers: dict
+        Default headers of every session
+    """
+
+    def __init__(
+        self,
+        size: int = SESSION_POOL_SIZE,
+        impersonate: str = "chrome110",
+        headers: Union[dict, None] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self.impersonate = impersonate
+        self.headers = headers
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> requests.Session:
+        return requests.Session(impersonate=self.impersonate, headers=self.headers)
+
+    def acquire(self) -> requests.Session:
+        """
+        Take a session out of the pool, creating one if the pool is not full
+        and waiting for one to be released otherwise
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+
+        if not create:
+            return self._idle.get()
+
+        try:
+            return self._new_session()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def release(self, session: requests.Session) -> None:
+        """
+        Return a session taken with acquire to the pool
+        """
+        self._idle.put(session)
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """
+        Context manager lending a session for the duration of the block
+        """
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close(self) -> None:
+        """
+        Close the idle sessions. The pool stays usable and opens new sessions
+        when needed
+        """
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            session.close()
+            with self._lock:
+                self._created -= 1
@@ -0,0 +1,93 @@
+"""
+Single-flight coalescing of concurrent identical calls
+
+While a call for a key is in flight, further calls for the same key wait for
+it and share its result or exception instead of running again.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Hashable, Union
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Union[BaseException, None] = None
+
+
+class SingleFlight:
+    """
+    Registry of in-flight calls, usable from threads and from asyncio
+    coroutines. Calls are only coalesced while they run, finished results
+    are not kept.
+    """
+
+    def __init__(self) -> None:
+        self._calls = {}
+        self._lock = threading.Lock()
+        # In-flight tasks per running event loop
+        self._tasks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn unless a call for key is already in flight, in which case wait
+        for that call and return its result (or raise its exception)
+
+        Args:
+        ----------
+        key: Hashable
+            The key identical calls share, e.g. a normalized URL
+        fn: Callable
+            The function to run, taking no arguments
+
+        Returns:
+        ----------
+        Any: The return value of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.exception = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+            return call.result
+
+        call.done.wait()
+        if call.exception is not None:
+            raise call.exception
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of do, fn returns the awaitable to run. The call runs
+        in its own task, so a cancelled waiter does not cancel the others.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = self._tasks.setdefault(loop, {})
+
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = loop.create_task(fn())
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """
+        Return the number of calls currently running in threads
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,95 @@
+"""
+Building DataFrames from the <table> elements of parsed pages
+
+The rows of a table are walked once, collecting the header and the cell
+texts as lists, and the DataFrame is built from them in a single call
+instead of growing it one row or one column at a time.
+"""
+
+from typing import List, Tuple, Union
+
+import pandas as pd
+from bs4 import Tag
+
+
+def table_rows(
+    table: Tag, strip: bool = False, row_headers: bool = False
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    Return the header and the body rows of a table
+
+    Rows without td cells are header rows, the header is the last of them
+    before the first body row. The cells of a body row are its td cells,
+    or all its th and td cells in document order with row_headers.
+
+    Args:
+    ----------
+    table: Tag
+        The table, or any element holding its rows such as a tbody
+    strip: bool
+        Strip the whitespace around the texts
+    row_headers: bool
+        Keep the th cells of the body rows, e.g. a row title
+
+    Returns:
+    ----------
+    Tuple[List[str], List[List[str]]]: The header texts, empty if there
+        is no header row, and the cell texts of each body row
+    """
+    header, rows = [], []
+    for row in table.find_all("tr"):
+        cells = row.find_all(["th", "td"])
+        if not any(cell.name == "td" for cell in cells):
+            if not rows:
+                header = [_text(cell, strip) for cell in cells]
+            continue
+
+        rows.append(
+            [_text(cell, strip) for cell in cells if row_headers or cell.name == "td"]
+        )
+
+    return header, rows
+
+
+def read_table(
+    table: Tag,
+    columns: Union[List[str], None] = None,
+    strip: bool = False,
+    row_headers: bool = False,
+    index: Union[str, None] = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from a table, see table_rows
+
+    Args:
+    ----------
+    table: Tag
+        The table, or any element holding its rows such as a tbody
+    columns: Union[List[str], None]
+        The column names, by default the table header, or numbers if the
+        table has none. Cells past the last column are dropped when given.
+    strip: bool
+        Strip the whitespace around the texts
+    row_headers: bool
+        Keep the th cells of the body rows, e.g. a row title
+    index: Union[str, None]
+        The column to use as index
+
+    Returns:
+    ----------
+    pd.DataFrame: The body rows of the table
+    """
+    header, rows = table_rows(table, strip=strip, row_headers=row_headers)
+    if columns is not None:
+        header = columns
+        rows = [row[: len(columns)] for row in rows]
+
+    data_df = pd.DataFrame(rows, columns=header or None)
+    if index is not None:
+        data_df = data_df.set_index(index)
+
+    return data_df
+
+
+def _text(cell: Tag, strip: bool) -> str:
+    return cell.text.strip() if strip else cell.text
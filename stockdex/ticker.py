@@ -1,3 +1,5 @@
+from typing import Union
+
 from stockdex.config import VALID_SECURITY_TYPES
 from stockdex.digrin_interface import DigrinInterface
 from stockdex.finviz_interface import FinvizInterface
@@ -26,6 +28,7 @@ class Ticker(
         ticker: str = "",
         isin: str = "",
         security_type: VALID_SECURITY_TYPES = "stock",
+        endpoints: Union[dict, None] = None,
     ) -> None:
         """
         Initialize the Ticker class
@@ -35,6 +38,8 @@ class Ticker(
         isin (str): The ISIN of the etf
         security_type (str): The security type of the ticker
             default is "stock"
+        endpoints (dict): Base URLs overriding ENDPOINTS from config for this
+            ticker only, e.g. {"digrin": "http://localhost:8000/digrin"}
         """
 
         self.ticker = ticker
@@ -45,3 +50,6 @@ class Ticker(
             raise Exception("Please provide either a ticker or an ISIN")
 
         super().__init__(ticker=ticker, isin=isin, security_type=security_type)
+
+        if endpoints:
+            self.set_endpoints(endpoints)
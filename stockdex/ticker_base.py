@@ -2,19 +2,98 @@
 Base class for ticker objects to inherit from
 """
 
+import asyncio
+import hashlib
+import itertools
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Union
+from typing import Iterator, List, Tuple, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from curl_cffi import requests
 
-from stockdex.config import MACROTRENDS_BASE_URL, RESPONSE_TIMEOUT
-from stockdex.lib import get_user_agent
+from stockdex.cache import CachedResponse, ResponseCache, normalize_url
+from stockdex.circuit_breaker import CircuitBreaker, CircuitBreakers
+from stockdex.config import (
+    ASYNC_MAX_CLIENTS,
+    CACHE_TTL,
+    ENDPOINTS,
+    HTML_PARSER,
+    OFFLINE,
+    PARSED_PAGE_CACHE_BYTES,
+    RESPONSE_TIMEOUT,
+    SESSION_POOL_SIZE,
+)
+from stockdex.crumb import YahooCrumbManager
+from stockdex.exceptions import CacheMissError
+from stockdex.json_decoder import decode_response
+from stockdex.lib import get_data_source, get_user_agent
+from stockdex.metrics import RequestEvent, RequestStats
+from stockdex.rate_limiter import RateLimiter
+from stockdex.retry import RetryPolicy, get_retry_policy
+from stockdex.selenium_interface import selenium_interface
+from stockdex.session_pool import SessionPool
+from stockdex.singleflight import SingleFlight
+from stockdex.transport import Transport, get_transport_from_env
+
+
+class _Endpoint:
+    """
+    Descriptor returning the base URL of a data source, taken from the
+    ticker's endpoints overrides or else from ENDPOINTS in config
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def __get__(self, instance, owner) -> str:
+        endpoints = (owner if instance is None else instance).endpoints
+        return endpoints.get(self.source, ENDPOINTS[self.source])
+
+
+class _UrlNeeded(BaseException):
+    """
+    Raised instead of downloading while prefetch resolves the URLs a property
+    needs. A BaseException, so that properties catching Exception let it pass.
+    """
+
+    def __init__(self, *urls: str) -> None:
+        self.urls = list(urls)
+
+
+class _ResolvingSeleniumInterface:
+    """
+    Stand-in for selenium_interface while prefetch resolves URLs, rendered
+    pages are not prefetched
+    """
+
+    def __getattr__(self, name):
+        def render(*args, **kwargs):
+            raise _UrlNeeded()
+
+        return render
 
 
 class TickerBase:
-    session = requests.Session(impersonate="chrome110")
+    # Base URL overrides per data source, e.g. {"digrin": "http://localhost:8000"},
+    # sources missing here use ENDPOINTS from config
+    endpoints: dict = {}
+
+    yahoo_api_base_url = _Endpoint("yahoo_api")
+    fundamentals_base_url = _Endpoint("yahoo_fundamentals")
+    yahoo_web_base_url = _Endpoint("yahoo_web")
+    justetf_base_url = _Endpoint("justetf")
+    nasdaq_base_url = _Endpoint("nasdaq")
+    digrin_base_url = _Endpoint("digrin")
+    macrotrends_base_url = _Endpoint("macrotrends")
+    finviz_base_url = _Endpoint("finviz")
+
+    # Impersonating sessions shared by all tickers, one per concurrent request
+    session_pool: SessionPool = SessionPool()
     request_headers = {
         "User-Agent": get_user_agent(),
         "Accept": "application/json, text/javascript, */*; q=0.01",
@@ -23,75 +102,803 @@ class TickerBase:
         "Origin": "https://finance.yahoo.com",
         "Connection": "keep-alive",
     }
-    _yahoo_crumb: Union[str, None] = None
+    # Yahoo crumb and cookies shared by all tickers, pass a path to
+    # YahooCrumbManager to keep them across restarts
+    crumb_manager: YahooCrumbManager = YahooCrumbManager()
 
-    def _get_yahoo_crumb(self) -> str:
-        try:
-            self.session.get("https://fc.yahoo.com", timeout=10, allow_redirects=True)
-            response = self.session.get(
-                "https://query1.finance.yahoo.com/v1/test/getcrumb",
-                timeout=10,
-                allow_redirects=True,
+    # Opt-in persistent response cache, e.g. TickerBase.response_cache = ResponseCache()
+    response_cache: Union[ResponseCache, None] = None
+
+    # Offline mode: serve every page from the response cache, stale or not,
+    # and raise CacheMissError instead of touching the network
+    offline: bool = OFFLINE
+
+    # BeautifulSoup tree builder used by all scrapers, see make_soup
+    html_parser: str = HTML_PARSER
+
+    # One curl_cffi AsyncSession per running event loop, and the async
+    # generator closing it when the loop shuts down, see _get_async_session
+    _async_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def set_endpoints(self, endpoints: dict) -> None:
+        """
+        Point this ticker at other base URLs, e.g. those of a
+        stockdex.fake_server.FakeServer, leaving other tickers untouched
+
+        Args:
+        ----------
+        endpoints: dict
+            Base URL per data source, e.g. {"digrin": "http://localhost:8000"}
+        """
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown data sources: {sorted(unknown)}")
+
+        self.endpoints = {**self.endpoints, **endpoints}
+
+    def _data_source(self, url: str) -> Union[str, None]:
+        """
+        Return the data source of url, recognizing this ticker's endpoints
+        """
+        return get_data_source(url, self.endpoints)
+
+    @classmethod
+    async def _get_async_session(cls) -> requests.AsyncSession:
+        """
+        Return the AsyncSession of the running event loop, creating it if needed.
+        An AsyncSession is bound to the loop it is first used in, so sessions
+        are not shared between loops. The session is closed when the loop
+        shuts down its async generators, which asyncio.run does on exit.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in cls._async_sessions:
+            session = requests.AsyncSession(
+                impersonate="chrome110", max_clients=ASYNC_MAX_CLIENTS
             )
-            crumb = response.text.strip()
-            if response.status_code == 429 or "Too Many Requests" in crumb:
-                raise RuntimeError("Rate limited while getting crumb")
-            if crumb == "" or "<html>" in crumb:
-                raise RuntimeError("Invalid crumb received")
-            return crumb
-        except Exception as e:
-            raise RuntimeError(f"Error fetching Yahoo crumb: {e}")
+            # The loop only keeps a weak reference to its async generators
+            closer = cls._close_at_shutdown(session)
+            cls._async_sessions[loop] = (session, closer)
+            await closer.__anext__()
+        return cls._async_sessions[loop][0]
+
+    @classmethod
+    async def _close_at_shutdown(cls, session: requests.AsyncSession):
+        try:
+            yield
+        finally:
+            loop = asyncio.get_running_loop()
+            entry = cls._async_sessions.get(loop)
+            if entry is not None and entry[0] is session:
+                del cls._async_sessions[loop]
+            await session.close()
+
+    @classmethod
+    async def close_async_session(cls) -> None:
+        """
+        Close the AsyncSession of the running event loop, if it has one.
+        Only needed for loops that keep running, e.g. the one of a notebook.
+        """
+        entry = cls._async_sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+    # Per-host token buckets shared by all tickers, see RATE_LIMITS in config
+    rate_limiter: RateLimiter = RateLimiter()
+
+    # RetryPolicy overrides per data source, e.g. {"finviz": RetryPolicy(...)},
+    # sources missing here use the policies from RETRY_POLICIES in config
+    retry_policies: dict = {}
+
+    # Record/replay transport under the fetch layer, None to use the network.
+    # Set from the STOCKDEX_TRANSPORT environment variable, see stockdex.transport
+    transport: Union[Transport, None] = get_transport_from_env()
+
+    # Per-host circuit breakers, see CIRCUIT_BREAKERS in config
+    circuit_breakers: CircuitBreakers = CircuitBreakers()
+
+    # Callables receiving a stockdex.metrics.RequestEvent before and after
+    # every download, and the statistics aggregated from those events
+    before_request_hooks: list = []
+    after_request_hooks: list = []
+    request_stats: RequestStats = RequestStats()
+
+    # Identical requests in flight at the same time are downloaded only once
+    in_flight: SingleFlight = SingleFlight()
+
+    # The ticker whose property prefetch is evaluating in the current thread,
+    # see _resolve_url. Other threads using the same ticker are not affected.
+    _resolution = threading.local()
 
-    # Timestamp of last non-Yahoo request to throttle external API calls
-    _last_external_request_time: float = 0.0
-    _external_request_delay: float = 5.0  # seconds between non-Yahoo requests
+    # Guards the parsed pages of every instance, see _parse_page
+    _parsed_pages_lock = threading.Lock()
 
     def get_response(self, url: str) -> requests.Response:
+        """
+        Fetch a URL, serving it from the response cache when one is set
+        and the cached copy is younger than the data source's CACHE_TTL.
+        Concurrent calls for the same URL share a single download. In offline
+        mode every cached copy is served and a miss raises CacheMissError.
+
+        Args:
+        ----------
+        url: str
+            The URL to fetch
+
+        Returns:
+        ----------
+        requests.Response: The response, or a CachedResponse from the cache
+        """
+        prefetched = self.__dict__.get("_prefetched", {}).get(normalize_url(url))
+        if prefetched is not None:
+            return prefetched
+
+        key = self._cache_key(url)
+        cached = self._get_cached_response(key)
+        if cached is not None and (
+            self.offline or cached.is_fresh(CACHE_TTL[self._data_source(url)])
+        ):
+            self.request_stats.record_cache_hit(url, self._data_source(url))
+            return self._record(url, cached)
+        if self.offline:
+            raise CacheMissError(url)
+        if self._resolving():
+            raise _UrlNeeded(url)
+
+        def fetch() -> requests.Response:
+            response = self._download(url, self._conditional_headers(cached))
+            return self._record(url, self._store_response(key, response, cached))
+
+        return self.in_flight.do(normalize_url(url), fetch)
+
+    async def get_response_async(self, url: str) -> requests.Response:
+        """
+        Async counterpart of get_response, using the curl_cffi AsyncSession of
+        the running event loop. Throttling and retries sleep with asyncio.sleep,
+        so one event loop can drive many concurrent requests.
+
+        Args:
+        ----------
+        url: str
+            The URL to fetch
+
+        Returns:
+        ----------
+        requests.Response: The response, or a CachedResponse from the cache
+        """
+        prefetched = self.__dict__.get("_prefetched", {}).get(normalize_url(url))
+        if prefetched is not None:
+            return prefetched
+
+        key = self._cache_key(url)
+        cached = self._get_cached_response(key)
+        if cached is not None and (
+            self.offline or cached.is_fresh(CACHE_TTL[self._data_source(url)])
+        ):
+            self.request_stats.record_cache_hit(url, self._data_source(url))
+            return self._record(url, cached)
+        if self.offline:
+            raise CacheMissError(url)
+        if self._resolving():
+            raise _UrlNeeded(url)
+
+        async def fetch() -> requests.Response:
+            response = await self._download_async(
+                url, self._conditional_headers(cached)
+            )
+            return self._record(url, self._store_response(key, response, cached))
+
+        return await self.in_flight.do_async(normalize_url(url), fetch)
+
+    def _cache_key(self, url: str) -> Union[str, None]:
+        """
+        Return the response cache key of url, or None if it is not cached
+        """
+        if self.response_cache is None:
+            return None
+        if not self.offline and not CACHE_TTL.get(self._data_source(url), 0):
+            return None
+        return normalize_url(url)
+
+    def _get_cached_response(
+        self, key: Union[str, None]
+    ) -> Union[CachedResponse, None]:
+        """
+        Return the cached response stored under key, fresh or stale
+        """
+        if key is None:
+            return None
+        return self.response_cache.get(key)
+
+    @staticmethod
+    def _conditional_headers(cached: Union[CachedResponse, None]) -> dict:
+        """
+        Return the headers revalidating a stale cached response, so that the
+        server can answer 304 Not Modified instead of sending the body again
+        """
+        if cached is None:
+            return {}
+
+        headers = {}
+        if cached.headers.get("etag"):
+            headers["If-None-Match"] = cached.headers["etag"]
+        if cached.headers.get("last-modified"):
+            headers["If-Modified-Since"] = cached.headers["last-modified"]
+        return headers
+
+    def _store_response(
+        self,
+        key: Union[str, None],
+        response: requests.Response,
+        cached: Union[CachedResponse, None],
+    ) -> requests.Response:
+        """
+        Store a downloaded response in the response cache. A 304 answer to a
+        revalidation renews the cached copy and returns it instead.
+        """
+        if response.status_code == 304:
+            self.response_cache.touch(key, cached)
+            return cached
+
+        if key is not None:
+            self.response_cache.set(key, response)
+        return response
+
+    def _download(
+        self, url: str, extra_headers: Union[dict, None] = None
+    ) -> requests.Response:
+        if self.transport is not None and self.transport.replaying:
+            return self.transport.replay(url)
+
+        source = self._data_source(url)
+        breaker = self.circuit_breakers.get_breaker(url, source)
+        if breaker is not None:
+            breaker.allow()
+
+        event = RequestEvent(url, source)
+        self._before_request(event)
+        try:
+            response = self._download_attempts(url, extra_headers, event, breaker)
+        except BaseException as e:
+            self._after_request(event, e)
+            raise
+        self._after_request(event)
+        return response
+
+    def _download_attempts(
+        self,
+        url: str,
+        extra_headers: Union[dict, None],
+        event: RequestEvent,
+        breaker: Union[CircuitBreaker, None],
+    ) -> requests.Response:
+        is_yahoo = "yahoo.com" in url
+        headers = self.request_headers if is_yahoo else {"User-Agent": get_user_agent()}
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        crumb, cookies = None, None
+        crumb_refreshed = False
+
+        policy = self.get_retry_policy(url)
+        for attempt in itertools.count():
+            # Stop retrying once other requests opened the host's circuit
+            if attempt and breaker is not None:
+                breaker.check()
+            event.attempts = attempt + 1
+            if is_yahoo:
+                start = time.monotonic()
+                crumb, cookies = self.crumb_manager.get()
+                event.crumb_wait += time.monotonic() - start
+            event.throttle_wait += self.rate_limiter.acquire(url, event.source)
+            start = time.monotonic()
+            try:
+                with self.session_pool.session() as session:
+                    response = session.get(
+                        url,
+                        headers=headers,
+                        timeout=RESPONSE_TIMEOUT,
+                        params={"crumb": crumb} if is_yahoo else {},
+                        cookies=cookies,
+                    )
+            except Exception as e:
+                event.network_time += time.monotonic() - start
+                if breaker is not None:
+                    breaker.record(exception=e)
+                delay = policy.next_delay(attempt, exception=e)
+                if delay is None:
+                    raise
+            else:
+                event.network_time += time.monotonic() - start
+                event.add_response(response)
+                if breaker is not None:
+                    breaker.record(response.status_code)
+
+                # 304 only answers a conditional request, see _conditional_headers
+                if response.status_code == 200 or (
+                    response.status_code == 304 and extra_headers
+                ):
+                    response.retry_count = attempt
+                    return response
+
+                # Yahoo rejected the crumb, refresh it once and retry right away
+                if is_yahoo and response.status_code == 401 and not crumb_refreshed:
+                    self.crumb_manager.invalidate(crumb)
+                    crumb_refreshed = True
+                    continue
+
+                delay = policy.next_delay(attempt, response=response)
+                if delay is None:
+                    raise RuntimeError(
+                        f"Failed to fetch URL (status {response.status_code}) "
+                        f"after {attempt + 1} attempt(s): {url}"
+                    )
+
+            event.retry_wait += delay
+            time.sleep(delay)
+
+    async def _download_async(
+        self, url: str, extra_headers: Union[dict, None] = None
+    ) -> requests.Response:
+        if self.transport is not None and self.transport.replaying:
+            return await self.transport.replay_async(url)
+
+        source = self._data_source(url)
+        breaker = self.circuit_breakers.get_breaker(url, source)
+        if breaker is not None:
+            breaker.allow()
+
+        event = RequestEvent(url, source)
+        self._before_request(event)
+        try:
+            response = await self._download_attempts_async(
+                url, extra_headers, event, breaker
+            )
+        except BaseException as e:
+            self._after_request(event, e)
+            raise
+        self._after_request(event)
+        return response
+
+    async def _download_attempts_async(
+        self,
+        url: str,
+        extra_headers: Union[dict, None],
+        event: RequestEvent,
+        breaker: Union[CircuitBreaker, None],
+    ) -> requests.Response:
+        session = await self._get_async_session()
         is_yahoo = "yahoo.com" in url
+        headers = self.request_headers if is_yahoo else {"User-Agent": get_user_agent()}
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        crumb, cookies = None, None
+        crumb_refreshed = False
 
-        if is_yahoo:
-            if self._yahoo_crumb is None:
-                self._yahoo_crumb = self._get_yahoo_crumb()
-            params = {"crumb": self._yahoo_crumb}
-            headers = self.request_headers
-        else:
-            # Throttle non-Yahoo requests to avoid rate limiting
-            elapsed = time.time() - TickerBase._last_external_request_time
-            if elapsed < self._external_request_delay:
-                time.sleep(self._external_request_delay - elapsed)
-            params = {}
-            headers = {"User-Agent": get_user_agent()}
-
-        response = self.session.get(
-            url,
-            headers=headers,
-            timeout=RESPONSE_TIMEOUT,
-            params=params,
-        )
-
-        if not is_yahoo:
-            TickerBase._last_external_request_time = time.time()
-
-        if response.status_code == 200:
-            return response
-
-        if response.status_code in (429, 403):
-            for _ in range(5):
-                time.sleep(10)
-                response = self.session.get(
+        policy = self.get_retry_policy(url)
+        for attempt in itertools.count():
+            # Stop retrying once other requests opened the host's circuit
+            if attempt and breaker is not None:
+                breaker.check()
+            event.attempts = attempt + 1
+            if is_yahoo:
+                start = time.monotonic()
+                crumb, cookies = await self.crumb_manager.get_async()
+                event.crumb_wait += time.monotonic() - start
+            event.throttle_wait += await self.rate_limiter.acquire_async(
+                url, event.source
+            )
+            start = time.monotonic()
+            try:
+                response = await session.get(
                     url,
                     headers=headers,
                     timeout=RESPONSE_TIMEOUT,
-                    params=params,
+                    params={"crumb": crumb} if is_yahoo else {},
+                    cookies=cookies,
                 )
-                if not is_yahoo:
-                    TickerBase._last_external_request_time = time.time()
-                if response.status_code == 200:
+            except Exception as e:
+                event.network_time += time.monotonic() - start
+                if breaker is not None:
+                    breaker.record(exception=e)
+                delay = policy.next_delay(attempt, exception=e)
+                if delay is None:
+                    raise
+            else:
+                event.network_time += time.monotonic() - start
+                event.add_response(response)
+                if breaker is not None:
+                    breaker.record(response.status_code)
+
+                # 304 only answers a conditional request, see _conditional_headers
+                if response.status_code == 200 or (
+                    response.status_code == 304 and extra_headers
+                ):
+                    response.retry_count = attempt
                     return response
 
-        raise RuntimeError(
-            f"Failed to fetch URL (status {response.status_code}): {url}"
-        )
+                # Yahoo rejected the crumb, refresh it once and retry right away
+                if is_yahoo and response.status_code == 401 and not crumb_refreshed:
+                    self.crumb_manager.invalidate(crumb)
+                    crumb_refreshed = True
+                    continue
+
+                delay = policy.next_delay(attempt, response=response)
+                if delay is None:
+                    raise RuntimeError(
+                        f"Failed to fetch URL (status {response.status_code}) "
+                        f"after {attempt + 1} attempt(s): {url}"
+                    )
+
+            event.retry_wait += delay
+            await asyncio.sleep(delay)
+
+    def _before_request(self, event: RequestEvent) -> None:
+        for hook in self.before_request_hooks:
+            hook(event)
+
+    def _after_request(
+        self, event: RequestEvent, error: Union[BaseException, None] = None
+    ) -> None:
+        event.finish(error)
+        self.request_stats.record(event)
+        for hook in self.after_request_hooks:
+            hook(event)
+
+    def _recording(self) -> bool:
+        return self.transport is not None and self.transport.recording
+
+    def _record(self, url: str, response: requests.Response) -> requests.Response:
+        """
+        Save a response to the cassette when the transport is recording,
+        whether it was downloaded, revalidated or served from the cache
+        """
+        if self._recording() and response.status_code == 200:
+            self.transport.record(url, response)
+        return response
+
+    def get_retry_policy(self, url: str) -> RetryPolicy:
+        """
+        Return the retry policy of the data source url belongs to
+        """
+        source = self._data_source(url)
+        if source in self.retry_policies:
+            return self.retry_policies[source]
+        return get_retry_policy(source)
+
+    def get_json(self, url: str):
+        """
+        Fetch url and return its decoded JSON body
+
+        The body is decoded once per response, with the decoder chosen in
+        stockdex.json_decoder. The result is shared, do not modify it.
+
+        Args:
+        ----------
+        url: str
+            The URL of the JSON document
+
+        Returns:
+        ----------
+        The decoded body
+        """
+        return decode_response(self.get_response(url))
+
+    async def get_json_async(self, url: str):
+        """
+        Async counterpart of get_json
+        """
+        return decode_response(await self.get_response_async(url))
+
+    def get_raw_page(self, url: str) -> requests.Response:
+        """
+        Fetch a page once per ticker instance without parsing it, for
+        extractors reading the raw bytes. get_page shares the download.
+
+        Args:
+        ----------
+        url: str
+            The URL of the page
+
+        Returns:
+        ----------
+        requests.Response: The response, or a CachedResponse from the cache
+        """
+        raw_pages = self.__dict__.setdefault("_raw_pages", {})
+        if url not in raw_pages:
+            raw_pages[url] = self.get_response(url)
+
+        return raw_pages[url]
+
+    async def get_raw_page_async(self, url: str) -> requests.Response:
+        """
+        Async counterpart of get_raw_page, sharing the same per-instance memo
+        """
+        raw_pages = self.__dict__.setdefault("_raw_pages", {})
+        if url not in raw_pages:
+            raw_pages[url] = await self.get_response_async(url)
+
+        return raw_pages[url]
+
+    def get_raw_pages(self, urls: List[str]) -> List[requests.Response]:
+        """
+        Fetch several pages concurrently through get_raw_page. While prefetch
+        resolves URLs, every missing page is reported at once instead.
+
+        Args:
+        ----------
+        urls: List[str]
+            The URLs of the pages
+
+        Returns:
+        ----------
+        List[requests.Response]: The responses, in the order of urls
+        """
+        if self._resolving():
+            # Pool threads would not see the resolution, and would download
+            needed = []
+            for url in urls:
+                try:
+                    self.get_raw_page(url)
+                except _UrlNeeded as e:
+                    needed.extend(e.urls)
+            if needed:
+                raise _UrlNeeded(*needed)
+            return [self.get_raw_page(url) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=SESSION_POOL_SIZE) as pool:
+            return list(pool.map(self.get_raw_page, urls))
+
+    def get_page(
+        self, url: str, parse_only: Union[SoupStrainer, None] = None
+    ) -> Tuple[requests.Response, BeautifulSoup]:
+        """
+        Fetch and parse a page once per ticker instance
+
+        The raw response and the parsed document are memoized on the instance,
+        so every table read from the same page costs one request and one parse.
+
+        Args:
+        ----------
+        url: str
+            The URL of the page
+        parse_only: SoupStrainer
+            The regions of the page the caller reads, only those are parsed.
+            Use module level strainers, as the memo is keyed by the strainer
+            object. A fully parsed page in the memo serves any region.
+
+        Returns:
+        ----------
+        Tuple[requests.Response, BeautifulSoup]: The response and the parsed page
+        """
+        page = self._memoized_page(url, parse_only)
+        if page is None:
+            response = self.get_raw_page(url)
+            page = (response, self._parse_page(response, parse_only))
+            self._page_memo[(url, parse_only)] = page
+
+        return page
+
+    async def get_page_async(
+        self, url: str, parse_only: Union[SoupStrainer, None] = None
+    ) -> Tuple[requests.Response, BeautifulSoup]:
+        """
+        Async counterpart of get_page, sharing the same per-instance memo.
+        Awaiting it for a page makes the properties reading that page return
+        without touching the network.
+        """
+        page = self._memoized_page(url, parse_only)
+        if page is None:
+            response = await self.get_raw_page_async(url)
+            page = (response, self._parse_page(response, parse_only))
+            self._page_memo[(url, parse_only)] = page
+
+        return page
+
+    @property
+    def _page_memo(self) -> dict:
+        # Parsed pages of this instance by URL and strainer, see get_page
+        return self.__dict__.setdefault("_page_memo", {})
+
+    def _memoized_page(
+        self, url: str, parse_only: Union[SoupStrainer, None]
+    ) -> Union[Tuple[requests.Response, BeautifulSoup], None]:
+        page_memo = self._page_memo
+        return page_memo.get((url, parse_only)) or page_memo.get((url, None))
+
+    def _parse_page(
+        self,
+        response: requests.Response,
+        parse_only: Union[SoupStrainer, None] = None,
+    ) -> BeautifulSoup:
+        """
+        Parse a page, reusing the parsed document of an earlier page of this
+        ticker with the same body, e.g. a cached page the server revalidated
+        with 304. The most recently parsed pages are kept up to
+        PARSED_PAGE_CACHE_BYTES of page bodies.
+        """
+        content = response.content
+        key = (self.html_parser, parse_only, hashlib.sha1(content).hexdigest())
+        parsed_pages = self._parsed_pages
+        with TickerBase._parsed_pages_lock:
+            if key in parsed_pages:
+                parsed_pages.move_to_end(key)
+                return parsed_pages[key][0]
+
+        soup = self.make_soup(content, parse_only)
+        with TickerBase._parsed_pages_lock:
+            parsed_pages[key] = (soup, len(content))
+            size = sum(length for _, length in parsed_pages.values())
+            while size > PARSED_PAGE_CACHE_BYTES:
+                _, (_, length) = parsed_pages.popitem(last=False)
+                size -= length
+        return soup
+
+    @property
+    def _parsed_pages(self) -> OrderedDict:
+        # (soup, body size) of the pages parsed by this instance by tree
+        # builder, strainer and body hash, kept by clear_page_memo
+        return self.__dict__.setdefault("_parsed_pages", OrderedDict())
+
+    def make_soup(
+        self,
+        markup: Union[bytes, str],
+        parse_only: Union[SoupStrainer, None] = None,
+    ) -> BeautifulSoup:
+        """
+        Parse HTML with the tree builder set by html_parser
+
+        Args:
+        ----------
+        markup: Union[bytes, str]
+            The HTML to parse
+        parse_only: SoupStrainer
+            Build the tree only for the elements matching the strainer
+
+        Returns:
+        ----------
+        BeautifulSoup: The parsed document
+        """
+        return BeautifulSoup(markup, self.html_parser, parse_only=parse_only)
+
+    def get_soup(
+        self, url: str, parse_only: Union[SoupStrainer, None] = None
+    ) -> BeautifulSoup:
+        """
+        Return the parsed page for url, see get_page
+        """
+        return self.get_page(url, parse_only)[1]
+
+    def _get_selenium_interface(
+        self, use_custom_user_agent: bool = False
+    ) -> selenium_interface:
+        """
+        Return the selenium_interface rendering pages for this ticker, built
+        on first use. The ticker's transport, response cache, offline flag,
+        tree builder and endpoints are handed over on every call, so that changing them on
+        the ticker also applies to rendered pages.
+        """
+        if self._resolving():
+            # Rendered pages are not prefetched
+            return _ResolvingSeleniumInterface()
+
+        if not hasattr(self, "selenium_interface"):
+            self.selenium_interface = selenium_interface(
+                use_custom_user_agent=use_custom_user_agent
+            )
+
+        renderer = self.selenium_interface
+        renderer.transport = self.transport
+        renderer.response_cache = self.response_cache
+        renderer.offline = self.offline
+        renderer.html_parser = self.html_parser
+        renderer.endpoints = self.endpoints
+        return renderer
+
+    def clear_page_memo(self) -> None:
+        """
+        Drop the pages memoized by get_page, get_raw_page and prefetch so they
+        are fetched again
+        """
+        self.__dict__.pop("_page_memo", None)
+        self.__dict__.pop("_raw_pages", None)
+        self.__dict__.pop("_prefetched", None)
+
+    def prefetch(self, names: List[str]) -> None:
+        """
+        Download the pages that properties need concurrently, so that reading
+        the properties afterwards does not touch the network
+
+        The URLs are found by evaluating each property with downloads
+        intercepted, so they never drift from the properties themselves.
+        Properties sharing a page (e.g. the six yahoo_web analysis tables)
+        cost one download. Pages rendered with Selenium are not prefetched.
+
+        Args:
+        ----------
+        names: List[str]
+            Names of properties, or of methods callable without arguments,
+            e.g. ["yahoo_web_summary", "digrin_dividend"]
+        """
+        with ThreadPoolExecutor(max_workers=SESSION_POOL_SIZE) as pool:
+            for urls in self._prefetch_rounds(names):
+                self._store_prefetched(urls, pool.map(self._try_get_response, urls))
+
+    async def prefetch_async(self, names: List[str]) -> None:
+        """
+        Async counterpart of prefetch, downloading in the running event loop
+        """
+
+        async def try_get_response(url: str):
+            try:
+                return await self.get_response_async(url)
+            except Exception as e:
+                return e
+
+        for urls in self._prefetch_rounds(names):
+            responses = await asyncio.gather(*(try_get_response(url) for url in urls))
+            self._store_prefetched(urls, responses)
+
+    def _try_get_response(self, url: str):
+        try:
+            return self.get_response(url)
+        except Exception as e:
+            return e
+
+    def _store_prefetched(self, urls: List[str], responses) -> None:
+        # Failed downloads are left out, reading the property raises the error
+        prefetched = self.__dict__.setdefault("_prefetched", {})
+        for url, response in zip(urls, responses):
+            if not isinstance(response, Exception):
+                prefetched[normalize_url(url)] = response
+
+    def _prefetch_rounds(self, names: List[str]) -> Iterator[List[str]]:
+        """
+        Yield the distinct URLs still needed by the properties, round by round,
+        as a page may only be known once an earlier one was read (e.g. the
+        Macrotrends slug)
+        """
+        for name in names:
+            if not hasattr(type(self), name):
+                raise AttributeError(f"{type(self).__name__} has no {name!r}")
+
+        pending, attempted = list(names), set()
+        while pending:
+            needed = {}
+            for name in pending:
+                for url in self._resolve_url(name):
+                    if url not in attempted:
+                        needed.setdefault(url, []).append(name)
+            if not needed:
+                return
+
+            yield list(needed)
+            attempted.update(needed)
+            pending = list(dict.fromkeys(n for names in needed.values() for n in names))
+
+    def _resolve_url(self, name: str) -> List[str]:
+        """
+        Return the URLs property name would download next, empty if it can be
+        read without downloading
+        """
+        TickerBase._resolution.ticker = self
+        try:
+            value = getattr(self, name)
+            if callable(value):
+                value()
+        except _UrlNeeded as e:
+            return e.urls
+        except Exception:
+            # The property fails for another reason, reading it will tell
+            return []
+        finally:
+            TickerBase._resolution.ticker = None
+        return []
+
+    def _resolving(self) -> bool:
+        """
+        Whether prefetch is evaluating a property of this ticker in the
+        current thread, downloads then raise _UrlNeeded instead
+        """
+        return getattr(TickerBase._resolution, "ticker", None) is self
 
     def find_parent_by_text(
         self,
@@ -137,7 +944,7 @@ class TickerBase:
         :param ticker: The stock ticker symbol
         :return: The company slug, e.g. "BAC" -> "bank-of-america"
         """
-        url = f"{MACROTRENDS_BASE_URL}/{ticker}/TBD/income-statement"
+        url = f"{self.macrotrends_base_url}/{ticker}/TBD/income-statement"
         response = self.get_response(url)
         company_slug = response.url.split("/")[-2]
 
@@ -0,0 +1,181 @@
+"""
+Record/replay transport for offline runs and deterministic benchmarks
+
+In "record" mode every page downloaded by TickerBase.get_response or
+rendered by selenium_interface is written to a cassette directory. In
+"replay" mode the pages are served from that directory without touching the
+network, optionally after an injected latency. "network" mode passes every
+request through, as if no transport was set.
+
+Example:
+----------
+>>> TickerBase.transport = Transport("tests/cassettes", mode="record")
+>>> Ticker(ticker="AAPL").yahoo_web_summary
+>>> TickerBase.transport = Transport("tests/cassettes", mode="replay")
+>>> Ticker(ticker="AAPL").yahoo_web_summary  # served from tests/cassettes
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Iterator, Union
+
+from stockdex.cache import CachedResponse, normalize_url
+
+TRANSPORT_MODES = ("network", "record", "replay")
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode for a request that was never recorded
+    """
+
+
+class Transport:
+    """
+    Records responses to, or replays them from, a cassette directory
+
+    Every request is stored as two files named after the hash of its
+    normalized URL, "<hash>.json" with the URL, status and headers and
+    "<hash>.body" with the raw body.
+
+    Args:
+    ----------
+    directory: str
+        The cassette directory, created when recording
+    mode: str
+        One of "network", "record" or "replay"
+    latency: float
+        Seconds to wait before serving each replayed response, to simulate
+        the network in benchmarks
+    """
+
+    def __init__(self, directory: str, mode: str = "replay", latency: float = 0.0):
+        if mode not in TRANSPORT_MODES:
+            raise ValueError(f"mode must be one of {TRANSPORT_MODES}, got {mode!r}")
+
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _path(self, url: str, variant: str = "") -> str:
+        digest = hashlib.sha1(f"{normalize_url(url)} {variant}".encode()).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def record(self, url: str, response, variant: str = "") -> None:
+        """
+        Save a response to the cassette
+
+        Args:
+        ----------
+        url: str
+            The requested URL
+        response: requests.Response
+            The response, anything with status_code, headers and content
+        variant: str
+            Distinguishes different requests for the same URL, e.g. the
+            button clicked in a Selenium session
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(url, variant)
+
+        with open(f"{path}.body", "wb") as file:
+            file.write(response.content)
+        with open(f"{path}.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "url": url,
+                    # The URL after redirects, e.g. Macrotrends' slug redirect
+                    "final_url": str(getattr(response, "url", None) or url),
+                    "variant": variant,
+                    "status_code": response.status_code,
+                    "headers": {
+                        k.lower(): v for k, v in dict(response.headers).items()
+                    },
+                },
+                file,
+                indent=2,
+            )
+
+    def load(self, url: str, variant: str = "") -> CachedResponse:
+        """
+        Read a recorded response without the injected latency
+
+        Raises:
+        ----------
+        CassetteMissError: If the request was never recorded
+        """
+        path = self._path(url, variant)
+        try:
+            with open(f"{path}.json", encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(f"{path}.body", "rb") as file:
+                content = file.read()
+        except FileNotFoundError:
+            raise CassetteMissError(
+                f"No recorded response for {url} in {self.directory}"
+            )
+
+        return CachedResponse(
+            url=meta.get("final_url", meta["url"]),
+            status_code=meta["status_code"],
+            content=content,
+            headers=meta["headers"],
+        )
+
+    def recordings(self) -> Iterator[dict]:
+        """
+        Yield the metadata of every recorded response, with the path of its
+        body under "body_path"
+        """
+        if not os.path.isdir(self.directory):
+            return
+
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name[: -len(".json")])
+                with open(f"{path}.json", encoding="utf-8") as file:
+                    yield {**json.load(file), "body_path": f"{path}.body"}
+
+    def replay(self, url: str, variant: str = "") -> CachedResponse:
+        """
+        Serve a recorded response after the injected latency, see load
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        return self.load(url, variant)
+
+    async def replay_async(self, url: str, variant: str = "") -> CachedResponse:
+        """
+        Async counterpart of replay
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.load(url, variant)
+
+
+def get_transport_from_env() -> Union[Transport, None]:
+    """
+    Build a transport from the STOCKDEX_TRANSPORT ("record" or "replay"),
+    STOCKDEX_CASSETTE_DIR and STOCKDEX_REPLAY_LATENCY environment variables,
+    or return None if STOCKDEX_TRANSPORT is not set
+    """
+    mode = os.environ.get("STOCKDEX_TRANSPORT")
+    if not mode or mode == "network":
+        return None
+
+    return Transport(
+        os.environ.get("STOCKDEX_CASSETTE_DIR", "cassettes"),
+        mode=mode,
+        latency=float(os.environ.get("STOCKDEX_REPLAY_LATENCY", 0)),
+    )
@@ -12,7 +12,8 @@ import plotly.express as px
 from stockdex import config
 from stockdex.config import VALID_DATA_SOURCES, VALID_SECURITY_TYPES
 from stockdex.exceptions import FieldNotExists
-from stockdex.lib import plot_dataframe
+from stockdex.json_decoder import decode_response
+from stockdex.lib import day_timestamp, plot_dataframe
 from stockdex.ticker_base import TickerBase
 
 
@@ -62,38 +63,69 @@ class YahooAPI(TickerBase):
         valid values are "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
 
         dataGranularity (str): The granularity of the data to retrieve (interval)
-        valid values are "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo""  # noqa: E501
+        valid values are "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d",
+        "1wk", "1mo", "3mo"
 
         Returns:
         ----------------
         pd.DataFrame: The price data
         """
 
-        url = f"{config.BASE_URL}/chart/{self.ticker}?range={range}&interval={dataGranularity}"
+        url = f"{self.yahoo_api_base_url}/chart/{self.ticker}"
+        url += f"?range={range}&interval={dataGranularity}"
         response = self.get_response(url)
 
-        meta = response.json()["chart"]["result"][0]["meta"]
+        return self._price_dataframe(response)
+
+    async def yahoo_api_price_async(
+        self,
+        range: Literal[
+            "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
+        ] = "1d",
+        dataGranularity: Literal[
+            "1m",
+            "2m",
+            "5m",
+            "15m",
+            "30m",
+            "60m",
+            "90m",
+            "1h",
+            "1d",
+            "5d",
+            "1wk",
+            "1mo",
+            "3mo",
+        ] = "1m",
+    ) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_price, taking the same arguments
+        """
+
+        url = f"{self.yahoo_api_base_url}/chart/{self.ticker}"
+        url += f"?range={range}&interval={dataGranularity}"
+        response = await self.get_response_async(url)
+
+        return self._price_dataframe(response)
+
+    def _price_dataframe(self, response) -> pd.DataFrame:
+        """
+        Build the price dataframe from a chart API response
+        """
+        result = decode_response(response)["chart"]["result"][0]
+        meta = result["meta"]
         currency = meta["currency"]
         exchangeTimezoneName = meta["exchangeTimezoneName"]
         timezone = meta["timezone"]
         exchangeName = meta["exchangeName"]
         instrumentType = meta["instrumentType"]
 
-        timestamp = (
-            response.json()["chart"]["result"][0]["timestamp"]
-            if "timestamp" in response.json()["chart"]["result"][0]
-            else None
-        )
+        timestamp = result.get("timestamp")
         timestamp = (
             pd.to_datetime(timestamp, unit="s") if timestamp else ["Data Not Available"]
         )
 
-        indicators = (
-            response.json()
-            .get("chart", {})
-            .get("result", [{}])[0]
-            .get("indicators", {})
-        )
+        indicators = result.get("indicators", {})
 
         quote = indicators.get("quote", [{}])[0]  # Get the first item safely
 
@@ -125,16 +157,33 @@ class YahooAPI(TickerBase):
         Get the current trading period for the stock
         """
 
-        url = f"{config.BASE_URL}/chart/{self.ticker}"
+        url = f"{self.yahoo_api_base_url}/chart/{self.ticker}"
         response = self.get_response(url)
 
-        currentTradingPeriod = response.json()["chart"]["result"][0]["meta"][
+        return self._current_trading_period_dataframe(response)
+
+    async def yahoo_api_current_trading_period_async(self) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_current_trading_period
+        """
+
+        url = f"{self.yahoo_api_base_url}/chart/{self.ticker}"
+        response = await self.get_response_async(url)
+
+        return self._current_trading_period_dataframe(response)
+
+    def _current_trading_period_dataframe(self, response) -> pd.DataFrame:
+        """
+        Build the current trading period dataframe from a chart API response
+        """
+        currentTradingPeriod = decode_response(response)["chart"]["result"][0]["meta"][
             "currentTradingPeriod"
         ]
 
-        pre = currentTradingPeriod["pre"]
-        regular = currentTradingPeriod["regular"]
-        post = currentTradingPeriod["post"]
+        # Copies, the decoded response is shared with other readers
+        pre = dict(currentTradingPeriod["pre"])
+        regular = dict(currentTradingPeriod["regular"])
+        post = dict(currentTradingPeriod["post"])
 
         # convert timestamps to datetime
         pre["start"] = pd.to_datetime(pre["start"], unit="s")
@@ -184,9 +233,25 @@ class YahooAPI(TickerBase):
         """
         url = self.build_url(frequency, period1, period2, "income_statement")
 
-        response = self.get_response(url).json()["timeseries"]["result"]
+        response = self.get_json(url)
+
+        return self._statement_dataframe(response, format)
+
+    async def yahoo_api_income_statement_async(
+        self,
+        frequency: Literal["annual", "quarterly"] = "annual",
+        format: Literal["fmt", "raw"] = "fmt",
+        period1: datetime = five_years_ago,
+        period2: datetime = today,
+    ) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_income_statement, taking the same arguments
+        """
+        url = self.build_url(frequency, period1, period2, "income_statement")
+
+        response = await self.get_json_async(url)
 
-        return self.extract_dataframe(response, format)
+        return self._statement_dataframe(response, format)
 
     def yahoo_api_cash_flow(
         self,
@@ -220,9 +285,25 @@ class YahooAPI(TickerBase):
         """
         url = self.build_url(frequency, period1, period2, "cash_flow")
 
-        response = self.get_response(url).json()["timeseries"]["result"]
+        response = self.get_json(url)
 
-        return self.extract_dataframe(response, format)
+        return self._statement_dataframe(response, format)
+
+    async def yahoo_api_cash_flow_async(
+        self,
+        frequency: Literal["annual", "quarterly"] = "annual",
+        format: Literal["fmt", "raw"] = "fmt",
+        period1: datetime = five_years_ago,
+        period2: datetime = today,
+    ) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_cash_flow, taking the same arguments
+        """
+        url = self.build_url(frequency, period1, period2, "cash_flow")
+
+        response = await self.get_json_async(url)
+
+        return self._statement_dataframe(response, format)
 
     def yahoo_api_balance_sheet(
         self,
@@ -256,9 +337,25 @@ class YahooAPI(TickerBase):
         """
         url = self.build_url(frequency, period1, period2, "balance_sheet")
 
-        response = self.get_response(url).json()["timeseries"]["result"]
+        response = self.get_json(url)
 
-        return self.extract_dataframe(response, format)
+        return self._statement_dataframe(response, format)
+
+    async def yahoo_api_balance_sheet_async(
+        self,
+        frequency: Literal["annual", "quarterly"] = "annual",
+        format: Literal["fmt", "raw"] = "fmt",
+        period1: datetime = five_years_ago,
+        period2: datetime = today,
+    ) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_balance_sheet, taking the same arguments
+        """
+        url = self.build_url(frequency, period1, period2, "balance_sheet")
+
+        response = await self.get_json_async(url)
+
+        return self._statement_dataframe(response, format)
 
     def yahoo_api_financials(
         self,
@@ -292,9 +389,31 @@ class YahooAPI(TickerBase):
         """
         url = self.build_url(frequency, period1, period2, "financials")
 
-        response = self.get_response(url).json()["timeseries"]["result"]
+        response = self.get_json(url)
+
+        return self._statement_dataframe(response, format)
+
+    async def yahoo_api_financials_async(
+        self,
+        frequency: Literal["annual", "quarterly"] = "annual",
+        format: Literal["fmt", "raw"] = "fmt",
+        period1: datetime = five_years_ago,
+        period2: datetime = today,
+    ) -> pd.DataFrame:
+        """
+        Async variant of yahoo_api_financials, taking the same arguments
+        """
+        url = self.build_url(frequency, period1, period2, "financials")
+
+        response = await self.get_json_async(url)
+
+        return self._statement_dataframe(response, format)
 
-        return self.extract_dataframe(response, format)
+    def _statement_dataframe(self, response: dict, format: str) -> pd.DataFrame:
+        """
+        Build a statement dataframe from a fundamentals timeseries API response
+        """
+        return self.extract_dataframe(response["timeseries"]["result"], format)
 
     def build_url(
         self,
@@ -325,15 +444,16 @@ class YahooAPI(TickerBase):
         ----------------
         str: The URL to retrieve the data from
         """
-        # convert period1 and period2 to timestamps
-        period1 = int(pd.Timestamp(period1).timestamp())
-        period2 = int(pd.Timestamp(period2).timestamp())
+        # convert period1 and period2 to timestamps, whole days so that the
+        # URL does not change from one call to the next
+        period1 = day_timestamp(period1)
+        period2 = day_timestamp(period2, end=True)
 
         columns = ",".join(getattr(config, f"{desired_entity.upper()}_COLUMNS"))
 
         columns = ",".join([f"{frequency}{i}" for i in columns.split(",")])
 
-        url = f"{config.FUNDAMENTALS_BASE_URL}/{self.ticker}/?symbol={self.ticker}"
+        url = f"{self.fundamentals_base_url}/{self.ticker}/?symbol={self.ticker}"
         url += f"&type={columns}"
         url += f"&period1={period1}&period2={period2}"
         return url
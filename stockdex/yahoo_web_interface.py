@@ -2,21 +2,25 @@
 Module for fetching data from Yahoo Finance website
 """
 
+import asyncio
 import re
 from datetime import datetime
+from typing import Any, Dict, List, Tuple, Union
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer, Tag
 
 from stockdex.config import (
     BALANCE_SHEET_COLUMNS,
     CASH_FLOW_COLUMNS,
-    FUNDAMENTALS_BASE_URL,
     INCOME_STATEMENT_COLUMNS,
     VALID_SECURITY_TYPES,
-    YAHOO_WEB_BASE_URL,
 )
-from stockdex.lib import check_security_type
+from stockdex.exceptions import CacheMissError, NoDataError
+from stockdex.extractors import find_json_scripts
+from stockdex.json_decoder import decode
+from stockdex.lib import check_security_type, day_timestamp
+from stockdex.tables import read_table, table_rows
 from stockdex.ticker_base import TickerBase
 
 # Map URL path suffixes to their corresponding config column lists
@@ -26,6 +30,316 @@ _STATEMENT_TYPE_MAP = {
     "financials": INCOME_STATEMENT_COLUMNS,
 }
 
+# Regions of the pages read by the scrapers, only these are parsed
+_PROFILE_SECTIONS = SoupStrainer(
+    "section",
+    {"data-testid": ["description", "key-executives", "corporate-governance"]},
+)
+# Tables of the analysis page by the data-testid of their section
+_ANALYSIS_TABLES = (
+    "earningsEstimate",
+    "revenueEstimate",
+    "earningsHistory",
+    "epsTrend",
+    "epsRevisions",
+    "growthEstimate",
+)
+_ANALYSIS_SECTIONS = SoupStrainer("section", {"data-testid": list(_ANALYSIS_TABLES)})
+
+# Rows of the major holders table by majorHoldersBreakdown field
+_MAJOR_HOLDERS = {
+    "insidersPercentHeld": "% of Shares Held by All Insider",
+    "institutionsPercentHeld": "% of Shares Held by Institutions",
+    "institutionsFloatPercentHeld": "% of Float Held by Institutions",
+    "institutionsCount": "Number of Institutions Holding Shares",
+}
+# Tables of the holders page by the data-testid of their section, and the
+# quoteSummary module each is read from first
+_HOLDERS_TABLES = {
+    "holders-major-holders-table": "majorHoldersBreakdown",
+    "holders-top-institutional-holders": "institutionOwnership",
+    "holders-top-mutual-fund-holders": "fundOwnership",
+}
+_HOLDERS_SECTIONS = SoupStrainer("section", {"data-testid": list(_HOLDERS_TABLES)})
+_HOLDERS_COLUMNS = ["holder", "shares", "date_reported", "percentage", "value"]
+# Multipliers of the suffixes of abbreviated numbers, e.g. 180.39M
+_MAGNITUDES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+_HOLDERS_NUMBERS = {"shares": "float64", "percentage": "float64", "value": "float64"}
+# Rows of the valuation measures table by timeseries type, without the
+# "trailing" / "quarterly" prefix
+_VALUATION_MEASURES = {
+    "MarketCap": "Market Cap",
+    "EnterpriseValue": "Enterprise Value",
+    "PeRatio": "Trailing P/E",
+    "ForwardPeRatio": "Forward P/E",
+    "PegRatio": "PEG Ratio (5yr expected)",
+    "PsRatio": "Price/Sales",
+    "PbRatio": "Price/Book",
+    "EnterprisesValueRevenueRatio": "Enterprise Value/Revenue",
+    "EnterprisesValueEBITDARatio": "Enterprise Value/EBITDA",
+}
+
+# Rows of the summary table, named as the data-field of the page value
+# showing them, by kind ("number", "date", "text" or "range" for two
+# numbers such as a low and a high), the quoteSummary modules to read them
+# from in order and the path of the field, or the two fields of a range
+_SUMMARY_FIELDS = {
+    "regularMarketPrice": ("number", ("price",), "regularMarketPrice"),
+    "regularMarketChange": ("number", ("price",), "regularMarketChange"),
+    "regularMarketChangePercent": ("number", ("price",), "regularMarketChangePercent"),
+    "regularMarketTime": ("date", ("price",), "regularMarketTime"),
+    "marketState": ("text", ("price",), "marketState"),
+    "preMarketPrice": ("number", ("price",), "preMarketPrice"),
+    "preMarketChange": ("number", ("price",), "preMarketChange"),
+    "preMarketChangePercent": ("number", ("price",), "preMarketChangePercent"),
+    "preMarketTime": ("date", ("price",), "preMarketTime"),
+    "postMarketPrice": ("number", ("price",), "postMarketPrice"),
+    "postMarketChange": ("number", ("price",), "postMarketChange"),
+    "postMarketChangePercent": ("number", ("price",), "postMarketChangePercent"),
+    "postMarketTime": ("date", ("price",), "postMarketTime"),
+    "regularMarketPreviousClose": (
+        "number",
+        ("price", "summaryDetail"),
+        "regularMarketPreviousClose",
+    ),
+    "regularMarketOpen": ("number", ("price", "summaryDetail"), "regularMarketOpen"),
+    "regularMarketDayRange": (
+        "range",
+        ("price", "summaryDetail"),
+        ("regularMarketDayLow", "regularMarketDayHigh"),
+    ),
+    "fiftyTwoWeekRange": (
+        "range",
+        ("summaryDetail",),
+        ("fiftyTwoWeekLow", "fiftyTwoWeekHigh"),
+    ),
+    "regularMarketVolume": (
+        "number",
+        ("price", "summaryDetail"),
+        "regularMarketVolume",
+    ),
+    "averageVolume": ("number", ("summaryDetail",), "averageVolume"),
+    "marketCap": ("number", ("price", "summaryDetail"), "marketCap"),
+    "bid": ("number", ("summaryDetail",), "bid"),
+    "ask": ("number", ("summaryDetail",), "ask"),
+    "beta": ("number", ("summaryDetail",), "beta"),
+    "trailingPE": ("number", ("summaryDetail",), "trailingPE"),
+    "trailingEps": ("number", ("defaultKeyStatistics",), "trailingEps"),
+    "earningsDate": ("date", ("calendarEvents",), "earnings.earningsDate"),
+    "dividendRate": ("number", ("summaryDetail",), "dividendRate"),
+    "dividendYield": ("number", ("summaryDetail",), "dividendYield"),
+    "exDividendDate": (
+        "date",
+        ("summaryDetail", "calendarEvents"),
+        "exDividendDate",
+    ),
+    "targetMeanPrice": ("number", ("financialData",), "targetMeanPrice"),
+}
+# Kinds of the rows of older pages, named by the data-test of their cell
+_LEGACY_SUMMARY_KINDS = {
+    "PREV_CLOSE": "number",
+    "OPEN": "number",
+    "BID": "number",
+    "ASK": "number",
+    "DAYS_RANGE": "range",
+    "FIFTY_TWO_WK_RANGE": "range",
+    "TD_VOLUME": "number",
+    "AVERAGE_VOLUME_3MONTH": "number",
+    "MARKET_CAP": "number",
+    "BETA_5Y": "number",
+    "PE_RATIO": "number",
+    "EPS_RATIO": "number",
+    "EARNINGS_DATE": "date",
+    "DIVIDEND_AND_YIELD": "range",
+    "EX_DIVIDEND_DATE": "date",
+    "ONE_YEAR_TARGET_PRICE": "number",
+}
+# A number displayed on a Yahoo page, e.g. "+1.23%" or "3.76T"
+_NUMBER = re.compile(r"[-+]?\d[\d,.]*[KMBT%]?")
+
+# Numeric columns of the options chain, float64 whatever the source
+_OPTION_COLUMNS = (
+    "lastPrice",
+    "bid",
+    "ask",
+    "change",
+    "percentChange",
+    "volume",
+    "openInterest",
+    "impliedVolatility",
+)
+# Options chain columns by header of the options page tables
+_OPTION_HEADERS = {
+    "Contract Name": "contractSymbol",
+    "Last Price": "lastPrice",
+    "Bid": "bid",
+    "Ask": "ask",
+    "Change": "change",
+    "% Change": "percentChange",
+    "Volume": "volume",
+    "Open Interest": "openInterest",
+    "Implied Volatility": "impliedVolatility",
+}
+# Expiry, type and strike encoded in an OCC contract symbol, e.g. AAPL250117C00150000
+_CONTRACT_SYMBOL = re.compile(r"(\d{6})([CP])(\d{8})$")
+
+
+def _raw(value: Any) -> Any:
+    """
+    Return the raw number of a Yahoo {"raw": ..., "fmt": ...} value,
+    None for an empty one and other values unchanged
+    """
+    if isinstance(value, dict):
+        return value.get("raw")
+    return value
+
+
+def _to_float(text: str) -> float:
+    """
+    Convert a number displayed on a Yahoo page, e.g. "1,234" or "+5.10%",
+    to a float, NaN if there is none ("-")
+    """
+    try:
+        return float(text.replace(",", "").replace("%", "").strip())
+    except ValueError:
+        return float("nan")
+
+
+def _to_number(text: str) -> float:
+    """
+    Convert a number displayed on a Yahoo page to a float, abbreviated
+    ones such as "180.39M" in full and percentages such as "0.07%" as
+    fractions, NaN if there is none ("-")
+    """
+    text = text.replace("$", "").strip()
+    if text.endswith("%"):
+        return _to_float(text) / 100
+    if text[-1:].upper() in _MAGNITUDES:
+        return _to_float(text[:-1]) * _MAGNITUDES[text[-1].upper()]
+    return _to_float(text)
+
+
+def _summary_module_value(modules: dict, row: str) -> Any:
+    """
+    Return the value of a _SUMMARY_FIELDS row read from the quoteSummary
+    modules, None if none of its modules has it
+    """
+    kind, names, path = _SUMMARY_FIELDS[row]
+    for name in names:
+        module = modules.get(name) or {}
+        if kind == "range":
+            low, high = (_raw(module.get(field)) for field in path)
+            value = _summary_value("range", (low, high))
+        else:
+            value = module
+            for key in path.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+            # earningsDate lists the first and last possible day
+            if isinstance(value, list):
+                value = value[0] if value else None
+            value = _summary_value(kind, _raw(value))
+        if value is not None:
+            return value
+
+    return None
+
+
+def _summary_value(kind: str, value: Any) -> Any:
+    """
+    Type a summary value read from a quoteSummary module, None if it has
+    not the kind of the row
+    """
+
+    def is_number(item: Any) -> bool:
+        return isinstance(item, (int, float)) and not isinstance(item, bool)
+
+    if kind == "range":
+        return tuple(map(float, value)) if all(map(is_number, value)) else None
+    if kind == "text":
+        return value if isinstance(value, str) else None
+    if not is_number(value):
+        return None
+    return pd.Timestamp(value, unit="s") if kind == "date" else float(value)
+
+
+def _summary_text_value(kind: str, text: str) -> Any:
+    """
+    Type a summary value displayed on the page, None if there is none
+    """
+    text = text.strip()
+    numbers = _NUMBER.findall(text)
+    if kind == "auto":
+        kind = "number" if _NUMBER.fullmatch(text.strip("()")) else "text"
+
+    if kind == "number":
+        return _to_number(numbers[0]) if numbers else None
+    if kind == "range":
+        return tuple(map(_to_number, numbers[:2])) if len(numbers) > 1 else None
+    if kind == "date":
+        # Earnings dates may be a range of days, keep the first
+        date = pd.to_datetime(text.split(" - ")[0], errors="coerce")
+        return None if pd.isna(date) else date
+    return text or None
+
+
+def _summary_frame(values: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Build the summary table, with every _SUMMARY_FIELDS row followed by the
+    other rows of values. Numbers are floats, dates timestamps and ranges
+    (low, high) tuples, missing values NaN, NaT or None by kind.
+    """
+    missing = {"number": float("nan"), "date": pd.NaT}
+    rows = [*_SUMMARY_FIELDS, *(row for row in values if row not in _SUMMARY_FIELDS)]
+    data = [
+        (
+            values[row]
+            if values.get(row) is not None
+            else missing.get(_SUMMARY_FIELDS.get(row, ("",))[0])
+        )
+        for row in rows
+    ]
+    return pd.Series(data, index=rows, dtype=object).to_frame()
+
+
+def _valuation_measure(label: str) -> Union[str, None]:
+    """
+    Return the valuation measure a row label of the statistics page stands
+    for, e.g. "Market Cap" for "Market Cap (intraday)", None if unknown
+    """
+    for measure in sorted(_VALUATION_MEASURES.values(), key=len, reverse=True):
+        if label.startswith(measure):
+            return measure
+    return None
+
+
+def _valuation_column(header: str) -> str:
+    """
+    Return a column of the statistics page table as named in the embedded
+    timeseries, e.g. "2025-06-30" for "6/30/2025"
+    """
+    try:
+        return datetime.strptime(header, "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return header
+
+
+def _valuation_frame(rows: Dict[str, dict]) -> pd.DataFrame:
+    """
+    Build the valuation measures table from the values of each measure by
+    column, with the measures in page order, "Current" first and the
+    dates from newest to oldest
+    """
+    data_df = pd.DataFrame.from_dict(rows, orient="index", dtype="float64")
+    data_df = data_df.reindex(
+        [measure for measure in _VALUATION_MEASURES.values() if measure in rows]
+    )
+    dates = sorted((c for c in data_df.columns if c != "Current"), reverse=True)
+    columns = (["Current"] if "Current" in data_df.columns else []) + dates
+    data_df = data_df[columns]
+    data_df.index.name = ""
+
+    return data_df
+
 
 class YahooWeb(TickerBase):
     def __init__(
@@ -72,18 +386,17 @@ class YahooWeb(TickerBase):
             return self._parse_financials_html(url)
 
         # First, get the page to extract available time periods from the HTML
-        # Calculate period range
-        period2 = int(datetime.now().timestamp())
-        period1 = int(
-            (datetime.now().replace(year=datetime.now().year - 5)).timestamp()
-        )
+        # Calculate period range, in whole days to keep the URL stable
+        now = datetime.now()
+        period2 = day_timestamp(now, end=True)
+        period1 = day_timestamp(now.replace(year=now.year - 5))
 
         # Build the timeseries API URL with all columns for this statement type
         prefixed_columns = [f"{frequency}{col}" for col in columns]
         columns_str = ",".join(prefixed_columns)
 
         api_url = (
-            f"{FUNDAMENTALS_BASE_URL}/{self.ticker}"
+            f"{self.fundamentals_base_url}/{self.ticker}"
             f"/?symbol={self.ticker}"
             f"&type={columns_str}"
             f"&period1={period1}&period2={period2}"
@@ -91,8 +404,7 @@ class YahooWeb(TickerBase):
 
         # Fetch the detailed data from the timeseries API
         try:
-            api_response = self.get_response(api_url)
-            api_data = api_response.json()["timeseries"]["result"]
+            api_data = self.get_json(api_url)["timeseries"]["result"]
 
             row = {}
             for item in api_data:
@@ -113,6 +425,9 @@ class YahooWeb(TickerBase):
                 df.columns.name = None
                 df.index.name = "Breakdown"
                 return df
+        except CacheMissError:
+            # Offline without the API response, the page would not be cached either
+            raise
         except Exception:
             pass
 
@@ -132,8 +447,7 @@ class YahooWeb(TickerBase):
         ----------------
         pd.DataFrame: A pandas DataFrame including the visible financials table
         """
-        response = self.get_response(url)
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         table = self.find_parent_by_text(soup, "div", "Breakdown")
 
@@ -170,6 +484,109 @@ class YahooWeb(TickerBase):
 
         return df
 
+    def _yahoo_payloads(self, url: str) -> List[Tuple[str, Any]]:
+        """
+        Return the API responses a Yahoo page embeds in its fetch cache, as
+        (API URL, decoded body) pairs, decoded once per page
+        """
+        response = self.get_raw_page(url)
+        payloads = getattr(response, "_yahoo_payloads", None)
+        if payloads is None:
+            payloads = []
+            for data_url, body in find_json_scripts(response.content):
+                try:
+                    payload = decode(body)
+                    # The fetch cache wraps each API response body in a string
+                    if isinstance(payload, dict) and isinstance(
+                        payload.get("body"), str
+                    ):
+                        payload = decode(payload["body"])
+                except ValueError:
+                    continue
+                payloads.append((data_url or "", payload))
+            response._yahoo_payloads = payloads
+
+        return payloads
+
+    def _yahoo_quote_summary(self, url: str) -> dict:
+        """
+        Return the quoteSummary modules embedded in a Yahoo page by name,
+        e.g. "summaryDetail", an empty dictionary if there are none
+        """
+        modules = {}
+        for _, payload in self._yahoo_payloads(url):
+            try:
+                results = payload["quoteSummary"]["result"] or []
+            except (KeyError, TypeError):
+                continue
+            for result in results:
+                modules.update(result)
+
+        return modules
+
+    def _ownership_frame(self, owners: List[dict], columns: list) -> pd.DataFrame:
+        """
+        Build a holders table from an ownershipList, with the report date
+        as datetimes
+        """
+        data_df = pd.DataFrame(
+            [
+                [
+                    owner.get("organization"),
+                    _raw(owner.get("position")),
+                    _raw(owner.get("reportDate")),
+                    _raw(owner.get("pctHeld")),
+                    _raw(owner.get("value")),
+                ]
+                for owner in owners
+            ],
+            columns=columns,
+        )
+        date_column = columns[2]
+        data_df[date_column] = pd.to_datetime(data_df[date_column], unit="s").astype(
+            "datetime64[ns]"
+        )
+
+        return data_df
+
+    def _yahoo_valuation_measures(self, url: str) -> Union[pd.DataFrame, None]:
+        """
+        Build the valuation measures table from the timeseries response
+        embedded in the statistics page, None if the page does not embed it
+        """
+        rows = {}
+        for _, payload in self._yahoo_payloads(url):
+            try:
+                results = payload["timeseries"]["result"] or []
+            except (KeyError, TypeError):
+                continue
+            for item in results:
+                series_type = item.get("meta", {}).get("type", [""])[0]
+                prefix = (
+                    "trailing" if series_type.startswith("trailing") else "quarterly"
+                )
+                if not series_type.startswith(prefix):
+                    continue
+                start = len(prefix)
+                measure = _VALUATION_MEASURES.get(series_type[start:])
+                if measure is None:
+                    continue
+
+                values = [value for value in item.get(series_type) or [] if value]
+                row = rows.setdefault(measure, {})
+                if prefix == "trailing":
+                    # The latest trailing value is the current one
+                    if values:
+                        row["Current"] = _raw(values[-1].get("reportedValue"))
+                else:
+                    for value in values:
+                        row[value["asOfDate"]] = _raw(value.get("reportedValue"))
+
+        if not rows:
+            return None
+
+        return _valuation_frame(rows)
+
     @property
     def yahoo_web_cashflow(self) -> pd.DataFrame:
         """
@@ -182,7 +599,7 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/cash-flow"
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/cash-flow"
         return self.yahoo_web_financials_table(url)
 
     @property
@@ -198,7 +615,7 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/balance-sheet"
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/balance-sheet"
         return self.yahoo_web_financials_table(url)
 
     @property
@@ -214,7 +631,7 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/financials"
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/financials"
         return self.yahoo_web_financials_table(url)
 
     @property
@@ -231,24 +648,15 @@ class YahooWeb(TickerBase):
         )
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/options"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/options"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         # gets calls and puts
         table = self.find_parent_by_text(soup, "table", "Contract Name")
 
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return read_table(table)
 
     @property
     def yahoo_web_puts(self) -> pd.DataFrame:
@@ -265,24 +673,179 @@ class YahooWeb(TickerBase):
         )
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/options"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/options"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         # gets calls and puts
         table = self.find_parent_by_text(soup, "table", "Contract Name", skip=1)
 
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
+        return read_table(table)
+
+    def yahoo_web_options_chain(self) -> pd.DataFrame:
+        """
+        Get the calls and puts of all expirations for the ticker
+
+        The options page of every expiration is downloaded concurrently.
+
+        Returns:
+        ----------------
+        pd.DataFrame: A pandas DataFrame indexed by expiry, type ("call" or
+        "put") and strike, with float64 price, volume and implied volatility
+        columns, the contract symbol, its last trade date and whether it is
+        in the money
+        """
+        check_security_type(
+            security_type=self.security_type, valid_types=["stock", "etf"]
+        )
+
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/options"
+        chain = self._yahoo_option_chain(url)
+        if chain is None:
+            # Only the nearest expiration is visible in the page tables
+            return self._options_frame(self._options_rows_from_tables(url))
+
+        urls = self._options_urls(url, chain)
+        self.get_raw_pages(urls)
+        chains = [chain, *map(self._yahoo_option_chain, urls)]
+
+        return self._options_frame(self._options_rows(chains))
+
+    async def yahoo_web_options_chain_async(self) -> pd.DataFrame:
+        """
+        Async variant of yahoo_web_options_chain
+        """
+        check_security_type(
+            security_type=self.security_type, valid_types=["stock", "etf"]
+        )
+
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/options"
+        await self.get_raw_page_async(url)
+        chain = self._yahoo_option_chain(url)
+        if chain is None:
+            await self.get_page_async(url)
+            return self._options_frame(self._options_rows_from_tables(url))
+
+        urls = self._options_urls(url, chain)
+        await asyncio.gather(*(self.get_raw_page_async(other) for other in urls))
+        chains = [chain, *map(self._yahoo_option_chain, urls)]
+
+        return self._options_frame(self._options_rows(chains))
+
+    def _yahoo_option_chain(self, url: str) -> Union[dict, None]:
+        """
+        Return the optionChain result embedded in an options page, None if
+        the page does not embed it
+        """
+        for _, payload in self._yahoo_payloads(url):
+            try:
+                return payload["optionChain"]["result"][0]
+            except (KeyError, IndexError, TypeError):
+                continue
+        return None
+
+    def _options_urls(self, url: str, chain: dict) -> List[str]:
+        """
+        Return the options page URLs of the expirations missing from chain
+        """
+        loaded = {
+            _raw(option.get("expirationDate")) for option in chain.get("options", [])
+        }
+        return [
+            f"{url}?date={expiration}"
+            for expiration in map(_raw, chain.get("expirationDates", []))
+            if expiration not in loaded
         ]
 
-        data_df = pd.DataFrame(data, columns=headers)
+    def _options_rows(self, chains: List[Union[dict, None]]) -> List[dict]:
+        """
+        Flatten the contracts of optionChain results into rows
+        """
+        rows = []
+        for chain in chains:
+            for option in (chain or {}).get("options", []):
+                for kind, contracts in (("call", "calls"), ("put", "puts")):
+                    for contract in option.get(contracts, []):
+                        row = {
+                            "expiry": _raw(contract.get("expiration"))
+                            or _raw(option.get("expirationDate")),
+                            "type": kind,
+                            "strike": _raw(contract.get("strike")),
+                            "contractSymbol": contract.get("contractSymbol"),
+                            "lastTradeDate": _raw(contract.get("lastTradeDate")),
+                            "inTheMoney": contract.get("inTheMoney"),
+                        }
+                        for column in _OPTION_COLUMNS:
+                            row[column] = _raw(contract.get(column))
+                        rows.append(row)
+        return rows
+
+    def _options_rows_from_tables(self, url: str) -> List[dict]:
+        """
+        Read the contracts from the calls and puts tables of an options page,
+        taking expiry, type and strike from the contract symbols
+        """
+        soup = self.get_soup(url)
+
+        rows = []
+        for skip in (0, 1):
+            table = self.find_parent_by_text(soup, "table", "Contract Name", skip=skip)
+            if table is None:
+                continue
+
+            headers, table_cells = table_rows(table, strip=True)
+            for cells in table_cells:
+                cells = dict(zip(headers, cells))
+                match = _CONTRACT_SYMBOL.search(cells.get("Contract Name", ""))
+                if match is None:
+                    continue
+
+                row = {
+                    "expiry": datetime.strptime(match.group(1), "%y%m%d"),
+                    "type": "call" if match.group(2) == "C" else "put",
+                    "strike": int(match.group(3)) / 1000,
+                    "lastTradeDate": None,
+                    "inTheMoney": None,
+                }
+                for header, column in _OPTION_HEADERS.items():
+                    value = cells.get(header, "")
+                    row[column] = (
+                        value if column == "contractSymbol" else _to_float(value)
+                    )
+                # Displayed in percent, the embedded data has fractions
+                row["impliedVolatility"] /= 100
+                rows.append(row)
+
+        if not rows:
+            raise NoDataError(f"There are no options for the ticker {self.ticker}")
+        return rows
+
+    def _options_frame(self, rows: List[dict]) -> pd.DataFrame:
+        """
+        Build the options chain frame indexed by expiry, type and strike
+        """
+        data_df = pd.DataFrame(
+            rows,
+            columns=[
+                "expiry",
+                "type",
+                "strike",
+                "contractSymbol",
+                *_OPTION_COLUMNS,
+                "lastTradeDate",
+                "inTheMoney",
+            ],
+        )
+        for column in ("expiry", "lastTradeDate"):
+            if not pd.api.types.is_datetime64_any_dtype(data_df[column]):
+                data_df[column] = pd.to_datetime(data_df[column], unit="s")
+        data_df["strike"] = data_df["strike"].astype("float64")
+        data_df[list(_OPTION_COLUMNS)] = data_df[list(_OPTION_COLUMNS)].astype(
+            "float64"
+        )
 
-        return data_df
+        return data_df.set_index(["expiry", "type", "strike"]).sort_index()
 
     @property
     def yahoo_web_description(self) -> str:
@@ -295,11 +858,10 @@ class YahooWeb(TickerBase):
         """
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/profile"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _PROFILE_SECTIONS)
 
         return soup.find("section", {"data-testid": "description"}).find("p").text
 
@@ -315,24 +877,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/profile"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _PROFILE_SECTIONS)
 
         raw_data = soup.find("section", {"data-testid": "key-executives"})
 
-        data_df = pd.DataFrame()
-        data = []
-
-        headers = [th.text for th in raw_data.find("thead").find("tr").find_all("th")]
-        for tr in raw_data.find("tbody").find_all("tr"):
-            data.append([td.text for td in tr.find_all("td")])
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return read_table(raw_data)
 
     @property
     def yahoo_web_corporate_governance(self) -> str:
@@ -346,11 +898,10 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/profile"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/profile"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _PROFILE_SECTIONS)
 
         return (
             soup.find("section", {"data-testid": "corporate-governance"})
@@ -370,29 +921,10 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/holders"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find("section", {"data-testid": "holders-major-holders-table"})
-        table = section.find("table")
-
-        data_df = pd.DataFrame()
-        data = []
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/holders"
 
-        headers, data = [], []
-
-        headers = [item.text for item in table.find_all("th")].append("description")
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        data_df = self._holders_table(url, "holders-major-holders-table")
+        return data_df.set_axis(range(2), axis=1)
 
     @property
     def yahoo_web_top_institutional_holders(self) -> pd.DataFrame:
@@ -406,31 +938,12 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/holders"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/holders"
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        section = soup.find(
-            "section", {"data-testid": "holders-top-institutional-holders"}
+        data_df = self._holders_table(url, "holders-top-institutional-holders")
+        return data_df.set_axis(
+            ["Holder", "Shares", "Date Reported", "% Out", "Value"], axis=1
         )
-        table = section.find("table")
-
-        data_df = pd.DataFrame()
-        data = []
-
-        headers, data = [], []
-
-        headers = [item.text for item in table.find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find_all("tr")[1:]
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
 
     @property
     def yahoo_web_top_mutual_fund_holders(self) -> pd.DataFrame:
@@ -444,25 +957,108 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/holders"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/holders"
 
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-        table = self.find_parent_by_text(
-            soup, "div", "Top Institutional Holders"
-        ).find_all("tr")
+        return self._holders_table(url, "holders-top-mutual-fund-holders")
 
-        data_df = pd.DataFrame()
-        data = []
+    def yahoo_web_holders(self) -> Dict[str, pd.DataFrame]:
+        """
+        Get the major, top institutional and top mutual fund holders of the
+        ticker at once
 
-        for tr in table:
-            data.append([td.text for td in tr.find_all("td")])
+        The holders page is downloaded and read once for the three tables,
+        which are typed: shares, percentages (as fractions) and values are
+        floats, report dates are datetimes.
 
-        # drop the first row as it is none
-        data_df = pd.DataFrame(data[1:])
-        data_df.columns = ["holder", "shares", "date_reported", "percentage", "value"]
-        return data_df
+        Returns:
+        ----------------
+        Dict[str, pd.DataFrame]: The tables by the data-testid of their
+        section: "holders-major-holders-table" with "value" and
+        "description" columns, "holders-top-institutional-holders" and
+        "holders-top-mutual-fund-holders" with "holder", "shares",
+        "date_reported", "percentage" and "value" columns. Tables missing
+        from the page are left out.
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
+
+        # URL of the website to scrape
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/holders"
+
+        return self._holders_tables(url)
+
+    def _holders_table(self, url: str, testid: str) -> pd.DataFrame:
+        """
+        Return one table of the holders page, see _holders_tables
+        """
+        tables = self._holders_tables(url)
+        if testid not in tables:
+            raise NoDataError(f"No {testid} table for the ticker {self.ticker}")
+
+        return tables[testid]
+
+    def _holders_tables(self, url: str) -> Dict[str, pd.DataFrame]:
+        """
+        Build the typed tables of the holders page by the data-testid of
+        their section, from its quoteSummary modules or else from its HTML
+        """
+        modules = self._yahoo_quote_summary(url)
+        if any(module in modules for module in _HOLDERS_TABLES.values()):
+            return self._holders_from_modules(modules)
+
+        # Parse the HTML content of the website
+        soup = self.get_soup(url, _HOLDERS_SECTIONS)
+
+        tables = {}
+        for section in soup.find_all("section", {"data-testid": True}):
+            testid = section["data-testid"]
+            if testid not in _HOLDERS_TABLES:
+                continue
+
+            _, rows = table_rows(section, strip=True)
+
+            if testid == "holders-major-holders-table":
+                data_df = pd.DataFrame(
+                    [row[:2] for row in rows], columns=["value", "description"]
+                )
+                data_df["value"] = data_df["value"].map(_to_number).astype("float64")
+            else:
+                data_df = pd.DataFrame(
+                    [row[:5] for row in rows], columns=_HOLDERS_COLUMNS
+                )
+                for column, dtype in _HOLDERS_NUMBERS.items():
+                    data_df[column] = data_df[column].map(_to_number).astype(dtype)
+                data_df["date_reported"] = pd.to_datetime(
+                    data_df["date_reported"], format="%b %d, %Y", errors="coerce"
+                ).astype("datetime64[ns]")
+            tables[testid] = data_df
+
+        return tables
+
+    def _holders_from_modules(self, modules: dict) -> Dict[str, pd.DataFrame]:
+        """
+        Build the tables of the holders page from its quoteSummary modules
+        """
+        tables = {}
+        for testid, module in _HOLDERS_TABLES.items():
+            data = modules.get(module)
+            if not data:
+                continue
+
+            if module == "majorHoldersBreakdown":
+                tables[testid] = pd.DataFrame(
+                    [
+                        [_raw(data[field]), description]
+                        for field, description in _MAJOR_HOLDERS.items()
+                        if field in data
+                    ],
+                    columns=["value", "description"],
+                ).astype({"value": "float64"})
+            elif data.get("ownershipList"):
+                tables[testid] = self._ownership_frame(
+                    data["ownershipList"], _HOLDERS_COLUMNS
+                ).astype(_HOLDERS_NUMBERS)
+
+        return tables
 
     @property
     def yahoo_web_summary(self) -> pd.DataFrame:
@@ -476,24 +1072,34 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}"
-        response = self.get_response(url)
-
-        # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # for data in the table, generating 16 rows
-        raw_data = soup.find_all("td", {"data-test": True})
-        data_df = pd.DataFrame()
-        for item in raw_data:
-            data_df[item["data-test"].replace("-value", "")] = [item.text]
+        url = f"{self.yahoo_web_base_url}/{self.ticker}"
 
-        # for data in top of the page, generating 10 rows
-        raw_data = soup.find_all("fin-streamer", {"data-field": True})
-        for item in raw_data:
-            data_df[item["data-field"]] = [item.text]
+        modules = self._yahoo_quote_summary(url)
+        if "price" in modules or "summaryDetail" in modules:
+            return _summary_frame(
+                {row: _summary_module_value(modules, row) for row in _SUMMARY_FIELDS}
+            )
 
-        return data_df.T
+        # Parse the HTML content of the website
+        soup = self.get_soup(url)
+
+        # Quote table cells (data-test) and streamed values (data-field)
+        texts = {
+            item["data-test"].replace("-value", ""): item.text
+            for item in soup.find_all("td", {"data-test": True})
+        }
+        for item in soup.find_all("fin-streamer", {"data-field": True}):
+            texts[item["data-field"]] = item.text
+
+        values = {}
+        for row, text in texts.items():
+            if row in _SUMMARY_FIELDS:
+                kind = _SUMMARY_FIELDS[row][0]
+            else:
+                kind = _LEGACY_SUMMARY_KINDS.get(row, "auto")
+            values[row] = _summary_text_value(kind, text)
+
+        return _summary_frame(values)
 
     @property
     def yahoo_web_valuation_measures(self) -> pd.DataFrame:
@@ -507,11 +1113,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/key-statistics"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/key-statistics"
+
+        data_df = self._yahoo_valuation_measures(url)
+        if data_df is not None:
+            return data_df
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         # find element with test Valuation Measures
         parent_section = self.find_parent_by_text(
@@ -521,16 +1130,17 @@ class YahooWeb(TickerBase):
         # looking for "table svelte-104jbnt"
         table = parent_section.find("table")
 
-        data_df = pd.DataFrame()
-
-        headers = [item.text for item in table.find("thead").find("tr").find_all("th")]
-        data_df = pd.DataFrame(columns=headers)
+        # Rows and columns named as in the embedded timeseries, see
+        # _yahoo_valuation_measures
+        header, data = table_rows(table, strip=True)
+        columns = [_valuation_column(column) for column in header[1:]]
+        rows = {}
+        for row in data:
+            measure = _valuation_measure(row[0])
+            if measure is not None:
+                rows[measure] = dict(zip(columns, map(_to_number, row[1:])))
 
-        for row in table.find("tbody").find_all("tr"):
-            data = [item.text for item in row.find_all("td")]
-            data_df.loc[len(data_df)] = data
-
-        return data_df.set_index("")
+        return _valuation_frame(rows)
 
     @property
     def yahoo_web_financial_highlights(self) -> pd.DataFrame:
@@ -544,24 +1154,17 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/key-statistics"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/key-statistics"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         raw_data = soup.find("div", {"data-testid": "stats-highlight"}).find_all(
             "section", recursive=False
         )[0]
-        data_df = pd.DataFrame(columns=["Criteria", "Value"])
-
-        sections = raw_data.find_all("section")
-        for section in sections:
-            for row in section.find("table").find("tbody").find_all("tr"):
-                data = [item.text.strip() for item in row.find_all("td")]
-                data_df.loc[len(data_df)] = data
-
-        return data_df.set_index("Criteria")
+        return read_table(
+            raw_data, columns=["Criteria", "Value"], strip=True, index="Criteria"
+        )
 
     @property
     def yahoo_web_trading_information(self) -> pd.DataFrame:
@@ -575,24 +1178,17 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/key-statistics"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/key-statistics"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         raw_data = soup.find("div", {"data-testid": "stats-highlight"}).find_all(
             "section", recursive=False
         )[1]
-        data_df = pd.DataFrame(columns=["Criteria", "Value"])
-
-        sections = raw_data.find_all("section")
-        for section in sections:
-            for row in section.find("table").find("tbody").find_all("tr"):
-                data = [item.text.strip() for item in row.find_all("td")]
-                data_df.loc[len(data_df)] = data
-
-        return data_df.set_index("Criteria")
+        return read_table(
+            raw_data, columns=["Criteria", "Value"], strip=True, index="Criteria"
+        )
 
     @property
     def yahoo_web_full_name(self) -> str:
@@ -606,17 +1202,50 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url)
 
         header = self.find_parent_by_text(soup, "h1", f"({self.ticker})")
 
         # get the word till the first special character including space
         return re.findall(r"[\w\s]+", header.text)[0].strip()
 
+    def yahoo_web_analysis(self) -> Dict[str, pd.DataFrame]:
+        """
+        Get all tables of the analysis page for the ticker at once
+
+        The page is downloaded and parsed once and its sections are walked
+        once, instead of once per table as with the single table properties.
+
+        Returns:
+        ----------------
+        Dict[str, pd.DataFrame]: The tables by the data-testid of their
+        section: "earningsEstimate", "revenueEstimate", "earningsHistory",
+        "epsTrend", "epsRevisions" and "growthEstimate". Tables missing
+        from the page are left out.
+        """
+        check_security_type(security_type=self.security_type, valid_types=["stock"])
+
+        # URL of the website to scrape
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
+
+        # Parse the HTML content of the website
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
+
+        return {
+            section["data-testid"]: self._analysis_table(section)
+            for section in soup.find_all("section", {"data-testid": True})
+            if section["data-testid"] in _ANALYSIS_TABLES
+        }
+
+    def _analysis_table(self, section: Tag) -> pd.DataFrame:
+        """
+        Build the table of a section of the analysis page
+        """
+        return read_table(section.find("table"))
+
     @property
     def yahoo_web_earnings_estimate(self) -> pd.DataFrame:
         """
@@ -630,26 +1259,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "earningsEstimate"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
 
     @property
     def yahoo_web_revenue_estimate(self) -> pd.DataFrame:
@@ -665,26 +1282,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "revenueEstimate"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
 
     @property
     def yahoo_web_earnings_history(self) -> pd.DataFrame:
@@ -700,26 +1305,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "earningsHistory"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
 
     @property
     def yahoo_web_eps_trend(self) -> pd.DataFrame:
@@ -735,26 +1328,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "epsTrend"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
 
     @property
     def yahoo_web_eps_revisions(self) -> pd.DataFrame:
@@ -770,26 +1351,14 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "epsRevisions"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
 
     @property
     def yahoo_web_growth_estimates(self) -> pd.DataFrame:
@@ -805,23 +1374,11 @@ class YahooWeb(TickerBase):
         check_security_type(security_type=self.security_type, valid_types=["stock"])
 
         # URL of the website to scrape
-        url = f"{YAHOO_WEB_BASE_URL}/{self.ticker}/analysis"
-        response = self.get_response(url)
+        url = f"{self.yahoo_web_base_url}/{self.ticker}/analysis"
 
         # Parse the HTML content of the website
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.get_soup(url, _ANALYSIS_SECTIONS)
 
         section = soup.find("section", {"data-testid": "growthEstimate"})
 
-        # find thead and tbody
-        table = section.find("table")
-
-        headers = [item.text for item in table.find("thead").find_all("th")]
-        data = [
-            [item.text for item in row.find_all("td")]
-            for row in table.find("tbody").find_all("tr")
-        ]
-
-        data_df = pd.DataFrame(data, columns=headers)
-
-        return data_df
+        return self._analysis_table(section)
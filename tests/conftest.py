@@ -5,10 +5,15 @@ Ensures tests run one at a time to avoid rate limiting from external APIs
 (digrin, justetf, macrotrends, yahoo, finviz, nasdaq).
 """
 
+import http.server
 import threading
+from typing import Callable, Union
 
 import pytest
 
+from stockdex.cache import CachedResponse
+from stockdex.ticker_base import TickerBase
+
 # Semaphore to limit concurrent tests to 8 at a time across all test files
 _test_semaphore = threading.Semaphore(8)
 
@@ -21,3 +26,90 @@ def serialize_tests():
     """
     with _test_semaphore:
         yield
+
+
+class _EchoHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers every GET request with its own path as body.
+    "/status/<code>" answers with that status, "/flaky/<n>/..." fails
+    with 503 n times before succeeding and "/etag/..." answers 304 when
+    revalidated with its ETag.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        status, headers = 200, {}
+
+        parts = self.path.split("/")
+        if parts[1] == "status":
+            status = int(parts[2])
+        elif parts[1] == "flaky":
+            seen = self.server.requests.count(self.path)
+            if seen <= int(parts[2]):
+                status, headers = 503, {"Retry-After": "0"}
+        elif parts[1] == "etag":
+            headers = {"ETag": '"v1"'}
+            if self.headers.get("If-None-Match") == '"v1"':
+                status = 304
+
+        body = self.path.encode() if status != 304 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """
+    Fixture that serves HTTP on localhost for tests that must not hit the internet
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class FakeDownloads(list):
+    """
+    The URLs downloaded by a test, in order. Every download answers 200 with
+    content, bytes or a function returning the body of a URL.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.content: Union[bytes, Callable[[str], bytes]] = b"<p>page</p>"
+
+    def download(self, url: str) -> CachedResponse:
+        self.append(url)
+        content = self.content(url) if callable(self.content) else self.content
+        return CachedResponse(url=url, status_code=200, content=content)
+
+
+@pytest.fixture
+def fake_downloads(monkeypatch):
+    """
+    Fixture replacing the network under the fetch layer, so that the response
+    cache, the page memo and prefetch still run. Set its content attribute to
+    choose the served body.
+    """
+    downloads = FakeDownloads()
+
+    def fake_download(self, url, extra_headers=None):
+        return downloads.download(url)
+
+    async def fake_download_async(self, url, extra_headers=None):
+        return downloads.download(url)
+
+    monkeypatch.setattr(TickerBase, "_download", fake_download)
+    monkeypatch.setattr(TickerBase, "_download_async", fake_download_async)
+    return downloads
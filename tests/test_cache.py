@@ -0,0 +1,192 @@
+"""
+Module to test the persistent response cache
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from stockdex.cache import CachedResponse, ResponseCache, normalize_url
+from stockdex.config import CACHE_TTL, DIGRIN_BASE_URL
+from stockdex.exceptions import CacheMissError
+from stockdex.rate_limiter import RateLimiter
+from stockdex.selenium_interface import selenium_interface
+from stockdex.ticker import Ticker
+from stockdex.ticker_base import TickerBase
+
+
+@pytest.mark.parametrize(
+    "url, params, expected",
+    [
+        ("HTTPS://Example.COM/a?b=2&a=1", None, "https://example.com/a?a=1&b=2"),
+        ("https://example.com/a#top", None, "https://example.com/a"),
+        ("https://example.com/a", {"crumb": "x", "q": 1}, "https://example.com/a?q=1"),
+        ("https://example.com", None, "https://example.com/"),
+    ],
+)
+def test_normalize_url(url, params, expected):
+    assert normalize_url(url, params) == expected
+
+
+def test_response_cache_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    response = CachedResponse(
+        url="https://example.com/final",
+        status_code=200,
+        content=b'{"a": 1}',
+        headers={"Content-Type": "application/json"},
+    )
+    cache.set("key", response)
+
+    # a second connection sees the stored response, as after a restart
+    cached = ResponseCache(str(tmp_path / "cache.sqlite")).get("key")
+
+    assert cached.url == "https://example.com/final"
+    assert cached.status_code == 200
+    assert cached.json() == {"a": 1}
+    assert cached.headers["content-type"] == "application/json"
+    assert cached.is_fresh(60)
+    assert not cached.is_fresh(0)
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+def test_get_response_served_from_cache(fake_downloads):
+    ticker = Ticker(ticker="AAPL")
+    ticker.response_cache = ResponseCache(":memory:")
+
+    url = f"{DIGRIN_BASE_URL}/AAPL"
+    first = ticker.get_response(url)
+    second = ticker.get_response(url)
+
+    assert fake_downloads == [url]
+    assert second.content == first.content
+
+
+def test_get_response_without_cache(fake_downloads):
+    ticker = Ticker(ticker="AAPL")
+    ticker.get_response(f"{DIGRIN_BASE_URL}/AAPL")
+    ticker.get_response(f"{DIGRIN_BASE_URL}/AAPL")
+
+    assert len(fake_downloads) == 2
+
+
+def test_stale_response_is_revalidated(local_server, monkeypatch):
+    monkeypatch.setitem(CACHE_TTL, None, 60)
+
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    ticker.response_cache = ResponseCache(":memory:")
+
+    url = f"{local_server}/etag/page"
+    first = ticker.get_response(url)
+    assert first.status_code == 200
+    soup = ticker._parse_page(first)
+
+    # Expire the entry, the server then confirms it with 304 Not Modified
+    with ticker.response_cache._connection:
+        ticker.response_cache._connection.execute("UPDATE responses SET created_at = 0")
+
+    second = ticker.get_response(url)
+    assert second.status_code == 200
+    assert second.content == b"/etag/page"
+    assert second.is_fresh(60)
+    assert ticker._parse_page(second) is soup
+
+
+def test_conditional_headers():
+    cached = CachedResponse(
+        url="https://example.com",
+        status_code=200,
+        content=b"",
+        headers={"etag": '"v1"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+
+    assert TickerBase._conditional_headers(cached) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert TickerBase._conditional_headers(None) == {}
+
+
+def test_offline_mode(monkeypatch):
+    def fake_download(self, url, extra_headers=None):
+        raise AssertionError("offline mode must not download")
+
+    monkeypatch.setattr(Ticker, "_download", fake_download)
+
+    ticker = Ticker(ticker="AAPL")
+    ticker.offline = True
+    ticker.response_cache = ResponseCache(":memory:")
+
+    url = f"{DIGRIN_BASE_URL}/AAPL"
+    with pytest.raises(CacheMissError):
+        ticker.get_response(url)
+
+    # Stale entries are served too
+    ticker.response_cache.set(
+        normalize_url(url),
+        CachedResponse(url=url, status_code=200, content=b"<p>cached</p>"),
+    )
+    with ticker.response_cache._connection:
+        ticker.response_cache._connection.execute("UPDATE responses SET created_at = 0")
+    assert ticker.get_soup(url).find("p").text == "cached"
+
+    ticker.response_cache = None
+    with pytest.raises(CacheMissError):
+        asyncio.run(ticker.get_response_async(f"{DIGRIN_BASE_URL}/MSFT"))
+
+
+def test_offline_selenium():
+    cache = ResponseCache(":memory:")
+    url = "https://www.justetf.com/en/etf-profile.html?isin=IE00B4L5Y983"
+
+    online = selenium_interface(response_cache=cache)
+    online._store(url, "<p>rendered</p>", variant="//button")
+
+    offline = selenium_interface(response_cache=cache, offline=True)
+    soup = offline.just_etf_get_html_after_click(url, "//button")
+    assert soup.find("p").text == "rendered"
+    with pytest.raises(CacheMissError):
+        offline.get_html_content(url)
+
+
+def test_offline_fundamentals(fake_downloads):
+    fake_downloads.content = (
+        b'{"timeseries": {"result": [{"meta": {"type": ["annualTotalRevenue"]}, '
+        b'"annualTotalRevenue": [{"asOfDate": "2023-09-30", '
+        b'"reportedValue": {"raw": 1.0, "fmt": "1"}}]}]}}'
+    )
+    cache = ResponseCache(":memory:")
+    online = Ticker(ticker="AAPL")
+    online.response_cache = cache
+    expected = online.yahoo_api_income_statement()
+
+    # Another ticker, as in a later process, reads the statement offline
+    ticker = Ticker(ticker="AAPL")
+    ticker.response_cache = cache
+    ticker.offline = True
+    pd.testing.assert_frame_equal(ticker.yahoo_api_income_statement(), expected)
+    assert len(fake_downloads) == 1
+
+    # A missing statement is reported, not replaced by the cached HTML table
+    ticker.ticker = "MSFT"
+    page = f"{ticker.yahoo_web_base_url}/MSFT/financials"
+    cache.set(
+        normalize_url(page),
+        CachedResponse(url=page, status_code=200, content=b"<div>Breakdown</div>"),
+    )
+    with pytest.raises(CacheMissError):
+        ticker.yahoo_web_income_stmt
+
+
+def test_offline_selenium_follows_ticker():
+    ticker = Ticker(ticker="SPY", isin="IE00B4L5Y983", security_type="etf")
+    ticker.response_cache = ResponseCache(":memory:")
+    assert not ticker._get_selenium_interface().offline
+
+    ticker.offline = True
+    with pytest.raises(CacheMissError):
+        ticker.justetf_basics
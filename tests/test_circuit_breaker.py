@@ -0,0 +1,80 @@
+"""
+Offline tests for the per-host circuit breakers
+"""
+
+import time
+
+import pytest
+
+from stockdex.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitOpenError,
+)
+from stockdex.config import DIGRIN_BASE_URL
+from stockdex.rate_limiter import RateLimiter
+from stockdex.retry import RetryPolicy
+from stockdex.ticker_base import TickerBase
+
+
+def test_breaker_opens_probes_and_closes() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=2, open_interval=0.05)
+
+    breaker.record(503)
+    breaker.record(exception=ConnectionError())
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    time.sleep(0.05)
+    breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.record(403)
+    assert breaker.state == OPEN
+
+    time.sleep(0.05)
+    breaker.allow()
+    breaker.record(404)
+    assert breaker.state == CLOSED
+    breaker.allow()
+
+
+def test_success_resets_failures() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=2)
+    breaker.record(503)
+    breaker.record(200)
+    breaker.record(503)
+    assert breaker.state == CLOSED
+
+
+def test_disabled_source() -> None:
+    breakers = CircuitBreakers(settings={"digrin": None})
+    assert breakers.get_breaker(f"{DIGRIN_BASE_URL}/AAPL/") is None
+    assert breakers.get_breaker("https://example.com") is not None
+
+
+def test_get_response_fails_fast(local_server) -> None:
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    ticker.retry_policies = {
+        None: RetryPolicy(max_attempts=10, base_delay=0.01, jitter=False)
+    }
+    ticker.circuit_breakers = CircuitBreakers(
+        default={"failure_threshold": 3, "open_interval": 60.0}
+    )
+
+    with pytest.raises(CircuitOpenError):
+        ticker.get_response(f"{local_server}/status/403")
+
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError) as error:
+        ticker.get_response(f"{local_server}/other")
+    assert time.monotonic() - start < 0.05
+    assert error.value.retry_after > 0
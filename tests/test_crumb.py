@@ -0,0 +1,92 @@
+"""
+Offline tests for the shared Yahoo crumb manager
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from stockdex.crumb import YahooCrumbManager
+from stockdex.rate_limiter import RateLimiter
+from stockdex.session_pool import SessionPool
+from stockdex.ticker_base import TickerBase
+
+
+class _FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b""
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = YahooCrumbManager()
+    fetched = []
+
+    def fake_fetch():
+        fetched.append(1)
+        return f"crumb{len(fetched)}", {"A3": f"cookie{len(fetched)}"}
+
+    monkeypatch.setattr(manager, "_fetch", fake_fetch)
+    manager.fetched = fetched
+    return manager
+
+
+def test_crumb_is_fetched_once(manager) -> None:
+    assert manager.get() == ("crumb1", {"A3": "cookie1"})
+    assert manager.get() == ("crumb1", {"A3": "cookie1"})
+    assert asyncio.run(manager.get_async()) == ("crumb1", {"A3": "cookie1"})
+    assert len(manager.fetched) == 1
+
+
+def test_crumb_expires(manager) -> None:
+    manager.get()
+    manager._fetched_at = time.time() - manager.max_age - 1
+    assert manager.get()[0] == "crumb2"
+
+
+def test_invalidate_only_drops_current_crumb(manager) -> None:
+    manager.get()
+    manager.invalidate("stale")
+    assert manager.get()[0] == "crumb1"
+
+    manager.invalidate("crumb1")
+    assert manager.get()[0] == "crumb2"
+
+
+def test_crumb_is_persisted(manager, tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "crumb.json")
+    manager.path = path
+    manager.get()
+
+    restored = YahooCrumbManager(path=path)
+    monkeypatch.setattr(restored, "_fetch", lambda: pytest.fail("fetched again"))
+    assert restored.get() == ("crumb1", {"A3": "cookie1"})
+
+    expired = YahooCrumbManager(path=path, max_age=0)
+    monkeypatch.setattr(expired, "_fetch", lambda: ("fresh", {}))
+    assert expired.get() == ("fresh", {})
+
+
+def test_crumb_refreshed_on_401(manager, monkeypatch) -> None:
+    ticker = TickerBase()
+    ticker.crumb_manager = manager
+    ticker.rate_limiter = RateLimiter(default=None)
+    sent = []
+
+    def fake_get(url, params=None, cookies=None, **kwargs):
+        sent.append((params["crumb"], cookies["A3"]))
+        return _FakeResponse(401 if len(sent) == 1 else 200)
+
+    ticker.session_pool = SessionPool(size=1)
+    monkeypatch.setattr(
+        ticker.session_pool,
+        "_new_session",
+        lambda: type("S", (), {"get": staticmethod(fake_get)}),
+    )
+    response = ticker.get_response("https://query2.finance.yahoo.com/v8/test")
+
+    assert response.status_code == 200
+    assert sent == [("crumb1", "cookie1"), ("crumb2", "cookie2")]
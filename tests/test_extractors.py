@@ -0,0 +1,80 @@
+"""
+Offline tests for the extractors reading data from raw page bytes
+"""
+
+import pandas as pd
+
+from stockdex.extractors import (
+    find_js_assignment,
+    find_json_scripts,
+    find_script_by_id,
+)
+from stockdex.finviz_interface import FinvizInterface
+from stockdex.macrotrends_interface import MacrotrendsInterface
+
+
+def test_find_script_by_id() -> None:
+    page = (
+        b'<script id="route-init-data-old">{}</script>'
+        b'<script type="application/json" id="route-init-data">\n'
+        b'{"a": [1]}\n</script>'
+    )
+    assert find_script_by_id(page, "route-init-data") == b'{"a": [1]}'
+    assert (
+        find_script_by_id(b"<script id=route-init-data>1</script>", "route-init-data")
+        == b"1"
+    )
+    assert (
+        find_script_by_id(b'<div id="route-init-data"></div>', "route-init-data")
+        is None
+    )
+
+
+def test_finviz_route_init_data_with_dom_fallback(fake_downloads, monkeypatch) -> None:
+    page = b'<html><script id="route-init-data">{"dividends": [1]}</script></html>'
+
+    fake_downloads.content = page
+    finviz = FinvizInterface(ticker="AAPL")
+    assert finviz._finviz_earnings_reaction_raw_data() == {"dividends": [1]}
+
+    # Markup the byte-level lookup does not understand is parsed instead
+    monkeypatch.setattr(
+        "stockdex.finviz_interface.find_script_by_id", lambda content, id: None
+    )
+    assert finviz._finviz_revenue_raw_data() == {"dividends": [1]}
+
+
+def test_find_js_assignment() -> None:
+    page = b'<script>\nvar chartData = [];\n var originalData = [{"a": 1}];\n</script>'
+    assert find_js_assignment(page, "originalData") == b'[{"a": 1}]'
+    assert find_js_assignment(b"var originalData = 1;", "originalData") is None
+
+
+def test_macrotrends_statement_without_eval(fake_downloads) -> None:
+    rows = (
+        b'[{"field_name":"<a href=\'\\/stocks\\/charts\\/AAPL\\/apple\\/revenue\'>'
+        b'Revenue<\\/a>","popup_icon":"<div><\\/div>","2023-09-30":"383285.00000"},'
+        b'{"field_name":"<span>EPS<\\/span>","popup_icon":"","2023-09-30":null}]'
+    )
+    page = b"<html><script>\nvar originalData = " + rows + b";\n</script></html>"
+
+    fake_downloads.content = page
+    data = MacrotrendsInterface(ticker="AAPL").macrotrends_income_statement()
+
+    assert data.index.tolist() == ["Revenue", "EPS"]
+    assert data.columns.tolist() == ["2023-09-30"]
+    assert data.loc["Revenue", "2023-09-30"] == "383285.00000"
+    assert pd.isna(data.loc["EPS", "2023-09-30"])
+
+
+def test_find_json_scripts() -> None:
+    page = (
+        b'<script type="application/json" data-sveltekit-fetched '
+        b'data-url="https://query1.finance.yahoo.com/x?a=1&amp;b=2">{"body": "{}"}'
+        b'</script><script>var a = 1;</script><script type="application/json">[]'
+        b"</script>"
+    )
+    assert find_json_scripts(page) == [
+        ("https://query1.finance.yahoo.com/x?a=1&b=2", b'{"body": "{}"}'),
+        (None, b"[]"),
+    ]
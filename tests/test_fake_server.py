@@ -0,0 +1,122 @@
+"""
+Offline tests for overridable endpoints and the local stand-in server
+"""
+
+import time
+
+import pytest
+
+from stockdex.cache import CachedResponse
+from stockdex.circuit_breaker import CircuitBreakers
+from stockdex.config import BASE_URL, DIGRIN_BASE_URL, MACROTRENDS_BASE_URL
+from stockdex.fake_server import FakeServer
+from stockdex.lib import get_data_source
+from stockdex.rate_limiter import RateLimiter
+from stockdex.retry import RetryPolicy
+from stockdex.ticker import Ticker
+from stockdex.transport import Transport
+
+
+@pytest.fixture
+def cassettes(tmp_path):
+    transport = Transport(str(tmp_path), mode="record")
+    transport.record(
+        f"{DIGRIN_BASE_URL}/AAPL",
+        CachedResponse(
+            url=f"{DIGRIN_BASE_URL}/AAPL",
+            status_code=200,
+            content=b"<p>digrin</p>",
+            headers={"content-type": "text/html"},
+        ),
+    )
+    transport.record(
+        f"{BASE_URL}/chart/AAPL",
+        CachedResponse(
+            url=f"{BASE_URL}/chart/AAPL",
+            status_code=200,
+            content=b'{"chart": {}}',
+            headers={"content-type": "application/json"},
+        ),
+    )
+    # Macrotrends redirects the TBD placeholder to the company slug
+    transport.record(
+        f"{MACROTRENDS_BASE_URL}/AAPL/TBD/income-statement",
+        CachedResponse(
+            url=f"{MACROTRENDS_BASE_URL}/AAPL/apple/income-statement",
+            status_code=200,
+            content=b"<p>macrotrends</p>",
+        ),
+    )
+    return str(tmp_path)
+
+
+def test_ticker_endpoints() -> None:
+    ticker = Ticker(ticker="AAPL", endpoints={"digrin": "http://localhost:1/d"})
+    other = Ticker(ticker="MSFT")
+
+    assert ticker.digrin_base_url == "http://localhost:1/d"
+    assert other.digrin_base_url == DIGRIN_BASE_URL
+    assert ticker.macrotrends_base_url == MACROTRENDS_BASE_URL
+    assert ticker._data_source("http://localhost:1/d/AAPL") == "digrin"
+    # The override is not seen globally nor by other tickers
+    assert get_data_source("http://localhost:1/d/AAPL") is None
+    assert other._data_source("http://localhost:1/d/AAPL") is None
+
+    # Overriding again replaces the previous base URL
+    ticker.set_endpoints({"digrin": "http://localhost:2/d"})
+    assert ticker._data_source("http://localhost:2/d/AAPL") == "digrin"
+    assert ticker._data_source("http://localhost:1/d/AAPL") is None
+
+    with pytest.raises(ValueError):
+        Ticker(ticker="AAPL", endpoints={"unknown": "http://localhost:1"})
+
+
+def test_fake_server_serves_recordings(cassettes) -> None:
+    with FakeServer(cassettes) as server:
+        ticker = Ticker(ticker="AAPL", endpoints=server.endpoints)
+        ticker.rate_limiter = RateLimiter(limits={}, default=None)
+
+        response = ticker.get_response(f"{ticker.digrin_base_url}/AAPL")
+        assert response.content == b"<p>digrin</p>"
+        assert response.headers["content-type"] == "text/html"
+        assert ticker.get_company_slug("AAPL") == "apple"
+
+        with pytest.raises(RuntimeError):
+            ticker.get_response(f"{ticker.digrin_base_url}/MSFT")
+
+
+def test_fake_server_injects_errors(cassettes) -> None:
+    with FakeServer(cassettes, error_rate=1.0, error_status=429) as server:
+        ticker = Ticker(ticker="AAPL", endpoints=server.endpoints)
+        ticker.rate_limiter = RateLimiter(limits={}, default=None)
+        ticker.retry_policies = {"digrin": RetryPolicy(max_attempts=1)}
+
+        with pytest.raises(RuntimeError, match="status 429"):
+            ticker.get_response(f"{ticker.digrin_base_url}/AAPL")
+
+
+def test_fake_server_keeps_sources_apart(cassettes) -> None:
+    with FakeServer(cassettes) as server:
+        ticker = Ticker(ticker="AAPL", endpoints=server.endpoints)
+        # Fresh registries with the default limits and breakers
+        ticker.rate_limiter = RateLimiter()
+        ticker.circuit_breakers = CircuitBreakers()
+        digrin_url = f"{ticker.digrin_base_url}/AAPL"
+        yahoo_url = f"{server.endpoints['yahoo_api']}/chart/AAPL"
+
+        ticker.get_response(digrin_url)
+        start = time.monotonic()
+        # yahoo_api is not limited, even though digrin shares its host
+        assert ticker.get_response(yahoo_url).content == b'{"chart": {}}'
+        assert time.monotonic() - start < 1
+        # The shared registries take the source resolved by the ticker
+        limiter, breakers = ticker.rate_limiter, ticker.circuit_breakers
+        digrin, yahoo = ticker._data_source(digrin_url), ticker._data_source(yahoo_url)
+        assert limiter.get_bucket(yahoo_url, yahoo) is None
+        assert limiter.get_bucket(digrin_url, digrin).rate == 0.2
+
+        digrin_breaker = breakers.get_breaker(digrin_url, digrin)
+        yahoo_breaker = breakers.get_breaker(yahoo_url, yahoo)
+        assert digrin_breaker is not yahoo_breaker
+        assert digrin_breaker.open_interval == 300.0
+        assert yahoo_breaker.open_interval == 60.0
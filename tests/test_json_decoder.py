@@ -0,0 +1,80 @@
+"""
+Offline tests for the pluggable JSON decoder
+"""
+
+import json
+
+import pytest
+
+from stockdex import json_decoder
+from stockdex.cache import CachedResponse
+from stockdex.ticker import Ticker
+
+
+@pytest.fixture
+def counting_decoder():
+    calls = []
+
+    def loads(data):
+        calls.append(data)
+        return json.loads(data)
+
+    json_decoder.set_decoder(loads)
+    yield calls
+    json_decoder.set_decoder("auto")
+
+
+def test_get_decoder() -> None:
+    assert json_decoder.get_decoder("json") is json.loads
+    assert json_decoder.get_decoder("auto")(b'{"a": [1]}') == {"a": [1]}
+    with pytest.raises(ValueError):
+        json_decoder.get_decoder("yaml")
+
+
+def test_response_decoded_once(counting_decoder) -> None:
+    response = CachedResponse(url="u", status_code=200, content=b'{"a": 1}')
+
+    assert response.json() == {"a": 1}
+    assert json_decoder.decode_response(response) is response.json()
+    assert len(counting_decoder) == 1
+
+
+def test_price_decodes_chart_once(counting_decoder, monkeypatch) -> None:
+    period = {"start": 1700000000, "end": 1700000060}
+    payload = {
+        "chart": {
+            "result": [
+                {
+                    "meta": {
+                        "currency": "USD",
+                        "exchangeTimezoneName": "America/New_York",
+                        "timezone": "EST",
+                        "exchangeName": "NMS",
+                        "instrumentType": "EQUITY",
+                        "currentTradingPeriod": {
+                            "pre": period,
+                            "regular": period,
+                            "post": period,
+                        },
+                    },
+                    "timestamp": [1700000000],
+                    "indicators": {"quote": [{"close": [1.0]}]},
+                }
+            ]
+        }
+    }
+    response = CachedResponse(
+        url="u", status_code=200, content=json.dumps(payload).encode()
+    )
+    monkeypatch.setattr(Ticker, "get_response", lambda self, url: response)
+
+    ticker = Ticker("AAPL")
+    assert ticker.yahoo_api_price()["close"].tolist() == [1.0]
+    ticker.yahoo_api_current_trading_period
+    ticker.yahoo_api_current_trading_period
+
+    assert len(counting_decoder) == 1
+    # The shared decoded payload is left untouched
+    assert response.json()["chart"]["result"][0]["meta"]["currentTradingPeriod"][
+        "pre"
+    ] == {"start": 1700000000, "end": 1700000060}
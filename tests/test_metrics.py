@@ -0,0 +1,69 @@
+"""
+Offline tests for request hooks, statistics and the Prometheus exporter
+"""
+
+import pytest
+
+from stockdex.metrics import RequestEvent, RequestStats
+from stockdex.rate_limiter import RateLimiter
+from stockdex.retry import RetryPolicy
+from stockdex.ticker_base import TickerBase
+
+
+@pytest.fixture
+def ticker():
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    ticker.retry_policies = {None: RetryPolicy(base_delay=0.01, jitter=False)}
+    ticker.request_stats = RequestStats(buckets=(0.5, 5))
+    ticker.before_request_hooks = []
+    ticker.after_request_hooks = []
+    return ticker
+
+
+def test_hooks_and_stats(ticker, local_server) -> None:
+    before, after = [], []
+    ticker.before_request_hooks.append(before.append)
+    ticker.after_request_hooks.append(after.append)
+
+    ticker.get_response(f"{local_server}/flaky/2/page")
+    with pytest.raises(RuntimeError):
+        ticker.get_response(f"{local_server}/status/404")
+
+    assert before == after
+    assert [event.attempts for event in after] == [3, 1]
+    assert after[0].status_code == 200
+    assert after[0].bytes == len(b"/flaky/2/page")
+    assert after[0].retry_wait > 0
+    assert after[1].error is not None
+
+    host = local_server.split("//")[1]
+    stats = ticker.request_stats.snapshot()[host]
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+    assert stats["retries"] == 2
+    assert stats["statuses"] == {"200": 1, "404": 1}
+    assert stats["latency_buckets"][float("inf")] == 2
+
+
+def test_prometheus_export() -> None:
+    stats = RequestStats(buckets=(0.5, 5))
+    event = RequestEvent("https://www.digrin.com/stocks/detail/AAPL/")
+    event.attempts = 2
+    event.status_code = 200
+    event.bytes = 100
+    event.finish()
+    event.duration = 1.0
+    stats.record(event)
+    stats.record_cache_hit("https://www.digrin.com/stocks/detail/MSFT/")
+
+    text = stats.to_prometheus()
+    labels = 'host="www.digrin.com",source="digrin"'
+    assert f"stockdex_requests_total{{{labels}}} 1" in text
+    assert f"stockdex_retries_total{{{labels}}} 1" in text
+    assert f"stockdex_cache_hits_total{{{labels}}} 1" in text
+    assert f'stockdex_responses_total{{{labels},status="200"}} 1' in text
+    assert f'stockdex_request_duration_seconds_bucket{{{labels},le="0.5"}} 0' in text
+    assert f'stockdex_request_duration_seconds_bucket{{{labels},le="5.0"}} 1' in text
+    assert f'stockdex_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert "# TYPE stockdex_request_duration_seconds histogram" in text
@@ -0,0 +1,65 @@
+"""
+Module to test the per-host rate limiter
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from stockdex.config import DIGRIN_BASE_URL, FINVIZ_BASE_URL, YAHOO_WEB_BASE_URL
+from stockdex.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_threads():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # one token up front, the other five spaced 20ms apart
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_asyncio():
+    bucket = TokenBucket(rate=50, burst=2)
+
+    async def acquire_all():
+        return await asyncio.gather(*[bucket.acquire_async() for _ in range(4)])
+
+    waits = asyncio.run(acquire_all())
+
+    assert sorted(waits)[:2] == [0.0, 0.0]
+    assert max(waits) == pytest.approx(0.04, abs=0.01)
+
+
+def test_rate_limiter_is_per_host():
+    limiter = RateLimiter(limits={"digrin": (1, 1), "finviz": (1, 1)})
+
+    assert limiter.acquire(f"{DIGRIN_BASE_URL}/AAPL") == 0.0
+    # another host is not delayed by the digrin request
+    assert limiter.acquire(f"{FINVIZ_BASE_URL}AAPL") == 0.0
+    # the same host is
+    assert limiter.get_bucket(f"{DIGRIN_BASE_URL}/MSFT").reserve() > 0.5
+
+
+def test_rate_limiter_unlimited_source():
+    limiter = RateLimiter(limits={"yahoo_web": None})
+
+    assert limiter.get_bucket(f"{YAHOO_WEB_BASE_URL}/AAPL") is None
+    assert limiter.acquire(f"{YAHOO_WEB_BASE_URL}/AAPL") == 0.0
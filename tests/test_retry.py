@@ -0,0 +1,98 @@
+"""
+Module to test the retry policies
+"""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+from curl_cffi.requests.exceptions import DNSError, Timeout
+
+from stockdex.cache import CachedResponse
+from stockdex.rate_limiter import RateLimiter
+from stockdex.retry import RetryPolicy, get_retry_policy, parse_retry_after
+from stockdex.ticker import Ticker
+
+
+def _response(status_code, headers=None):
+    return CachedResponse(url="", status_code=status_code, content=b"", headers=headers)
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+
+    assert [policy.backoff(i) for i in range(5)] == [0.5, 1, 2, 3, 3]
+
+
+def test_backoff_jitter_stays_within_bounds():
+    policy = RetryPolicy(base_delay=1, max_delay=4, jitter=True)
+
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    "response, exception, expected",
+    [
+        (_response(503), None, 0.25),
+        (_response(429, {"Retry-After": "2"}), None, 2),
+        (_response(429, {"Retry-After": "60"}), None, 10),
+        (_response(404), None, None),
+        (None, Timeout("timed out"), 0.25),
+        (None, DNSError("no such host"), None),
+        (None, ValueError("bug"), None),
+    ],
+)
+def test_next_delay(response, exception, expected):
+    policy = RetryPolicy(base_delay=0.25, max_delay=10, jitter=False)
+
+    assert policy.next_delay(0, response=response, exception=exception) == expected
+
+
+def test_next_delay_gives_up_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3, jitter=False)
+
+    assert policy.next_delay(1, response=_response(503)) is not None
+    assert policy.next_delay(2, response=_response(503)) is None
+    assert policy.total_retries == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_30_seconds = formatdate(time.time() + 30, usegmt=True)
+    assert parse_retry_after(in_30_seconds) == pytest.approx(30, abs=2)
+
+
+def test_get_retry_policy_uses_config_overrides():
+    assert get_retry_policy("macrotrends").base_delay == 1.0
+    assert get_retry_policy("finviz").base_delay == 0.25
+    assert get_retry_policy("finviz") is get_retry_policy("finviz")
+
+
+@pytest.fixture
+def ticker():
+    ticker = Ticker(ticker="AAPL")
+    ticker.rate_limiter = RateLimiter(default=None)
+    ticker.retry_policies = {None: RetryPolicy(base_delay=0.01, jitter=False)}
+    return ticker
+
+
+def test_get_response_retries_transient_errors(ticker, local_server):
+    response = ticker.get_response(f"{local_server}/flaky/2/a")
+
+    assert response.status_code == 200
+    assert response.retry_count == 2
+
+
+def test_get_response_async_retries_transient_errors(ticker, local_server):
+    response = asyncio.run(ticker.get_response_async(f"{local_server}/flaky/1/b"))
+
+    assert response.status_code == 200
+    assert response.retry_count == 1
+
+
+def test_get_response_does_not_retry_client_errors(ticker, local_server):
+    with pytest.raises(RuntimeError, match="status 404"):
+        ticker.get_response(f"{local_server}/status/404")
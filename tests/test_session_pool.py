@@ -0,0 +1,61 @@
+"""
+Offline tests for the session pool
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stockdex.rate_limiter import RateLimiter
+from stockdex.session_pool import SessionPool
+from stockdex.ticker_base import TickerBase
+
+
+def test_sessions_are_reused() -> None:
+    pool = SessionPool(size=2)
+    with pool.session() as first:
+        pass
+    with pool.session() as second:
+        assert second is first
+    pool.close()
+
+
+def test_pool_is_bounded() -> None:
+    pool = SessionPool(size=2)
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+
+    taken = []
+    waiter = threading.Thread(target=lambda: taken.append(pool.acquire()))
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+
+    pool.release(first)
+    waiter.join(5)
+    assert taken == [first]
+
+    pool.release(first)
+    pool.release(second)
+    pool.close()
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        SessionPool(size=0)
+
+
+def test_threads_never_share_a_session(local_server) -> None:
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    ticker.session_pool = SessionPool(size=3)
+
+    with ThreadPoolExecutor(6) as pool:
+        responses = list(
+            pool.map(ticker.get_response, [f"{local_server}/{i}" for i in range(12)])
+        )
+
+    assert [response.text for response in responses] == [f"/{i}" for i in range(12)]
+    assert ticker.session_pool._created <= 3
+    ticker.session_pool.close()
@@ -0,0 +1,75 @@
+"""
+Offline tests for single-flight coalescing
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stockdex.rate_limiter import RateLimiter
+from stockdex.singleflight import SingleFlight
+from stockdex.ticker_base import TickerBase
+
+
+def test_concurrent_calls_share_one_run() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def slow():
+        runs.append(1)
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(group.do, "key", slow) for _ in range(8)]
+        # Give the other threads time to join the call in flight
+        time.sleep(0.2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["result"] * 8
+    assert len(runs) == 1
+    assert group.in_flight() == 0
+
+
+def test_exception_is_shared_and_not_kept() -> None:
+    group = SingleFlight()
+
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        group.do("key", failing)
+    assert group.do("key", lambda: "retried") == "retried"
+
+
+def test_async_calls_share_one_run() -> None:
+    group = SingleFlight()
+    runs = []
+
+    async def slow():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(group.do_async("key", slow) for _ in range(8)))
+
+    assert asyncio.run(main()) == ["result"] * 8
+    assert len(runs) == 1
+
+
+def test_get_response_coalesces_downloads(local_server) -> None:
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    url = f"{local_server}/status/200"
+
+    async def main():
+        return await asyncio.gather(*(ticker.get_response_async(url) for _ in range(5)))
+
+    responses = asyncio.run(main())
+    assert all(response is responses[0] for response in responses)
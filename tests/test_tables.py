@@ -0,0 +1,67 @@
+"""
+Offline tests for the DataFrame builder reading HTML tables
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from stockdex.tables import read_table, table_rows
+from stockdex.ticker import Ticker
+
+
+def _table(markup: str):
+    return BeautifulSoup(markup, "html.parser").find("table")
+
+
+def test_table_rows() -> None:
+    table = _table(
+        "<table><thead><tr><th colspan='2'>Title</th></tr></thead>"
+        "<thead><tr><th>Date</th><th>Value</th></tr></thead>"
+        "<tbody><tr><th>Q1</th><td> 1 </td></tr><tr><td>Q2</td><td>2</td></tr>"
+        "</tbody></table>"
+    )
+
+    # The header is the last header row before the body
+    assert table_rows(table) == (["Date", "Value"], [[" 1 "], ["Q2", "2"]])
+    assert table_rows(table, strip=True, row_headers=True) == (
+        ["Date", "Value"],
+        [["Q1", "1"], ["Q2", "2"]],
+    )
+
+
+def test_read_table() -> None:
+    table = _table(
+        "<table><tbody><tr><td>Market Cap</td><td>3T</td><td>2T</td></tr>"
+        "<tr><td>Beta</td><td>1.2</td><td>-</td></tr></tbody></table>"
+    )
+
+    data = read_table(table, columns=["Criteria", "Value"], index="Criteria")
+    assert data.index.tolist() == ["Market Cap", "Beta"]
+    assert data["Value"].tolist() == ["3T", "1.2"]
+
+    assert read_table(_table("<table></table>")).empty
+
+
+def test_read_table_without_header() -> None:
+    table = _table("<table><tr><td>1.97%</td><td>Insiders</td></tr></table>")
+
+    data = read_table(table)
+    assert data.columns.tolist() == [0, 1]
+    assert data.values.tolist() == [["1.97%", "Insiders"]]
+
+
+def test_yahoo_web_valuation_measures_from_table(fake_downloads) -> None:
+    page = (
+        b"<html><body><section><div><div><h3>Valuation Measures</h3></div>"
+        b"<table><thead><tr><th></th><th>Current</th><th>6/30/2024</th></tr>"
+        b"</thead><tbody><tr><td>Market Cap</td><td>3.5T</td><td>3.2T</td></tr>"
+        b"<tr><td>Trailing P/E</td><td>35.1</td><td>32.0</td></tr></tbody>"
+        b"</table></div></section></body></html>"
+    )
+
+    fake_downloads.content = page
+    valuation = Ticker("AAPL").yahoo_web_valuation_measures
+
+    assert valuation.columns.tolist() == ["Current", "2024-06-30"]
+    assert valuation.loc["Trailing P/E"].tolist() == [35.1, 32.0]
+    assert valuation.loc["Market Cap", "Current"] == pytest.approx(3.5e12)
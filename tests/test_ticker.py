@@ -1,6 +1,13 @@
+import asyncio
+import threading
+
 import pytest
+from bs4 import SoupStrainer
 
+from stockdex.cache import CachedResponse, ResponseCache
+from stockdex.rate_limiter import RateLimiter
 from stockdex.ticker import Ticker
+from stockdex.ticker_base import TickerBase
 
 
 @pytest.mark.parametrize(
@@ -20,3 +27,201 @@ def test_get_response(ticker, expected_response):
 
     # Check if the response is as expected
     assert response.status_code == expected_response
+
+
+def test_get_page_is_memoized(fake_downloads):
+    ticker = Ticker(ticker="AAPL")
+    url = "https://finance.yahoo.com/quote/AAPL/analysis"
+    soup = ticker.get_soup(url)
+
+    assert ticker.get_soup(url) is soup
+    assert ticker.get_page(url)[0].content == b"<p>page</p>"
+    assert fake_downloads == [url]
+
+    ticker.clear_page_memo()
+    ticker.get_soup(url)
+    assert fake_downloads == [url, url]
+
+
+def test_get_response_async_concurrent(local_server):
+    ticker = Ticker(ticker="AAPL")
+    ticker.rate_limiter = RateLimiter(default=None)
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *[ticker.get_response_async(f"{local_server}/page/{i}") for i in range(5)]
+        )
+
+    responses = asyncio.run(fetch_all())
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert responses[3].text == "/page/3"
+
+
+def test_async_sessions_closed_after_asyncio_run(local_server):
+    ticker = Ticker(ticker="AAPL")
+    ticker.rate_limiter = RateLimiter(default=None)
+
+    for i in range(3):
+        asyncio.run(ticker.get_response_async(f"{local_server}/run/{i}"))
+
+    assert len(TickerBase._async_sessions) == 0
+
+
+def test_prefetch_deduplicates_pages(fake_downloads):
+    def table(header: str, row: str) -> str:
+        return (
+            f"<table><thead><tr><th>{header}</th><th>Value</th></tr></thead>"
+            f"<tbody><tr><td>{row}</td><td>1</td></tr></tbody></table>"
+        )
+
+    def page(url: str) -> bytes:
+        if url.endswith("/analysis"):
+            sections = [
+                f'<section data-testid="{testid}">{table("Currency", "Avg")}</section>'
+                for testid in ("earningsEstimate", "revenueEstimate", "epsTrend")
+            ]
+            return "".join(sections).encode()
+        return table("Ex-dividend date", "2024-05-10").encode()
+
+    fake_downloads.content = page
+    ticker = Ticker(ticker="AAPL")
+    ticker.response_cache = ResponseCache(":memory:")
+    ticker.prefetch(
+        [
+            "yahoo_web_earnings_estimate",
+            "yahoo_web_revenue_estimate",
+            "yahoo_web_eps_trend",
+            "digrin_dividend",
+        ]
+    )
+
+    assert sorted(fake_downloads) == sorted(
+        [
+            f"{ticker.digrin_base_url}/AAPL",
+            f"{ticker.yahoo_web_base_url}/AAPL/analysis",
+        ]
+    )
+
+    # Reading the properties afterwards does not download again
+    assert ticker.yahoo_web_earnings_estimate.values.tolist() == [["Avg", "1"]]
+    assert ticker.yahoo_web_eps_trend.columns.tolist() == ["Currency", "Value"]
+    assert ticker.digrin_dividend.values.tolist() == [["2024-05-10", "1"]]
+    assert len(fake_downloads) == 2
+
+
+class _SlugTicker(Ticker):
+    @property
+    def statement(self) -> str:
+        slug = self.get_response(f"{self.digrin_base_url}/slug").url.split("/")[-1]
+        return self.get_response(f"{self.digrin_base_url}/{slug}/statement").text
+
+
+def test_prefetch_async_follows_dependent_pages(fake_downloads):
+    ticker = _SlugTicker(ticker="AAPL")
+    ticker.response_cache = ResponseCache(":memory:")
+    asyncio.run(ticker.prefetch_async(["statement"]))
+
+    # The slug page is needed before the statement URL is known
+    assert fake_downloads == [
+        f"{ticker.digrin_base_url}/slug",
+        f"{ticker.digrin_base_url}/slug/statement",
+    ]
+    assert ticker.statement == "<p>page</p>"
+    assert len(fake_downloads) == 2
+
+
+class _ThreadedTicker(Ticker):
+    @property
+    def statement(self) -> str:
+        # Another thread reads a page of this ticker while the property runs
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                self.get_response(f"{self.digrin_base_url}/other").text
+            )
+        )
+        thread.start()
+        thread.join()
+        self.other = results
+        return self.get_response(f"{self.digrin_base_url}/statement?b=2&a=1").text
+
+
+def test_prefetch_is_thread_local_and_normalized(fake_downloads):
+    ticker = _ThreadedTicker(ticker="AAPL")
+    ticker.prefetch(["statement"])
+
+    # Only the thread resolving the property had its download intercepted,
+    # the other one downloaded in each of the two rounds
+    assert ticker.other == ["<p>page</p>"]
+    assert fake_downloads == [
+        f"{ticker.digrin_base_url}/other",
+        f"{ticker.digrin_base_url}/statement?b=2&a=1",
+        f"{ticker.digrin_base_url}/other",
+    ]
+
+    # The prefetched page serves the same URL spelled differently
+    assert ticker.get_response(f"{ticker.digrin_base_url}/statement?a=1&b=2")
+    assert len(fake_downloads) == 3
+
+
+def test_prefetch_unknown_name():
+    with pytest.raises(AttributeError):
+        Ticker(ticker="AAPL").prefetch(["not_a_property"])
+
+
+def test_html_parser_is_selectable():
+    response = CachedResponse(url="u", status_code=200, content=b"<p>parser</p>")
+    default = Ticker(ticker="AAPL")
+    fast = Ticker(ticker="AAPL")
+    fast.html_parser = "lxml"
+
+    assert default._parse_page(response).builder.NAME == "html.parser"
+    # Parsed pages are shared per tree builder, not only per body
+    assert fast._parse_page(response).builder.NAME == "lxml"
+    assert fast._parse_page(response) is fast._parse_page(response)
+
+
+def test_parsed_pages_are_per_ticker_and_bounded(monkeypatch):
+    monkeypatch.setattr("stockdex.ticker_base.PARSED_PAGE_CACHE_BYTES", 30)
+    first = CachedResponse(url="u", status_code=200, content=b"<p>" + b"a" * 16)
+    second = CachedResponse(url="v", status_code=200, content=b"<p>" + b"b" * 16)
+    ticker = Ticker(ticker="AAPL")
+
+    soup = ticker._parse_page(first)
+    assert ticker._parse_page(first) is soup
+    # Other tickers get their own tree, which their getters may change
+    assert Ticker(ticker="AAPL")._parse_page(first) is not soup
+
+    # Both bodies exceed the bound, the older tree is dropped
+    ticker._parse_page(second)
+    assert ticker._parse_page(first) is not soup
+
+
+def test_get_soup_parses_only_the_requested_region(fake_downloads):
+    page = (
+        b"<html><body><div>" + b"<p>filler</p>" * 100 + b"</div>"
+        b'<section data-testid="earningsEstimate"><table>'
+        b"<thead><tr><th>Currency in USD</th><th>Current Qtr.</th></tr></thead>"
+        b"<tbody><tr><td>No. of Analysts</td><td>27</td></tr></tbody>"
+        b"</table></section></body></html>"
+    )
+    fake_downloads.content = page
+    ticker = Ticker(ticker="AAPL")
+
+    estimate = ticker.yahoo_web_earnings_estimate
+    assert estimate.values.tolist() == [["No. of Analysts", "27"]]
+
+    url = f"{ticker.yahoo_web_base_url}/AAPL/analysis"
+    ((_, soup),) = ticker._page_memo.values()
+    assert soup.find("p") is None
+    # The full page is parsed separately but not downloaded again
+    assert ticker.get_soup(url) is not soup
+    assert len(fake_downloads) == 1
+
+    # A fully parsed page serves every region without parsing again
+    ticker.clear_page_memo()
+    full = ticker.get_soup(url)
+    assert ticker.yahoo_web_earnings_estimate.equals(estimate)
+    assert ticker.get_page(url, SoupStrainer("section"))[1] is full
+    assert len(fake_downloads) == 2
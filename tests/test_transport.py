@@ -0,0 +1,92 @@
+"""
+Offline tests for the record/replay transport
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from stockdex.cache import CachedResponse, ResponseCache, normalize_url
+from stockdex.config import CACHE_TTL
+from stockdex.rate_limiter import RateLimiter
+from stockdex.selenium_interface import selenium_interface
+from stockdex.ticker_base import TickerBase
+from stockdex.transport import CassetteMissError, Transport
+
+
+@pytest.fixture
+def ticker():
+    ticker = TickerBase()
+    ticker.rate_limiter = RateLimiter(default=None)
+    return ticker
+
+
+def test_record_then_replay(ticker, local_server, tmp_path) -> None:
+    url = f"{local_server}/page?b=2&a=1"
+
+    ticker.transport = Transport(str(tmp_path), mode="record")
+    recorded = ticker.get_response(url)
+    assert recorded.status_code == 200
+
+    # Replay serves the recording, whatever the order of the query
+    ticker.transport = Transport(str(tmp_path), mode="replay", latency=0.05)
+    start = time.monotonic()
+    replayed = ticker.get_response(url)
+    assert time.monotonic() - start >= 0.05
+    assert replayed.content == recorded.content == b"/page?b=2&a=1"
+    assert replayed.headers["content-type"] == "text/plain; charset=utf-8"
+
+    replayed = asyncio.run(ticker.get_response_async(f"{local_server}/page?a=1&b=2"))
+    assert replayed.content == recorded.content
+
+
+def test_record_cached_and_revalidated(ticker, local_server, tmp_path, monkeypatch):
+    monkeypatch.setitem(CACHE_TTL, None, 60)
+    ticker.response_cache = ResponseCache(":memory:")
+    cached_url, etag_url = f"{local_server}/cached", f"{local_server}/etag/page"
+    ticker.get_response(cached_url)
+    ticker.get_response(etag_url)
+    with ticker.response_cache._connection:
+        ticker.response_cache._connection.execute(
+            "UPDATE responses SET created_at = 0 WHERE url = ?", (etag_url,)
+        )
+
+    # Pages served from the cache or revalidated with 304 are recorded too
+    ticker.transport = Transport(str(tmp_path), mode="record")
+    ticker.get_response(cached_url)
+    ticker.get_response(etag_url)
+    assert ticker.response_cache.get(normalize_url(etag_url)).is_fresh(60)
+    assert ticker.transport.load(cached_url).content == b"/cached"
+    assert ticker.transport.load(etag_url).content == b"/etag/page"
+
+
+def test_replay_miss(ticker, tmp_path) -> None:
+    ticker.transport = Transport(str(tmp_path), mode="replay")
+    with pytest.raises(CassetteMissError):
+        ticker.get_response("http://127.0.0.1:1/never-recorded")
+
+
+def test_network_mode(ticker, local_server, tmp_path) -> None:
+    ticker.transport = Transport(str(tmp_path), mode="network")
+    assert ticker.get_response(f"{local_server}/page").text == "/page"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_invalid_mode(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        Transport(str(tmp_path), mode="tape")
+
+
+def test_selenium_replay(tmp_path) -> None:
+    transport = Transport(str(tmp_path), mode="replay")
+    url = "https://www.justetf.com/en/etf-profile.html?isin=IE00B4L5Y983"
+    html = CachedResponse(url=url, status_code=200, content=b"<p>clicked</p>")
+    transport.record(url, html, variant="//button")
+
+    interface = selenium_interface(transport=transport)
+    soup = interface.just_etf_get_html_after_click(url, "//button")
+    assert soup.find("p").text == "clicked"
+
+    with pytest.raises(CassetteMissError):
+        interface.get_html_content(url)
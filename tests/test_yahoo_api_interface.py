@@ -1,8 +1,11 @@
+import asyncio
+import json
 from datetime import datetime, timedelta
 
 import pandas as pd
 import pytest
 
+from stockdex.cache import ResponseCache
 from stockdex.exceptions import FieldNotExists
 from stockdex.ticker import Ticker
 
@@ -518,3 +521,129 @@ def test_plot_yahoo_api_financials_wrong_field():
             period2=datetime.today(),
             fields_to_include=["wrong_field"],
         )
+
+
+def test_yahoo_api_price_async_matches_sync(fake_downloads):
+    """
+    Test that the async price getter builds the same dataframe as the sync one
+    """
+    payload = {
+        "chart": {
+            "result": [
+                {
+                    "meta": {
+                        "currency": "USD",
+                        "exchangeTimezoneName": "America/New_York",
+                        "timezone": "EST",
+                        "exchangeName": "NMS",
+                        "instrumentType": "EQUITY",
+                    },
+                    "timestamp": [1700000000, 1700000060],
+                    "indicators": {
+                        "quote": [
+                            {
+                                "volume": [10, 20],
+                                "close": [1.0, 2.0],
+                                "open": [1.0, 2.0],
+                                "high": [1.0, 2.0],
+                                "low": [1.0, 2.0],
+                            }
+                        ]
+                    },
+                }
+            ]
+        }
+    }
+    fake_downloads.content = json.dumps(payload).encode()
+
+    ticker = Ticker("AAPL")
+    expected = ticker.yahoo_api_price(range="1d", dataGranularity="1m")
+    result = asyncio.run(ticker.yahoo_api_price_async(range="1d", dataGranularity="1m"))
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["close"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [
+        "yahoo_api_income_statement",
+        "yahoo_api_cash_flow",
+        "yahoo_api_balance_sheet",
+        "yahoo_api_financials",
+    ],
+)
+def test_yahoo_api_statement_async_matches_sync(fake_downloads, getter):
+    """
+    Test that the async statement getters build the same dataframe as the sync ones
+    """
+    fake_downloads.content = json.dumps(
+        {
+            "timeseries": {
+                "result": [
+                    {
+                        "meta": {"type": ["annualTotalRevenue"]},
+                        "annualTotalRevenue": [
+                            {
+                                "asOfDate": "2023-09-30",
+                                "reportedValue": {"raw": 1.0, "fmt": "1"},
+                            }
+                        ],
+                    }
+                ]
+            }
+        }
+    ).encode()
+
+    ticker = Ticker("AAPL")
+    expected = getattr(ticker, getter)(format="raw")
+    result = asyncio.run(getattr(ticker, f"{getter}_async")(format="raw"))
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result.loc["2023-09-30", "annualTotalRevenue"] == 1.0
+
+
+def test_fundamentals_cache_key_is_stable(fake_downloads, monkeypatch):
+    fake_downloads.content = json.dumps(
+        {
+            "timeseries": {
+                "result": [
+                    {
+                        "meta": {"type": ["annualTotalRevenue"]},
+                        "annualTotalRevenue": [
+                            {
+                                "asOfDate": "2023-09-30",
+                                "reportedValue": {"raw": 1.0, "fmt": "1"},
+                            }
+                        ],
+                    }
+                ]
+            }
+        }
+    ).encode()
+    ticker = Ticker("AAPL")
+    ticker.response_cache = ResponseCache(":memory:")
+
+    # URLs built a second apart share one cache entry
+    now = datetime(2024, 6, 3, 15, 30, 0)
+    first = ticker.build_url("annual", now, now, "income_statement")
+    later = now + timedelta(seconds=1)
+    assert ticker.build_url("annual", later, later, "income_statement") == first
+
+    ticker.yahoo_api_income_statement(period1=now, period2=now)
+    ticker.yahoo_api_income_statement(period1=later, period2=later)
+    assert len(fake_downloads) == 1
+
+    class _Clock(datetime):
+        # Every call is a second later than the previous one
+        calls = 0
+
+        @classmethod
+        def now(cls, tz=None):
+            cls.calls += 1
+            return cls(2024, 6, 3, 15, 30, cls.calls % 60)
+
+    monkeypatch.setattr("stockdex.yahoo_web_interface.datetime", _Clock)
+    ticker.yahoo_web_income_stmt
+    ticker.yahoo_web_income_stmt
+    assert len(fake_downloads) == 2
@@ -2,8 +2,12 @@
 Module to test the YahooWeb class.
 """
 
+import asyncio
+import json
+
 import pandas as pd
 import pytest
+from bs4 import BeautifulSoup
 
 from stockdex.exceptions import WrongSecurityType
 from stockdex.ticker import Ticker
@@ -91,6 +95,23 @@ def test_yahoo_web_calls(ticker, security_type):
     assert yahoo_web_calls.shape[0] > 0
 
 
+@pytest.mark.parametrize(
+    "ticker, security_type",
+    [
+        ("AAPL", "stock"),
+        ("QQQ", "etf"),
+    ],
+)
+def test_yahoo_web_options_chain_live(ticker, security_type):
+    ticker = Ticker(ticker, security_type=security_type)
+    options = ticker.yahoo_web_options_chain()
+
+    # Check if the response is as expected
+    assert options.index.names == ["expiry", "type", "strike"]
+    assert options.index.get_level_values("expiry").nunique() > 1
+    assert options["lastPrice"].dtype == "float64"
+
+
 def test_yahoo_web_calls_wrong_security_type():
     with pytest.raises(WrongSecurityType):
         ticker = Ticker(ticker="AAPL", security_type="wrong_type")
@@ -264,6 +285,64 @@ def test_yahoo_web_top_mutual_fund_holders_wrong_security_type():
         ticker.yahoo_web_top_mutual_fund_holders
 
 
+@pytest.mark.parametrize(
+    "ticker",
+    [
+        ("AAPL"),
+        ("TSLA"),
+    ],
+)
+def test_yahoo_web_holders(ticker):
+    ticker = Ticker(ticker)
+    holders = ticker.yahoo_web_holders()
+
+    # Check if the response is as expected
+    assert set(holders) == {
+        "holders-major-holders-table",
+        "holders-top-institutional-holders",
+        "holders-top-mutual-fund-holders",
+    }
+    assert holders["holders-major-holders-table"]["value"].dtype == "float64"
+    assert holders["holders-top-institutional-holders"]["shares"].dtype == "float64"
+
+
+def test_yahoo_web_holders_from_tables(fake_downloads):
+    page = (
+        b'<html><body><section data-testid="holders-major-holders-table"><table>'
+        b"<tbody><tr><td>1.97%</td><td>% of Shares Held by All Insider</td></tr>"
+        b"<tr><td>6,949</td><td>Number of Institutions Holding Shares</td></tr>"
+        b"</tbody></table></section>"
+        b'<section data-testid="holders-top-mutual-fund-holders"><table><thead><tr>'
+        b"<th>Holder</th><th>Shares</th><th>Date Reported</th><th>% Out</th>"
+        b"<th>Value</th></tr></thead><tbody><tr><td>SPDR S&amp;P 500 ETF TRUST</td>"
+        b"<td>180.39M</td><td>Aug 31, 2025</td><td>1.22%</td>"
+        b"<td>46,543,192,706</td></tr></tbody></table></section></body></html>"
+    )
+    fake_downloads.content = page
+    holders = Ticker("AAPL").yahoo_web_holders()
+
+    assert list(holders) == [
+        "holders-major-holders-table",
+        "holders-top-mutual-fund-holders",
+    ]
+    assert holders["holders-major-holders-table"]["value"].tolist() == [
+        pytest.approx(0.0197),
+        6949.0,
+    ]
+    funds = holders["holders-top-mutual-fund-holders"]
+    assert funds.loc[0, "holder"] == "SPDR S&P 500 ETF TRUST"
+    assert funds.loc[0, "shares"] == pytest.approx(180.39e6)
+    assert funds.loc[0, "date_reported"] == pd.Timestamp("2025-08-31")
+    assert funds.loc[0, "percentage"] == pytest.approx(0.0122)
+    assert funds.loc[0, "value"] == 46543192706.0
+    assert len(fake_downloads) == 1
+
+
+def test_yahoo_web_holders_wrong_security_type():
+    with pytest.raises(WrongSecurityType):
+        Ticker(ticker="AAPL", security_type="etf").yahoo_web_holders()
+
+
 @pytest.mark.parametrize(
     "ticker",
     [
@@ -523,3 +602,513 @@ def test_yahoo_web_growth_estimates_wrong_security_type():
     with pytest.raises(WrongSecurityType):
         ticker = Ticker(ticker="AAPL", security_type="etf")
         ticker.yahoo_web_growth_estimates
+
+
+def _fetch_cache_page(*bodies: dict) -> bytes:
+    """
+    A page embedding API responses the way Yahoo's fetch cache does
+    """
+    scripts = [
+        b'<script type="application/json" data-sveltekit-fetched '
+        b'data-url="https://query1.finance.yahoo.com/api?a=1&amp;b=2">'
+        + json.dumps({"status": 200, "body": json.dumps(body)}).encode()
+        + b"</script>"
+        for body in bodies
+    ]
+    return b"<html><body>" + b"".join(scripts) + b"</body></html>"
+
+
+def test_yahoo_web_embedded_json(fake_downloads):
+    quote_summary = {
+        "quoteSummary": {
+            "result": [
+                {
+                    "price": {"regularMarketPrice": {"raw": 189.5, "fmt": "189.50"}},
+                    "summaryDetail": {
+                        "regularMarketPreviousClose": {"raw": 188.0},
+                        "beta": {},
+                    },
+                    "majorHoldersBreakdown": {
+                        "insidersPercentHeld": {"raw": 0.0007, "fmt": "0.07%"},
+                        "institutionsCount": {"raw": 6000, "fmt": "6k"},
+                    },
+                    "fundOwnership": {
+                        "ownershipList": [
+                            {
+                                "organization": "Fund",
+                                "position": {"raw": 100},
+                                "reportDate": {"raw": 1700000000},
+                                "pctHeld": {"raw": 0.03},
+                                "value": {"raw": 18950},
+                            }
+                        ]
+                    },
+                }
+            ]
+        }
+    }
+    timeseries = {
+        "timeseries": {
+            "result": [
+                {
+                    "meta": {"type": ["trailingMarketCap"]},
+                    "trailingMarketCap": [
+                        {"asOfDate": "2024-03-31", "reportedValue": {"raw": 2.0}},
+                        {"asOfDate": "2024-06-30", "reportedValue": {"raw": 3.0}},
+                    ],
+                },
+                {
+                    "meta": {"type": ["quarterlyMarketCap"]},
+                    "quarterlyMarketCap": [
+                        {"asOfDate": "2024-03-31", "reportedValue": {"raw": 2.0}},
+                        None,
+                    ],
+                },
+            ]
+        }
+    }
+    page = _fetch_cache_page(quote_summary, timeseries)
+    fake_downloads.content = page
+    ticker = Ticker("AAPL")
+
+    summary = ticker.yahoo_web_summary
+    assert summary.loc["regularMarketPrice", 0] == 189.5
+    assert summary.loc["regularMarketPreviousClose", 0] == 188.0
+    assert pd.isna(summary.loc["beta", 0])
+
+    major_holders = ticker.yahoo_web_major_holders
+    assert major_holders.values.tolist() == [
+        [0.0007, "% of Shares Held by All Insider"],
+        [6000, "Number of Institutions Holding Shares"],
+    ]
+
+    funds = ticker.yahoo_web_top_mutual_fund_holders
+    assert funds.loc[0, "shares"] == 100
+    assert funds.loc[0, "date_reported"] == pd.Timestamp(1700000000, unit="s")
+
+    valuation = ticker.yahoo_web_valuation_measures
+    assert valuation.columns.tolist() == ["Current", "2024-03-31"]
+    assert valuation.loc["Market Cap"].tolist() == [3.0, 2.0]
+
+    holders = ticker.yahoo_web_holders()
+    assert list(holders) == [
+        "holders-major-holders-table",
+        "holders-top-mutual-fund-holders",
+    ]
+    assert holders["holders-major-holders-table"]["value"].tolist() == [0.0007, 6000.0]
+    pd.testing.assert_frame_equal(
+        holders["holders-top-mutual-fund-holders"],
+        funds.astype(
+            {"shares": "float64", "percentage": "float64", "value": "float64"}
+        ),
+    )
+
+    # One download per page, the holders page is decoded once
+    assert len(fake_downloads) == 3
+
+
+def test_yahoo_web_embedded_json_and_tables_match(fake_downloads):
+    quote_summary = {
+        "quoteSummary": {
+            "result": [
+                {
+                    "price": {
+                        "regularMarketPrice": {"raw": 189.5},
+                        "regularMarketDayLow": {"raw": 186.6},
+                        "regularMarketDayHigh": {"raw": 189.23},
+                        "marketCap": {"raw": 3.76e12},
+                    },
+                    "summaryDetail": {
+                        "regularMarketPreviousClose": {"raw": 188.0},
+                        "exDividendDate": {"raw": 1762732800},
+                    },
+                    "majorHoldersBreakdown": {
+                        "insidersPercentHeld": {"raw": 0.0197},
+                        "institutionsCount": {"raw": 6949},
+                    },
+                    "institutionOwnership": {
+                        "ownershipList": [
+                            {
+                                "organization": "Vanguard",
+                                "position": {"raw": 480.28e6},
+                                "reportDate": {"raw": 1751241600},
+                                "pctHeld": {"raw": 0.0324},
+                                "value": {"raw": 123922796029},
+                            }
+                        ]
+                    },
+                    "fundOwnership": {
+                        "ownershipList": [
+                            {
+                                "organization": "SPDR S&P 500 ETF TRUST",
+                                "position": {"raw": 180.39e6},
+                                "reportDate": {"raw": 1756598400},
+                                "pctHeld": {"raw": 0.0122},
+                                "value": {"raw": 46543192706},
+                            }
+                        ]
+                    },
+                }
+            ]
+        }
+    }
+    timeseries = {
+        "timeseries": {
+            "result": [
+                {
+                    "meta": {"type": ["trailingPeRatio"]},
+                    "trailingPeRatio": [
+                        {"asOfDate": "2024-06-30", "reportedValue": {"raw": 30.0}}
+                    ],
+                },
+                {
+                    "meta": {"type": ["quarterlyPeRatio"]},
+                    "quarterlyPeRatio": [
+                        {"asOfDate": "2024-03-31", "reportedValue": {"raw": 28.0}}
+                    ],
+                },
+                {
+                    "meta": {"type": ["trailingMarketCap"]},
+                    "trailingMarketCap": [
+                        {"asOfDate": "2024-06-30", "reportedValue": {"raw": 3e12}}
+                    ],
+                },
+                {
+                    "meta": {"type": ["quarterlyMarketCap"]},
+                    "quarterlyMarketCap": [
+                        {"asOfDate": "2024-03-31", "reportedValue": {"raw": 2e12}}
+                    ],
+                },
+            ]
+        }
+    }
+
+    def holders_table(testid: str, rows: str, header: str = "") -> str:
+        return (
+            f'<section data-testid="{testid}"><table>{header}{rows}</table></section>'
+        )
+
+    holders_header = (
+        "<thead><tr><th>Holder</th><th>Shares</th><th>Date Reported</th>"
+        "<th>% Out</th><th>Value</th></tr></thead>"
+    )
+    summary_page = (
+        '<fin-streamer data-field="regularMarketPrice">189.50</fin-streamer>'
+        '<fin-streamer data-field="regularMarketDayRange">186.60 - 189.23'
+        '</fin-streamer><fin-streamer data-field="marketCap">3.76T</fin-streamer>'
+        '<fin-streamer data-field="regularMarketPreviousClose">188.00</fin-streamer>'
+        '<fin-streamer data-field="exDividendDate">Nov 10, 2025</fin-streamer>'
+    )
+    statistics_page = (
+        "<section><div><h3>Valuation Measures</h3></div><table><thead><tr>"
+        "<th></th><th>Current</th><th>3/31/2024</th></tr></thead><tbody>"
+        "<tr><td>Market Cap (intraday)</td><td>3T</td><td>2T</td></tr>"
+        "<tr><td>Trailing P/E</td><td>30.00</td><td>28.00</td></tr>"
+        "</tbody></table></section>"
+    )
+    holders_page = (
+        holders_table(
+            "holders-major-holders-table",
+            "<tr><td>1.97%</td><td>% of Shares Held by All Insider</td></tr>"
+            "<tr><td>6,949</td><td>Number of Institutions Holding Shares</td></tr>",
+        )
+        + holders_table(
+            "holders-top-institutional-holders",
+            "<tr><td>Vanguard</td><td>480.28M</td><td>Jun 30, 2025</td>"
+            "<td>3.24%</td><td>123,922,796,029</td></tr>",
+            holders_header,
+        )
+        + holders_table(
+            "holders-top-mutual-fund-holders",
+            "<tr><td>SPDR S&amp;P 500 ETF TRUST</td><td>180.39M</td>"
+            "<td>Aug 31, 2025</td><td>1.22%</td><td>46,543,192,706</td></tr>",
+            holders_header,
+        )
+    )
+
+    def page(url: str) -> bytes:
+        if url.endswith("/key-statistics"):
+            return f"<html><body>{statistics_page}</body></html>".encode()
+        if url.endswith("/holders"):
+            return f"<html><body>{holders_page}</body></html>".encode()
+        return f"<html><body>{summary_page}</body></html>".encode()
+
+    def frames() -> list:
+        ticker = Ticker("AAPL")
+        return [
+            ticker.yahoo_web_summary,
+            ticker.yahoo_web_valuation_measures,
+            ticker.yahoo_web_major_holders,
+            ticker.yahoo_web_top_institutional_holders,
+            ticker.yahoo_web_top_mutual_fund_holders,
+        ]
+
+    fake_downloads.content = _fetch_cache_page(quote_summary, timeseries)
+    from_json = frames()
+    fake_downloads.content = page
+    from_tables = frames()
+
+    for json_df, table_df in zip(from_json, from_tables):
+        assert json_df.index.tolist() == table_df.index.tolist()
+        assert json_df.columns.tolist() == table_df.columns.tolist()
+        pd.testing.assert_frame_equal(json_df, table_df)
+    assert from_json[1].index.tolist() == ["Market Cap", "Trailing P/E"]
+
+
+def test_yahoo_web_summary_keeps_page_rows(fake_downloads):
+    page = (
+        b'<html><body><fin-streamer data-field="regularMarketPrice">189.50'
+        b'</fin-streamer><fin-streamer data-field="regularMarketChangePercent">'
+        b'(+1.23%)</fin-streamer><fin-streamer data-field="marketState">REGULAR'
+        b'</fin-streamer><fin-streamer data-field="fiftyTwoWeekRange">164.08 - 260.10'
+        b'</fin-streamer><fin-streamer data-field="shortName">Apple Inc.</fin-streamer>'
+        b'<table><tr><td data-test="EPS_RATIO-value">6.59</td></tr>'
+        b'<tr><td data-test="EARNINGS_DATE-value">Jan 29, 2026 - Feb 2, 2026</td></tr>'
+        b'<tr><td data-test="EX_DIVIDEND_DATE-value">Nov 10, 2025</td></tr>'
+        b'<tr><td data-test="ONE_YEAR_TARGET_PRICE-value">255.45</td></tr>'
+        b'<tr><td data-test="DIVIDEND_AND_YIELD-value">1.04 (0.41%)</td></tr>'
+        b"</table></body></html>"
+    )
+    fake_downloads.content = page
+    summary = Ticker("AAPL").yahoo_web_summary
+
+    # Every row the page shows, as the baseline read them
+    soup = BeautifulSoup(page, "html.parser")
+    baseline_rows = {
+        item["data-test"].replace("-value", "")
+        for item in soup.find_all("td", {"data-test": True})
+    } | {item["data-field"] for item in soup.find_all("fin-streamer")}
+    assert baseline_rows <= set(summary.index)
+
+    values = summary[0]
+    assert values["regularMarketPrice"] == 189.5
+    assert values["regularMarketChangePercent"] == pytest.approx(0.0123)
+    assert values["marketState"] == "REGULAR"
+    assert values["fiftyTwoWeekRange"] == (164.08, 260.10)
+    assert values["shortName"] == "Apple Inc."
+    assert values["EPS_RATIO"] == 6.59
+    assert values["EARNINGS_DATE"] == pd.Timestamp("2026-01-29")
+    assert values["EX_DIVIDEND_DATE"] == pd.Timestamp("2025-11-10")
+    assert values["ONE_YEAR_TARGET_PRICE"] == 255.45
+    assert values["DIVIDEND_AND_YIELD"] == (1.04, pytest.approx(0.0041))
+    assert pd.isna(values["trailingPE"])
+
+
+def test_yahoo_web_summary_from_modules(fake_downloads):
+    quote_summary = {
+        "quoteSummary": {
+            "result": [
+                {
+                    "price": {
+                        "regularMarketPrice": {"raw": 189.5},
+                        "regularMarketTime": 1760644800,
+                        "marketState": "REGULAR",
+                    },
+                    "summaryDetail": {
+                        "fiftyTwoWeekLow": {"raw": 164.08},
+                        "fiftyTwoWeekHigh": {"raw": 260.1},
+                    },
+                    "defaultKeyStatistics": {"trailingEps": {"raw": 6.59}},
+                    "calendarEvents": {
+                        "earnings": {
+                            "earningsDate": [{"raw": 1769644800}, {"raw": 1770000000}]
+                        },
+                        "exDividendDate": {"raw": 1762732800},
+                    },
+                    "financialData": {"targetMeanPrice": {"raw": 255.45}},
+                }
+            ]
+        }
+    }
+    fake_downloads.content = _fetch_cache_page(quote_summary)
+    summary = Ticker("AAPL").yahoo_web_summary
+
+    # The rows of the page fields, including those the page shows as text
+    assert {
+        "regularMarketPrice",
+        "marketState",
+        "fiftyTwoWeekRange",
+        "trailingEps",
+        "earningsDate",
+        "exDividendDate",
+        "targetMeanPrice",
+    } <= set(summary.index)
+    values = summary[0]
+    assert values["regularMarketTime"] == pd.Timestamp(1760644800, unit="s")
+    assert values["marketState"] == "REGULAR"
+    assert values["fiftyTwoWeekRange"] == (164.08, 260.1)
+    assert values["trailingEps"] == 6.59
+    assert values["earningsDate"] == pd.Timestamp("2026-01-29")
+    assert values["exDividendDate"] == pd.Timestamp("2025-11-10")
+    assert values["targetMeanPrice"] == 255.45
+
+
+@pytest.mark.parametrize(
+    "ticker",
+    [
+        ("AAPL"),
+        ("MSFT"),
+    ],
+)
+def test_yahoo_web_analysis(ticker):
+    ticker = Ticker(ticker)
+    analysis = ticker.yahoo_web_analysis()
+
+    # Check if the response is as expected
+    assert set(analysis) == {
+        "earningsEstimate",
+        "revenueEstimate",
+        "earningsHistory",
+        "epsTrend",
+        "epsRevisions",
+        "growthEstimate",
+    }
+    assert all(table.shape[0] > 0 for table in analysis.values())
+
+
+def test_yahoo_web_analysis_single_pass(fake_downloads):
+    def section(testid: str, value: str) -> bytes:
+        return (
+            f'<section data-testid="{testid}"><table>'
+            "<thead><tr><th>Currency in USD</th><th>Current Qtr.</th></tr></thead>"
+            f"<tbody><tr><td>Avg. Estimate</td><td>{value}</td></tr></tbody>"
+            "</table></section>"
+        ).encode()
+
+    page = (
+        b"<html><body>"
+        + section("earningsEstimate", "1.5")
+        + section("epsTrend", "1.4")
+        + section("unrelated", "0")
+        + b"</body></html>"
+    )
+    fake_downloads.content = page
+    ticker = Ticker("AAPL")
+    analysis = ticker.yahoo_web_analysis()
+
+    assert list(analysis) == ["earningsEstimate", "epsTrend"]
+    assert analysis["epsTrend"].values.tolist() == [["Avg. Estimate", "1.4"]]
+    pd.testing.assert_frame_equal(
+        analysis["earningsEstimate"], ticker.yahoo_web_earnings_estimate
+    )
+    assert len(fake_downloads) == 1
+
+
+def test_yahoo_web_analysis_wrong_security_type():
+    with pytest.raises(WrongSecurityType):
+        Ticker(ticker="AAPL", security_type="etf").yahoo_web_analysis()
+
+
+def _option_contract(symbol: str, strike: float, expiration: int) -> dict:
+    return {
+        "contractSymbol": symbol,
+        "strike": {"raw": strike, "fmt": str(strike)},
+        "expiration": {"raw": expiration},
+        "lastPrice": {"raw": 1.5},
+        "volume": {"raw": 10},
+        "openInterest": {},
+        "impliedVolatility": {"raw": 0.25},
+        "lastTradeDate": {"raw": 1700000000},
+        "inTheMoney": True,
+    }
+
+
+def _options_page(url: str, expirations: tuple = (1705017600, 1705622400)) -> bytes:
+    expiration = int(url.split("=")[1]) if "date=" in url else expirations[0]
+    chain = {
+        "optionChain": {
+            "result": [
+                {
+                    "expirationDates": list(expirations),
+                    "options": [
+                        {
+                            "expirationDate": expiration,
+                            "calls": [_option_contract("C1", 150.0, expiration)],
+                            "puts": [
+                                _option_contract("P2", 155.0, expiration),
+                                _option_contract("P1", 150.0, expiration),
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+    return _fetch_cache_page(chain)
+
+
+def test_yahoo_web_options_chain(fake_downloads):
+    fake_downloads.content = _options_page
+    ticker = Ticker("AAPL")
+    options = ticker.yahoo_web_options_chain()
+
+    assert len(fake_downloads) == 2
+    assert options.index.names == ["expiry", "type", "strike"]
+    assert options.shape[0] == 6
+    assert (
+        options.loc[(pd.Timestamp("2024-01-19"), "put", 155.0), "contractSymbol"]
+        == "P2"
+    )
+    assert (
+        options.dtypes[["lastPrice", "volume", "impliedVolatility"]] == "float64"
+    ).all()
+    assert options["openInterest"].isna().all()
+
+    result = asyncio.run(Ticker("AAPL").yahoo_web_options_chain_async())
+    pd.testing.assert_frame_equal(result, options)
+
+
+def test_yahoo_web_options_chain_prefetch(fake_downloads):
+    expirations = (1705017600, 1705622400, 1706227200)
+    fake_downloads.content = lambda url: _options_page(url, expirations)
+    ticker = Ticker("AAPL")
+    url = f"{ticker.yahoo_web_base_url}/AAPL/options"
+    ticker.get_raw_page(url)
+
+    # Resolving reports every other expiration at once, without downloading
+    assert ticker._resolve_url("yahoo_web_options_chain") == [
+        f"{url}?date={expiration}" for expiration in expirations[1:]
+    ]
+    assert fake_downloads == [url]
+
+    ticker = Ticker("AAPL")
+    ticker.prefetch(["yahoo_web_options_chain"])
+    assert len(fake_downloads) == 4
+    assert ticker.yahoo_web_options_chain().shape[0] == 9
+    assert len(fake_downloads) == 4
+
+
+def test_yahoo_web_options_chain_from_tables(fake_downloads):
+    headers = "".join(
+        f"<th>{header}</th>"
+        for header in [
+            "Contract Name",
+            "Last Trade Date (EDT)",
+            "Strike",
+            "Last Price",
+            "Bid",
+            "Ask",
+            "Change",
+            "% Change",
+            "Volume",
+            "Open Interest",
+            "Implied Volatility",
+        ]
+    )
+
+    def table(symbol: str) -> str:
+        cells = [symbol, "1/5/2024", "150.00", "1.50", "1.40", "1.60", "+0.10"]
+        cells += ["+7.14%", "1,234", "-", "25.00%"]
+        row = "".join(f"<td>{cell}</td>" for cell in cells)
+        return f"<table><tr>{headers}</tr><tr>{row}</tr></table>"
+
+    page = f"<html>{table('AAPL240112C00150000')}{table('AAPL240112P00150000')}</html>"
+
+    fake_downloads.content = page.encode()
+    options = Ticker("AAPL").yahoo_web_options_chain()
+
+    call = options.loc[(pd.Timestamp("2024-01-12"), "call", 150.0)]
+    assert call["volume"] == 1234.0
+    assert call["impliedVolatility"] == 0.25
+    assert pd.isna(call["openInterest"])
+    assert options.xs("put", level="type").shape[0] == 1